@@ -2,9 +2,17 @@
 
 from .api_connection_graphql import ApiConnectionGraphql
 from .api_websocket import ApiWebsocket
-from .api_websocket_data_updater import WebsocketDataUpdater
-from .config import Config, ConfigZone, ConfigZoneActivity
-from .const import ActivityTypes, FanModes, SystemModes, TemperatureUnits
+from .api_websocket_data_updater import ChangeSubscription, FieldChange, WebsocketDataUpdater
+from .config import Config, ConfigZone, ConfigZoneActivity, ScheduleInterval, ZoneSchedule
+from .const import (
+    ActivityTypes,
+    ConnectionStates,
+    FanModes,
+    OverflowPolicies,
+    QueryProfiles,
+    SystemModes,
+    TemperatureUnits,
+)
 from .energy import (
     ENERGY_USAGE_METRIC_LABELS,
     Energy,
@@ -23,9 +31,11 @@ from .errors import (
     CarrierApiTokenRefreshError,
     CarrierApiWebsocketError,
 )
+from .mutation_queue import MutationQueue
 from .profile import Profile
 from .status import Status, StatusUnit, StatusZone
-from .system import System
+from .system import System, expand_schedules
+from .websocket_dispatcher import CallbackDispatcher
 
 __all__ = [
     "ENERGY_USAGE_METRIC_LABELS",
@@ -34,15 +44,18 @@ __all__ = [
     "ApiWebsocket",
     "AuthError",
     "BaseError",
+    "CallbackDispatcher",
     "CarrierApiAuthError",
     "CarrierApiConnectionError",
     "CarrierApiError",
     "CarrierApiGraphqlError",
     "CarrierApiTokenRefreshError",
     "CarrierApiWebsocketError",
+    "ChangeSubscription",
     "Config",
     "ConfigZone",
     "ConfigZoneActivity",
+    "ConnectionStates",
     "Energy",
     "EnergyMeasurement",
     "EnergyPeriod",
@@ -50,7 +63,12 @@ __all__ = [
     "EntryLevelSystem",
     "EntryLevelZone",
     "FanModes",
+    "FieldChange",
+    "MutationQueue",
+    "OverflowPolicies",
     "Profile",
+    "QueryProfiles",
+    "ScheduleInterval",
     "Status",
     "StatusUnit",
     "StatusZone",
@@ -58,4 +76,6 @@ __all__ = [
     "SystemModes",
     "TemperatureUnits",
     "WebsocketDataUpdater",
+    "ZoneSchedule",
+    "expand_schedules",
 ]
@@ -1,13 +1,29 @@
 """GraphQL client for Carrier authentication, queries, and config updates."""
 
+from asyncio import (
+    Lock,
+    Semaphore,
+    Task,
+    TimerHandle,
+    create_task,
+    gather,
+    get_running_loop,
+    shield,
+)
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import partial
+from json import dumps
 from logging import getLogger
 from typing import Any, Literal
 
 from aiohttp import ClientError, ClientResponseError, ClientSession
-from gql import Client, GraphQLRequest, gql
+from gql import Client, GraphQLRequest
 from gql.transport.aiohttp import AIOHTTPTransport
 from gql.transport.exceptions import (
+    TransportClosed,
     TransportError as GraphqlTransportError,
     TransportQueryError,
     TransportServerError,
@@ -16,24 +32,84 @@ from graphql import GraphQLError
 
 from .api_websocket import ApiWebsocket
 from .config import Config
-from .const import ActivityTypes, FanModes, HeatSourceTypes, SystemModes
+from .const import ActivityTypes, FanModes, HeatSourceTypes, QueryProfiles, SystemModes
 from .energy import Energy
 from .entry_level import EntryLevelSystem
 from .errors import (
     CarrierApiAuthError,
     CarrierApiConnectionError,
+    CarrierApiError,
     CarrierApiGraphqlError,
     CarrierApiTokenRefreshError,
 )
+from .graphql_documents import (
+    energy_batch_alias,
+    energy_batch_operation_name,
+    graphql_document,
+    infinity_operation_name,
+    zone_mutation_batch_alias,
+    zone_mutation_batch_operation_name,
+)
+from .mutation_queue import MutationQueue
 from .profile import Profile
 from .status import Status
 from .system import System
 
 _LOGGER = getLogger(__name__)
 GRAPHQL_EXECUTE_TIMEOUT_SECONDS = 60
+GRAPHQL_URL = "https://dataservice.infinity.iot.carrier.com/graphql"
+ENERGY_FETCH_CONCURRENCY = 4
+ENERGY_BATCH_SIZE = 10
+TOKEN_REFRESH_SKEW_SECONDS = 300
+TOKEN_REFRESH_RETRY_SECONDS = 30
 
 _CONNECTION_ERRORS = (GraphqlTransportError, ClientError, TimeoutError, OSError)
 _AUTH_HTTP_STATUSES = {401, 403}
+# InfinityConfigInput fields that InfinityConfigsInput also accepts. Settings with any other
+# field, such as heatsource or zones, can only be sent one serial at a time.
+_BATCH_CONFIG_FIELDS = frozenset(
+    {
+        "mode",
+        "previousMode",
+        "infinitySystemModeId",
+        "sound",
+        "erate",
+        "grate",
+        "fueltype",
+        "gasunit",
+        "wholeHouse",
+        "humidityVacation",
+        "humidityAway",
+        "humidityHome",
+        "vacat",
+        "vacstart",
+        "vacend",
+        "vacmint",
+        "vacmaxt",
+        "vacfan",
+        "vacationFanSettingId",
+    }
+)
+
+
+@dataclass
+class _PooledSession:
+    """A connected GraphQL client, the token it sends, and the operations using it."""
+
+    client: Client
+    session: Any
+    authorization: str
+    in_flight: int = 0
+    retired: bool = False
+    closed: bool = False
+
+
+@dataclass
+class _Flight:
+    """A read in progress and the number of callers waiting for it."""
+
+    task: Task[dict[str, Any]]
+    waiters: int = 1
 
 
 def _is_auth_transport_error(error: BaseException) -> bool:
@@ -68,6 +144,28 @@ async def _response_json_object(response: Any) -> dict[str, Any]:
     return data
 
 
+def _serial_payload(response: dict[str, Any], field: str, system_serial: str) -> dict[str, Any]:
+    """Return a per-serial payload or raise when Carrier returns no data.
+
+    Args:
+        response: Decoded GraphQL response data.
+        field: Root field holding the per-serial payload.
+        system_serial: Serial number that was queried.
+
+    Returns:
+        The payload object under ``field``.
+
+    Raises:
+        CarrierApiGraphqlError: If Carrier returns no object for the serial.
+    """
+    payload = response.get(field)
+    if not isinstance(payload, dict):
+        raise CarrierApiGraphqlError(
+            f"Carrier returned no {field} data for {system_serial}", payload=response
+        )
+    return payload
+
+
 class ApiConnectionGraphql:
     """Async Carrier GraphQL API connection with token and websocket support."""
 
@@ -76,12 +174,36 @@ class ApiConnectionGraphql:
     token_type: str | None = None
     access_token: str | None = None
     api_websocket: ApiWebsocket | None = None
+    energy_concurrency: int = ENERGY_FETCH_CONCURRENCY
+    energy_batch_size: int | None = None
+    token_refresh_skew_seconds: float = TOKEN_REFRESH_SKEW_SECONDS
+    token_refresh_retry_seconds: float = TOKEN_REFRESH_RETRY_SECONDS
+    reconcile_debounce_seconds: float | None = None
+    mutation_coalesce_seconds: float | None = None
+    mutation_queue: MutationQueue | None = None
+    deduplicate_reads: bool = True
+    lazy_models: bool = False
+    _flights: dict[Hashable, _Flight] | None = None
+    _auth_task: Task[None] | None = None
+    _auth_failed_at: datetime | None = None
+    _reconcile_timer: TimerHandle | None = None
+    _reconcile_task: Task[None] | None = None
+    _graphql_pool: _PooledSession | None = None
+    _graphql_session_lock: Lock | None = None
 
     def __init__(
         self,
         username: str,
         password: str,
         client_session: ClientSession | None = None,
+        energy_concurrency: int = ENERGY_FETCH_CONCURRENCY,
+        token_refresh_skew_seconds: float = TOKEN_REFRESH_SKEW_SECONDS,
+        token_refresh_retry_seconds: float = TOKEN_REFRESH_RETRY_SECONDS,
+        reconcile_debounce_seconds: float | None = None,
+        energy_batch_size: int | None = None,
+        mutation_coalesce_seconds: float | None = None,
+        deduplicate_reads: bool = True,
+        lazy_models: bool = False,
     ) -> None:
         """Create a Carrier GraphQL API connection.
 
@@ -90,18 +212,57 @@ class ApiConnectionGraphql:
             password: Carrier account password.
             client_session: Optional aiohttp session to reuse for token refresh
                 and websocket operations. A new session is created when omitted.
+            energy_concurrency: Maximum number of per-system energy queries
+                ``load_data`` keeps in flight at once.
+            token_refresh_skew_seconds: How long before ``expires_at`` the
+                access token is refreshed in the background.
+            token_refresh_retry_seconds: How long to wait after a failed
+                background refresh before starting another one, while the
+                access token is still valid.
+            reconcile_debounce_seconds: Quiet period after the last mutation
+                before the websocket reconcile is sent, so a burst of mutations
+                triggers one reconcile. ``None`` reconciles after every mutation.
+            energy_batch_size: Number of serials ``load_data`` requests per
+                aliased energy query. ``None`` queries each serial separately.
+            mutation_coalesce_seconds: Window in which zone activity and zone
+                config mutations for the same zone are merged and sent in one
+                request. ``None`` sends every mutation on its own.
+            deduplicate_reads: Whether concurrent identical read queries,
+                including those of ``load_data``, share one request.
+            lazy_models: Whether status and config models decode their fields
+                from the raw payload on first access instead of when built.
         """
         self.username = username
         self.password = password
+        self.energy_concurrency = energy_concurrency
+        self.token_refresh_skew_seconds = token_refresh_skew_seconds
+        self.token_refresh_retry_seconds = token_refresh_retry_seconds
+        self.reconcile_debounce_seconds = reconcile_debounce_seconds
+        self.energy_batch_size = energy_batch_size
+        self.mutation_coalesce_seconds = mutation_coalesce_seconds
+        self.deduplicate_reads = deduplicate_reads
+        self.lazy_models = lazy_models
         if client_session is None:
             self.api_session = ClientSession(raise_for_status=False)
         else:
             self.api_session = client_session
 
     async def cleanup(self) -> None:
-        """Close the underlying aiohttp session owned by the connection."""
+        """Close the pooled GraphQL transport and the underlying aiohttp session.
+
+        Mutations still waiting in the coalescing window are sent first.
+        """
+        await self.flush_mutations()
+        if self._auth_task is not None:
+            self._auth_task.cancel()
+        if self._reconcile_timer is not None:
+            self._reconcile_timer.cancel()
+            self._reconcile_timer = None
         try:
-            await self.api_session.close()
+            try:
+                await self._close_authed_session()
+            finally:
+                await self.api_session.close()
         except (ClientError, TimeoutError, OSError) as error:
             raise CarrierApiConnectionError("Carrier API session cleanup failed") from error
 
@@ -120,24 +281,7 @@ class ApiConnectionGraphql:
                 transport=transport,
                 fetch_schema_from_transport=False,
             ) as session:
-                query = gql(
-                    """
-                    mutation assistedLogin($input: AssistedLoginInput!) {
-                        assistedLogin(input: $input) {
-                            success
-                            status
-                            errorMessage
-                            data {
-                                token_type
-                                expires_in
-                                access_token
-                                scope
-                                refresh_token
-                            }
-                        }
-                    }
-                """
-                )
+                query = graphql_document("assistedLogin")
 
                 result = await session.execute(
                     query,
@@ -171,10 +315,107 @@ class ApiConnectionGraphql:
             raise CarrierApiGraphqlError("Carrier authentication GraphQL request failed") from error
 
     async def check_auth_expiration(self) -> None:
-        """Ensure the connection has a valid access token before API use."""
+        """Ensure the connection has a valid access token before API use.
+
+        Concurrent callers share one in-flight login or token refresh. Within
+        ``token_refresh_skew_seconds`` of expiry the still-valid token is used
+        while a refresh runs in the background; callers only wait when there is
+        no token yet or it has already expired. After a background refresh
+        fails, the next one waits ``token_refresh_retry_seconds``.
+        """
+        now = datetime.now(UTC)
+        if self.refresh_token is not None and self.expires_at >= now:
+            if self._auth_refresh_due(now) and not self._auth_retry_pending(now):
+                self._start_auth_renewal()
+            return
+        await shield(self._start_auth_renewal())
+
+    async def renew_auth(self, margin_seconds: float) -> None:
+        """Log in or refresh the token when it expires within a margin.
+
+        The work runs through the same shared renewal as
+        ``check_auth_expiration``, so it never overlaps another refresh.
+
+        Args:
+            margin_seconds: Refresh when the access token expires within this
+                many seconds.
+        """
+        await shield(self._start_auth_renewal(margin_seconds))
+
+    def _auth_refresh_due(self, now: datetime, margin_seconds: float | None = None) -> bool:
+        """Return whether the access token is inside a refresh window.
+
+        Args:
+            now: Current UTC time.
+            margin_seconds: Refresh window before expiry. Defaults to
+                ``token_refresh_skew_seconds``.
+
+        Returns:
+            ``True`` when the token expires within the refresh window.
+        """
+        if margin_seconds is None:
+            margin_seconds = self.token_refresh_skew_seconds
+        return self.expires_at - timedelta(seconds=margin_seconds) <= now
+
+    def _auth_retry_pending(self, now: datetime) -> bool:
+        """Return whether a failed auth renewal is still inside its retry delay.
+
+        Args:
+            now: Current UTC time.
+
+        Returns:
+            ``True`` when the last renewal failed less than
+            ``token_refresh_retry_seconds`` ago.
+        """
+        return self._auth_failed_at is not None and now - self._auth_failed_at < timedelta(
+            seconds=self.token_refresh_retry_seconds
+        )
+
+    def _start_auth_renewal(self, margin_seconds: float | None = None) -> Task[None]:
+        """Return the in-flight auth renewal, starting one when none is running.
+
+        Args:
+            margin_seconds: Refresh window used by a newly started renewal.
+
+        Returns:
+            The shared login or token refresh task.
+        """
+        if self._auth_task is None or self._auth_task.done():
+            self._auth_task = create_task(self._renew_auth(margin_seconds))
+            self._auth_task.add_done_callback(self._auth_renewal_done)
+        return self._auth_task
+
+    def _auth_renewal_done(self, task: Task[None]) -> None:
+        """Record the outcome of an auth renewal and log a failure.
+
+        Retrieving the error here also keeps background failures from being
+        reported as never retrieved.
+
+        Args:
+            task: Completed auth renewal task.
+        """
+        if task.cancelled():
+            return
+        if (error := task.exception()) is None:
+            self._auth_failed_at = None
+            return
+        self._auth_failed_at = datetime.now(UTC)
+        _LOGGER.warning(
+            "Carrier auth renewal failed, token expires at %s",
+            self.expires_at.isoformat(),
+            exc_info=error,
+        )
+
+    async def _renew_auth(self, margin_seconds: float | None = None) -> None:
+        """Log in when no refresh token exists, then refresh a due access token.
+
+        Args:
+            margin_seconds: Refresh window before expiry. Defaults to
+                ``token_refresh_skew_seconds``.
+        """
         if self.refresh_token is None:
             await self.login()
-        if self.expires_at < datetime.now(UTC):
+        if self._auth_refresh_due(datetime.now(UTC), margin_seconds):
             await self.refresh_auth_token()
 
     async def refresh_auth_token(self) -> None:
@@ -215,11 +456,116 @@ class ApiConnectionGraphql:
         except (KeyError, TypeError) as error:
             raise CarrierApiTokenRefreshError("Carrier token refresh failed") from error
 
+    def _authed_transport_session_args(self) -> dict[str, Any] | None:
+        """Return aiohttp session arguments that share ``api_session``'s pool.
+
+        Returns:
+            Keyword arguments binding the GraphQL transport to the connection
+            pool of ``api_session`` without taking ownership of it, or ``None``
+            when the session does not expose a connector.
+        """
+        connector = getattr(self.api_session, "connector", None)
+        if connector is None:
+            return None
+        return {"connector": connector, "connector_owner": False}
+
+    async def _authed_session(self) -> _PooledSession:
+        """Return the pooled authenticated GraphQL session.
+
+        The session is created on first use and kept open across queries and
+        mutations. It is replaced only when the access token changes, so each
+        operation reuses pooled keep-alive connections instead of opening a new
+        connection and TLS handshake. A replaced session stays open until the
+        operations still running on it finish.
+
+        Returns:
+            The pooled session using the current access token.
+        """
+        authorization = f"{self.token_type} {self.access_token}"
+        pooled = self._graphql_pool
+        if pooled is not None and pooled.authorization == authorization:
+            return pooled
+        if self._graphql_session_lock is None:
+            self._graphql_session_lock = Lock()
+        async with self._graphql_session_lock:
+            pooled = self._graphql_pool
+            if pooled is not None and pooled.authorization == authorization:
+                return pooled
+            await self._close_authed_session()
+            transport = AIOHTTPTransport(
+                url=GRAPHQL_URL,
+                headers={"Authorization": authorization},
+                ssl=True,
+                client_session_args=self._authed_transport_session_args(),
+            )
+            client = Client(
+                transport=transport,
+                fetch_schema_from_transport=False,
+                execute_timeout=GRAPHQL_EXECUTE_TIMEOUT_SECONDS,
+            )
+            pooled = _PooledSession(client, await client.connect_async(), authorization)
+            self._graphql_pool = pooled
+            return pooled
+
+    async def _close_authed_session(self) -> None:
+        """Retire the pooled GraphQL session, closing it once no operation uses it."""
+        pooled = self._graphql_pool
+        if pooled is not None:
+            await self._retire_pooled_session(pooled)
+
+    async def _retire_pooled_session(self, pooled: _PooledSession) -> None:
+        """Stop handing out a pooled session and close it when it is idle.
+
+        Args:
+            pooled: Session to retire.
+        """
+        if self._graphql_pool is pooled:
+            self._graphql_pool = None
+        pooled.retired = True
+        if not pooled.in_flight and not pooled.closed:
+            pooled.closed = True
+            await pooled.client.close_async()
+
+    async def _execute_pooled(
+        self, operation_name: str, query: GraphQLRequest, variable_values: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Execute an operation on the pooled session, keeping it open meanwhile.
+
+        Args:
+            operation_name: GraphQL operation name to execute.
+            query: Parsed GraphQL request.
+            variable_values: Variables to send with the operation.
+
+        Returns:
+            The decoded GraphQL response data.
+        """
+        pooled = await self._authed_session()
+        pooled.in_flight += 1
+        try:
+            return await pooled.session.execute(
+                query, variable_values=variable_values, operation_name=operation_name
+            )
+        except TransportClosed:
+            pooled.retired = True
+            if self._graphql_pool is pooled:
+                self._graphql_pool = None
+            raise
+        finally:
+            pooled.in_flight -= 1
+            if pooled.retired and not pooled.in_flight and not pooled.closed:
+                try:
+                    await self._retire_pooled_session(pooled)
+                except _CONNECTION_ERRORS as error:
+                    _LOGGER.debug("Closing a replaced GraphQL session failed", exc_info=error)
+
     async def authed_query(
         self, operation_name: str, query: GraphQLRequest, variable_values: dict[str, Any]
     ) -> dict[str, Any]:
         """Execute an authenticated Carrier GraphQL operation.
 
+        Operations share one pooled transport; see ``_authed_session``. An
+        operation that finds the transport closed is retried once on a new one.
+
         Args:
             operation_name: GraphQL operation name to execute.
             query: Parsed GraphQL request.
@@ -229,20 +575,12 @@ class ApiConnectionGraphql:
             The decoded GraphQL response data.
         """
         await self.check_auth_expiration()
-        transport = AIOHTTPTransport(
-            url="https://dataservice.infinity.iot.carrier.com/graphql",
-            headers={"Authorization": f"{self.token_type} {self.access_token}"},
-            ssl=True,
-        )
         try:
-            async with Client(
-                transport=transport,
-                fetch_schema_from_transport=False,
-                execute_timeout=GRAPHQL_EXECUTE_TIMEOUT_SECONDS,
-            ) as session:
-                return await session.execute(
-                    query, variable_values=variable_values, operation_name=operation_name
-                )
+            try:
+                return await self._execute_pooled(operation_name, query, variable_values)
+            except TransportClosed:
+                _LOGGER.debug("GraphQL transport closed, retrying %s", operation_name)
+                return await self._execute_pooled(operation_name, query, variable_values)
         except TransportQueryError as error:
             raise CarrierApiGraphqlError(
                 f"Carrier GraphQL operation failed: {operation_name}"
@@ -260,6 +598,83 @@ class ApiConnectionGraphql:
                 f"Carrier GraphQL operation failed: {operation_name}"
             ) from error
 
+    async def _shared_query(
+        self, operation_name: str, query: GraphQLRequest, variable_values: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Execute a read query, sharing it with concurrent identical reads.
+
+        Args:
+            operation_name: GraphQL operation name to execute.
+            query: Parsed GraphQL request.
+            variable_values: Variables to send with the operation.
+
+        Returns:
+            The decoded GraphQL response data.
+        """
+        return await self._single_flight(
+            (operation_name, dumps(variable_values, sort_keys=True)),
+            partial(
+                self.authed_query,
+                operation_name=operation_name,
+                query=query,
+                variable_values=variable_values,
+            ),
+        )
+
+    async def _single_flight(
+        self, key: Hashable, start: Callable[[], Coroutine[Any, Any, dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run a read once for every concurrent caller with the same key.
+
+        The first caller starts the read and later callers with the same key
+        wait for it instead of starting their own, until it finishes. Every
+        caller gets the result or error; all but the last caller to resume
+        get a deep copy, so callers never share mutable results. Only raw
+        response dictionaries go through here: models are built by each
+        caller, because copying a lazy model decodes all of its fields. With
+        ``deduplicate_reads`` unset, every caller runs its own read.
+
+        Args:
+            key: Operation name and variables identifying the read.
+            start: Coroutine function that performs the read.
+
+        Returns:
+            The read's decoded response data.
+        """
+        if not self.deduplicate_reads:
+            return await start()
+        if self._flights is None:
+            self._flights = {}
+        flight = self._flights.get(key)
+        if flight is None:
+            task = create_task(start(), name="carrier_api_read")
+            flight = _Flight(task)
+            self._flights[key] = flight
+            task.add_done_callback(partial(self._end_flight, key, flight))
+        else:
+            flight.waiters += 1
+        try:
+            result = await shield(flight.task)
+        finally:
+            flight.waiters -= 1
+        return deepcopy(result) if flight.waiters else result
+
+    def _end_flight(self, key: Hashable, flight: _Flight, task: Task[Any]) -> None:
+        """Forget a finished read so later calls start a new one.
+
+        The read's error is retrieved here, because when every caller was
+        cancelled nobody else awaits the task.
+
+        Args:
+            key: Key of the read.
+            flight: The finished read.
+            task: Finished task of the read.
+        """
+        if not task.cancelled():
+            task.exception()
+        if self._flights is not None and self._flights.get(key) is flight:
+            del self._flights[key]
+
     async def get_user_info(self) -> dict[str, Any]:
         """Fetch Carrier account profile, location, and device metadata.
 
@@ -267,216 +682,29 @@ class ApiConnectionGraphql:
             The decoded ``getUser`` GraphQL response data.
         """
         operation_name = "getUser"
-        query = gql(
-            """
-            query getUser(
-                $userName: String!,
-                $appVersion: String,
-                $brand: String,
-                $os: String,
-                $osVersion: String
-            ) {
-                user(
-                    userName: $userName
-                    appVersion: $appVersion
-                    brand: $brand
-                    os: $os
-                    osVersion: $osVersion
-                ) {
-                    username
-                    identityId
-                    first
-                    last
-                    email
-                    emailVerified
-                    postal
-                    locations {
-                        locationId
-                        name
-                        systems {
-                            config {
-                                zones {
-                                    id
-                                    enabled
-                                }
-                            }
-                            profile {
-                                serial
-                                name
-                            }
-                            status {
-                                isDisconnected
-                            }
-                        }
-                        devices {
-                            deviceId
-                            type
-                            thingName
-                            name
-                            connectionStatus
-                        }
-                    }
-                }
-            }
-            """
-        )
+        query = graphql_document(operation_name)
         variable_values = {"userName": self.username}
-        return await self.authed_query(
+        return await self._shared_query(
             operation_name=operation_name, query=query, variable_values=variable_values
         )
 
-    async def get_systems(self) -> dict[str, Any]:
+    async def get_systems(
+        self, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
         """Fetch configured Carrier Infinity systems for the current user.
 
+        Args:
+            query_profile: Field-selection profile for the query. Non-full
+                profiles leave out config sections, such as zone programs.
+
         Returns:
             The decoded ``getInfinitySystems`` GraphQL response data containing
             profile, status, and config payloads.
         """
-        operation_name = "getInfinitySystems"
-        query = gql(
-            """
-            query getInfinitySystems($userName: String!) {
-              infinitySystems(userName: $userName) {
-                profile {
-                  serial
-                  name
-                  firmware
-                  model
-                  brand
-                  indoorModel
-                  indoorSerial
-                  idutype
-                  idusource
-                  outdoorModel
-                  outdoorSerial
-                  odutype
-                }
-                status {
-                  localTime
-                  localTimeOffset
-                  utcTime
-                  wcTime
-                  isDisconnected
-                  cfgem
-                  mode
-                  vacatrunning
-                  oat
-                  odu {
-                    type
-                    opstat
-                    iducfm
-                  }
-                  filtrlvl
-                  idu {
-                    type
-                    opstat
-                    cfm
-                    statpress
-                    blwrpm
-                  }
-                  vent
-                  ventlvl
-                  humid
-                  humlvl
-                  uvlvl
-                  zones {
-                    id
-                    rt
-                    rh
-                    fan
-                    htsp
-                    clsp
-                    hold
-                    enabled
-                    currentActivity
-                    zoneconditioning
-                  }
-                }
-                config {
-                  etag
-                  mode
-                  cfgem
-                  cfgdead
-                  cfgvent
-                  cfghumid
-                  cfguv
-                  cfgfan
-                  heatsource
-                  vacat
-                  vacstart
-                  vacend
-                  vacmint
-                  vacmaxt
-                  vacfan
-                  fueltype
-                  gasunit
-                  vacat
-                  filtertype
-                  filterinterval
-                  humidityVacation {
-                    rclgovercool
-                    ventspdclg
-                    ventclg
-                    rhtg
-                    humidifier
-                    humid
-                    venthtg
-                    rclg
-                    ventspdhtg
-                  }
-                  zones {
-                    id
-                    name
-                    enabled
-                    hold
-                    holdActivity
-                    otmr
-                    occEnabled
-                    program {
-                      id
-                      day {
-                        id
-                        zoneId
-                        period {
-                          id
-                          zoneId
-                          dayId
-                          activity
-                          time
-                          enabled
-                        }
-                      }
-                    }
-                    activities {
-                      id
-                      zoneId
-                      type
-                      fan
-                      htsp
-                      clsp
-                    }
-                  }
-                  humidityAway {
-                    humid
-                    humidifier
-                    rhtg
-                    rclg
-                    rclgovercool
-                  }
-                  humidityHome {
-                    humid
-                    humidifier
-                    rhtg
-                    rclg
-                    rclgovercool
-                  }
-                }
-              }
-            }
-            """
-        )
+        operation_name = infinity_operation_name("getInfinitySystems", query_profile)
+        query = graphql_document(operation_name)
         variable_values = {"userName": self.username}
-        return await self.authed_query(
+        return await self._shared_query(
             operation_name=operation_name, query=query, variable_values=variable_values
         )
 
@@ -490,82 +718,303 @@ class ApiConnectionGraphql:
             The decoded ``getInfinityEnergy`` GraphQL response data.
         """
         operation_name = "getInfinityEnergy"
-        query = gql(
-            """
-            query getInfinityEnergy($serial: String!) {
-              infinityEnergy(serial: $serial) {
-                energyConfig {
-                  cooling {
-                    display
-                    enabled
-                  }
-                  eheat {
-                    display
-                    enabled
-                  }
-                  fan {
-                    display
-                    enabled
-                  }
-                  fangas {
-                    display
-                    enabled
-                  }
-                  gas {
-                    display
-                    enabled
-                  }
-                  hpheat {
-                    display
-                    enabled
-                  }
-                  looppump {
-                    display
-                    enabled
-                  }
-                  reheat {
-                    display
-                    enabled
-                  }
-                  hspf
-                  seer
-                }
-                energyPeriods {
-                  energyPeriodType
-                  eHeatKwh
-                  coolingKwh
-                  fanGasKwh
-                  fanKwh
-                  hPHeatKwh
-                  loopPumpKwh
-                  gasKwh
-                  reheatKwh
-                }
-              }
-            }
-            """
+        query = graphql_document(operation_name)
+        variable_values = {"serial": system_serial}
+        return await self._shared_query(
+            operation_name=operation_name, query=query, variable_values=variable_values
+        )
+
+    async def get_energy_batch(self, system_serials: list[str]) -> dict[str, Any]:
+        """Fetch energy for several Carrier systems in one aliased query.
+
+        Args:
+            system_serials: Serial numbers of the Carrier systems to query.
+
+        Returns:
+            The decoded response data, with each serial's ``infinityEnergy``
+            payload under ``energy_batch_alias(position)``.
+        """
+        operation_name = energy_batch_operation_name(len(system_serials))
+        query = graphql_document(operation_name)
+        variable_values = {
+            f"serial{index}": system_serial for index, system_serial in enumerate(system_serials)
+        }
+        return await self._shared_query(
+            operation_name=operation_name, query=query, variable_values=variable_values
         )
+
+    async def load_energies(
+        self, system_serials: list[str], batch_size: int | None = None
+    ) -> dict[str, Energy]:
+        """Load energy models for several systems with batched queries.
+
+        Serials are split into chunks of ``batch_size``, each fetched with one
+        aliased query. Chunks run concurrently, limited by
+        ``energy_concurrency``. When a chunk fails, its serials are retried one
+        by one, so a failing serial only costs its own energy model.
+
+        Args:
+            system_serials: Serial numbers of the Carrier systems to query.
+            batch_size: Serials per query. Defaults to ``energy_batch_size``,
+                or ``ENERGY_BATCH_SIZE`` when that is unset.
+
+        Returns:
+            Energy models keyed by serial. A serial without energy data gets an
+            empty ``Energy`` model.
+        """
+        batch_size = max(1, batch_size or self.energy_batch_size or ENERGY_BATCH_SIZE)
+        semaphore = Semaphore(max(1, self.energy_concurrency))
+        chunks = [
+            system_serials[start : start + batch_size]
+            for start in range(0, len(system_serials), batch_size)
+        ]
+        energies: dict[str, Energy] = {}
+        for chunk_energies in await gather(
+            *(self._load_energy_batch(chunk, semaphore) for chunk in chunks)
+        ):
+            energies.update(chunk_energies)
+        return energies
+
+    async def _load_energy_batch(
+        self, system_serials: list[str], semaphore: Semaphore
+    ) -> dict[str, Energy]:
+        """Load one chunk of energy models, falling back to per-serial queries.
+
+        Args:
+            system_serials: Serial numbers in the chunk.
+            semaphore: Shared limit on concurrent energy queries.
+
+        Returns:
+            Energy models keyed by serial.
+        """
+        async with semaphore:
+            try:
+                response = await self.get_energy_batch(system_serials)
+            except CarrierApiError as error:
+                _LOGGER.warning(
+                    "Carrier batched energy load failed for %s, retrying per serial",
+                    system_serials,
+                    exc_info=error,
+                )
+                response = None
+        if response is None:
+            energies = await gather(
+                *(self._load_energy(system_serial, semaphore) for system_serial in system_serials)
+            )
+            return dict(zip(system_serials, energies, strict=True))
+        return {
+            system_serial: Energy(raw=response.get(energy_batch_alias(index)) or {})
+            for index, system_serial in enumerate(system_serials)
+        }
+
+    async def get_profile(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
+        """Fetch the profile for one Carrier Infinity system.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            The decoded ``getInfinityProfile`` GraphQL response data.
+        """
+        operation_name = infinity_operation_name("getInfinityProfile", query_profile)
+        query = graphql_document(operation_name)
         variable_values = {"serial": system_serial}
-        return await self.authed_query(
+        return await self._shared_query(
             operation_name=operation_name, query=query, variable_values=variable_values
         )
 
-    async def load_data(self) -> list[System]:
+    async def get_status(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
+        """Fetch the runtime status for one Carrier Infinity system.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            The decoded ``getInfinityStatus`` GraphQL response data.
+        """
+        operation_name = infinity_operation_name("getInfinityStatus", query_profile)
+        query = graphql_document(operation_name)
+        variable_values = {"serial": system_serial}
+        return await self._shared_query(
+            operation_name=operation_name, query=query, variable_values=variable_values
+        )
+
+    async def get_config(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
+        """Fetch the configuration for one Carrier Infinity system.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            The decoded ``getInfinityConfig`` GraphQL response data.
+        """
+        operation_name = infinity_operation_name("getInfinityConfig", query_profile)
+        query = graphql_document(operation_name)
+        variable_values = {"serial": system_serial}
+        return await self._shared_query(
+            operation_name=operation_name, query=query, variable_values=variable_values
+        )
+
+    async def refresh_profile(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> Profile:
+        """Fetch and build a fresh profile model for one system.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            A profile model built from the ``infinityProfile`` payload.
+        """
+        response = await self.get_profile(system_serial, query_profile)
+        return Profile(raw=_serial_payload(response, "infinityProfile", system_serial))
+
+    async def refresh_status(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> Status:
+        """Fetch and build a fresh status model for one system.
+
+        Only the status slice is requested, so profile and the per-zone weekly
+        programs in config are not downloaded.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            A status model built from the ``infinityStatus`` payload.
+        """
+        response = await self.get_status(system_serial, query_profile)
+        return Status(
+            raw=_serial_payload(response, "infinityStatus", system_serial), lazy=self.lazy_models
+        )
+
+    async def refresh_config(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> Config:
+        """Fetch and build a fresh config model for one system.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            A config model built from the ``infinityConfig`` payload.
+        """
+        response = await self.get_config(system_serial, query_profile)
+        return Config(
+            raw=_serial_payload(response, "infinityConfig", system_serial), lazy=self.lazy_models
+        )
+
+    async def refresh_system(
+        self,
+        system: System,
+        *,
+        status: bool = True,
+        config: bool = False,
+        profile: bool = False,
+        query_profile: QueryProfiles = QueryProfiles.FULL,
+    ) -> System:
+        """Refresh selected models of an existing system aggregate in place.
+
+        Each selected slice is fetched with its own per-serial query, and the
+        queries run concurrently. Models that were not selected are left
+        untouched, as is the system's energy model.
+
+        Args:
+            system: System aggregate to refresh.
+            status: Whether to rebuild ``system.status``.
+            config: Whether to rebuild ``system.config``.
+            profile: Whether to rebuild ``system.profile``.
+            query_profile: Field-selection profile for the refresh queries.
+
+        Returns:
+            The same system aggregate, updated with the refreshed models.
+        """
+        serial = system.profile.serial
+        refreshers: dict[str, Coroutine[Any, Any, Profile | Status | Config]] = {}
+        if status:
+            refreshers["status"] = self.refresh_status(serial, query_profile)
+        if config:
+            refreshers["config"] = self.refresh_config(serial, query_profile)
+        if profile:
+            refreshers["profile"] = self.refresh_profile(serial, query_profile)
+        models = await gather(*refreshers.values())
+        for attribute, model in zip(refreshers, models, strict=True):
+            setattr(system, attribute, model)
+        return system
+
+    async def _load_energy(self, system_serial: str, semaphore: Semaphore) -> Energy:
+        """Load one system's energy model without failing the whole account load.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            semaphore: Shared limit on concurrent energy queries.
+
+        Returns:
+            The system's energy model, or an empty energy model when Carrier
+            fails to return energy data for this serial.
+        """
+        async with semaphore:
+            try:
+                energy_response = await self.get_energy(system_serial)
+            except CarrierApiError as error:
+                _LOGGER.warning("Carrier energy load failed for %s", system_serial, exc_info=error)
+                return Energy(raw={})
+        return Energy(raw=energy_response["infinityEnergy"])
+
+    async def load_data(self, query_profile: QueryProfiles = QueryProfiles.FULL) -> list[System]:
         """Load all Carrier systems with status, config, and energy models.
 
+        Energy is fetched concurrently for all systems, limited by
+        ``energy_concurrency``, one query per system or, with
+        ``energy_batch_size`` set, through ``load_energies``. A system whose
+        energy query fails is still returned, with an empty ``Energy`` model.
+        Concurrent calls with the same profile share the systems and energy
+        queries, like other reads do, and each call builds its own models from
+        the shared responses; see ``_single_flight``.
+
+        Args:
+            query_profile: Field-selection profile for the systems query. With
+                ``QueryProfiles.STATUS_ONLY`` each system gets an empty config
+                model; with ``QueryProfiles.DASHBOARD`` zone configs have no
+                schedule program.
+
         Returns:
             A list of fully constructed system aggregates for the account.
         """
-        systems_response = await self.get_systems()
-        systems = []
-        for system_response in systems_response["infinitySystems"]:
-            profile = Profile(raw=system_response["profile"])
-            status = Status(raw=system_response["status"])
-            config = Config(raw=system_response["config"])
-            energy_response = await self.get_energy(profile.serial)
-            energy = Energy(raw=energy_response["infinityEnergy"])
-            systems.append(System(profile=profile, status=status, config=config, energy=energy))
-        return systems
+        systems_response = await self.get_systems(query_profile)
+        system_responses = systems_response["infinitySystems"]
+        profiles = [Profile(raw=system_response["profile"]) for system_response in system_responses]
+        if self.energy_batch_size is not None:
+            energies_by_serial = await self.load_energies([profile.serial for profile in profiles])
+            energies = [energies_by_serial[profile.serial] for profile in profiles]
+        else:
+            semaphore = Semaphore(max(1, self.energy_concurrency))
+            energies = await gather(
+                *(self._load_energy(profile.serial, semaphore) for profile in profiles)
+            )
+        return [
+            System(
+                profile=profile,
+                status=Status(raw=system_response["status"], lazy=self.lazy_models),
+                config=Config(raw=system_response.get("config") or {}, lazy=self.lazy_models),
+                energy=energy,
+            )
+            for system_response, profile, energy in zip(
+                system_responses, profiles, energies, strict=True
+            )
+        ]
 
     async def get_entry_level_systems(self) -> dict[str, Any]:
         """Fetch entry-level (Smart Thermostat) systems for the current user.
@@ -577,40 +1026,9 @@ class ApiConnectionGraphql:
             The decoded ``getEntryLevelSystems`` GraphQL response data.
         """
         operation_name = "getEntryLevelSystems"
-        query = gql(
-            """
-            query getEntryLevelSystems($username: String!) {
-              entryLevelSystems(username: $username) {
-                serial
-                name
-                location_id
-                model
-                firmware
-                temp_unit_format
-                connection {
-                  isConnected
-                  deviceId
-                }
-                zones {
-                  index
-                  mode
-                  rt
-                  rh
-                  clsp { current min }
-                  htsp { current max }
-                  fan_mode
-                  schedule_enabled
-                  hold_end_time
-                  hold_countdown
-                  stage_status
-                  outside_temp
-                }
-              }
-            }
-            """
-        )
+        query = graphql_document(operation_name)
         variable_values = {"username": self.username}
-        return await self.authed_query(
+        return await self._shared_query(
             operation_name=operation_name, query=query, variable_values=variable_values
         )
 
@@ -656,15 +1074,7 @@ class ApiConnectionGraphql:
         Returns:
             The decoded mutation response.
         """
-        query = gql(
-            """
-            mutation updateEntryLevelZone($input: EntryLevelZoneInput!) {
-              updateEntryLevelZone(input: $input) {
-                success
-              }
-            }
-            """
-        )
+        query = graphql_document("updateEntryLevelZone")
         zone_input: dict[str, Any] = {"serial": serial, "index": index}
         if mode is not None:
             zone_input["mode"] = mode
@@ -726,37 +1136,170 @@ class ApiConnectionGraphql:
         """
         return await self.update_entry_level_zone(serial, index, schedule_enabled=True)
 
-    async def _update_infinity_config(self, variables: dict[str, Any]) -> dict[str, Any]:
-        """Run the Carrier system-level configuration mutation.
+    async def _request_reconcile(self) -> None:
+        """Ask the websocket to reconcile after a mutation.
+
+        With ``reconcile_debounce_seconds`` set, the reconcile is sent once no
+        further mutation was made for that long.
+        """
+        if self.api_websocket is None:
+            _LOGGER.warning("No API websocket connection")
+            return
+        if self.reconcile_debounce_seconds is None:
+            await self.api_websocket.send_reconcile()
+            return
+        if self._reconcile_timer is not None:
+            self._reconcile_timer.cancel()
+        self._reconcile_timer = get_running_loop().call_later(
+            self.reconcile_debounce_seconds, self._start_debounced_reconcile
+        )
+
+    def _start_debounced_reconcile(self) -> None:
+        """Start the task that sends a debounced reconcile."""
+        self._reconcile_task = create_task(
+            self._send_debounced_reconcile(), name="carrier_api_reconcile"
+        )
+
+    async def _send_debounced_reconcile(self) -> None:
+        """Send a debounced reconcile, logging failures."""
+        try:
+            await self.flush_reconcile()
+        except Exception:
+            _LOGGER.exception("debounced reconcile failed")
+
+    async def flush_reconcile(self) -> None:
+        """Send a pending debounced reconcile now instead of after the quiet period."""
+        if self._reconcile_timer is None:
+            return
+        self._reconcile_timer.cancel()
+        self._reconcile_timer = None
+        if self.api_websocket is not None:
+            await self.api_websocket.send_reconcile()
+
+    async def _mutate(self, operation_name: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a Carrier mutation and request a websocket reconcile.
 
         Args:
-            variables: GraphQL variables containing an ``InfinityConfigInput``.
+            operation_name: GraphQL mutation name.
+            variables: GraphQL variables containing the mutation ``input``.
 
         Returns:
             The decoded mutation response.
         """
-        query = gql(
-            """
-            mutation updateInfinityConfig($input: InfinityConfigInput!) {
-                updateInfinityConfig(input: $input) {
-                    etag
-                }
-            }
-            """
-        )
-        _LOGGER.debug("updateInfinityConfig: %s", variables)
+        query = graphql_document(operation_name)
+        _LOGGER.debug("%s: %s", operation_name, variables)
         response = await self.authed_query(
-            operation_name="updateInfinityConfig", query=query, variable_values=variables
+            operation_name=operation_name, query=query, variable_values=variables
         )
-        if self.api_websocket is not None:
-            await self.api_websocket.send_reconcile()
-        else:
-            _LOGGER.warning("No API websocket connection")
+        await self._request_reconcile()
         return response
 
+    async def _queue_mutation(
+        self, operation_name: str, variables: dict[str, Any], part_fields: tuple[str, ...] = ()
+    ) -> dict[str, Any]:
+        """Run a zone mutation, merging it with pending ones when coalescing.
+
+        Mutations are coalesced per serial and zone. Inputs of the same
+        operation, with equal values for ``part_fields``, are merged into one
+        input; different ones are sent together in one aliased request; see
+        ``_mutate_zone_batch``.
+
+        Args:
+            operation_name: GraphQL mutation name.
+            variables: GraphQL variables containing the mutation ``input``.
+            part_fields: Further input fields naming the mutated object within
+                the zone, such as the activity type.
+
+        Returns:
+            The decoded response of the mutation the input was sent with.
+        """
+        if self.mutation_coalesce_seconds is None:
+            return await self._mutate(operation_name, variables)
+        if self.mutation_queue is None:
+            self.mutation_queue = MutationQueue(
+                self.mutation_coalesce_seconds, send_batch=self._mutate_zone_batch
+            )
+        mutation_input = variables["input"]
+        return await self.mutation_queue.submit(
+            (mutation_input.get("serial"), mutation_input.get("zoneId")),
+            variables,
+            partial(self._mutate, operation_name),
+            part=(operation_name, *(mutation_input.get(name) for name in part_fields)),
+        )
+
+    async def _mutate_zone_batch(
+        self, parts: list[tuple[Hashable, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Run several zone mutations of one zone in one aliased request.
+
+        Args:
+            parts: Part keys from ``_queue_mutation``, whose first item is the
+                operation name, with the merged variables of each part.
+
+        Returns:
+            One response per part, shaped like the response of the part's own
+            mutation.
+        """
+        operation_names = [part[0] for part, _ in parts]  # type: ignore[index]
+        operation_name = zone_mutation_batch_operation_name(operation_names)
+        variables = {
+            f"input{index}": part_variables["input"]
+            for index, (_, part_variables) in enumerate(parts)
+        }
+        response = await self._mutate(operation_name, variables)
+        return [
+            {name: response.get(zone_mutation_batch_alias(index))}
+            for index, name in enumerate(operation_names)
+        ]
+
+    async def flush_mutations(self) -> None:
+        """Send mutations waiting in the coalescing window now."""
+        if self.mutation_queue is not None:
+            await self.mutation_queue.flush()
+
+    async def _update_infinity_config(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run the Carrier system-level configuration mutation.
+
+        Args:
+            variables: GraphQL variables containing an ``InfinityConfigInput``.
+
+        Returns:
+            The decoded mutation response.
+        """
+        return await self._mutate("updateInfinityConfig", variables)
+
+    async def _update_infinity_configs(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run the Carrier multi-system configuration mutation.
+
+        Args:
+            variables: GraphQL variables containing an ``InfinityConfigsInput``.
+
+        Returns:
+            The decoded mutation response.
+        """
+        return await self._mutate("updateInfinityConfigs", variables)
+
+    async def _update_infinity_whole_house_activity(
+        self, variables: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run the Carrier whole-house activity mutation.
+
+        Args:
+            variables: GraphQL variables containing an
+                ``InfinityWholeHouseActivityInput``.
+
+        Returns:
+            The decoded mutation response.
+        """
+        return await self._mutate("updateInfinityWholeHouseActivity", variables)
+
     async def _update_infinity_zone_activity(self, variables: dict[str, Any]) -> dict[str, Any]:
         """Run the Carrier zone activity configuration mutation.
 
+        With ``mutation_coalesce_seconds`` set, the input is merged with
+        pending updates of the same zone activity and sent together with the
+        zone's other pending mutations.
+
         Args:
             variables: GraphQL variables containing an
                 ``InfinityZoneActivityInput``.
@@ -764,52 +1307,24 @@ class ApiConnectionGraphql:
         Returns:
             The decoded mutation response.
         """
-        query = gql(
-            """
-            mutation updateInfinityZoneActivity($input: InfinityZoneActivityInput!) {
-                updateInfinityZoneActivity(input: $input) {
-                    etag
-                }
-            }
-            """
-        )
-        _LOGGER.debug("updateInfinityZoneActivity: %s", variables)
-        response = await self.authed_query(
-            operation_name="updateInfinityZoneActivity", query=query, variable_values=variables
+        return await self._queue_mutation(
+            "updateInfinityZoneActivity", variables, ("activityType",)
         )
-        if self.api_websocket is not None:
-            await self.api_websocket.send_reconcile()
-        else:
-            _LOGGER.warning("No API websocket connection")
-        return response
 
     async def _update_infinity_zone_config(self, variables: dict[str, Any]) -> dict[str, Any]:
         """Run the Carrier zone configuration mutation.
 
+        With ``mutation_coalesce_seconds`` set, the input is merged with
+        pending config updates of the same zone and sent together with the
+        zone's other pending mutations.
+
         Args:
             variables: GraphQL variables containing an ``InfinityZoneConfigInput``.
 
         Returns:
             The decoded mutation response.
         """
-        query = gql(
-            """
-            mutation updateInfinityZoneConfig($input: InfinityZoneConfigInput!) {
-                updateInfinityZoneConfig(input: $input) {
-                    etag
-                }
-            }
-            """
-        )
-        _LOGGER.debug("updateInfinityZoneConfig: %s", variables)
-        response = await self.authed_query(
-            operation_name="updateInfinityZoneConfig", query=query, variable_values=variables
-        )
-        if self.api_websocket is not None:
-            await self.api_websocket.send_reconcile()
-        else:
-            _LOGGER.warning("No API websocket connection")
-        return response
+        return await self._queue_mutation("updateInfinityZoneConfig", variables)
 
     async def set_config_mode(self, system_serial: str, mode: SystemModes) -> dict[str, Any]:
         """Update a Carrier system's operating mode.
@@ -829,6 +1344,90 @@ class ApiConnectionGraphql:
         variables = {"input": {"serial": system_serial, "mode": mode.value}}
         return await self._update_infinity_config(variables)
 
+    async def set_config_modes(
+        self, system_serials: list[str], mode: SystemModes
+    ) -> dict[str, bool]:
+        """Update the operating mode of several Carrier systems in one request.
+
+        Args:
+            system_serials: Serial numbers of the systems to update.
+            mode: Requested system operating mode.
+
+        Returns:
+            Whether each serial's update succeeded, keyed by serial.
+
+        Raises:
+            ValueError: If ``mode`` is not a ``SystemModes`` member.
+        """
+        if mode not in SystemModes:
+            raise ValueError(f"{mode} is not a valid system mode")
+        return await self.set_configs(system_serials, {"mode": mode.value})
+
+    async def set_configs(
+        self, system_serials: list[str], settings: dict[str, Any]
+    ) -> dict[str, bool]:
+        """Apply the same system-level settings to several Carrier systems.
+
+        Settings use the ``InfinityConfigInput`` field names, without
+        ``serial``. When every field is accepted by Carrier's multi-system
+        mutation, all serials are updated with one ``updateInfinityConfigs``
+        request and one reconcile. Settings that mutation does not accept,
+        such as ``heatsource`` or ``zones``, are sent with one
+        ``updateInfinityConfig`` request per serial, as is a batch that
+        Carrier rejects.
+
+        Args:
+            system_serials: Serial numbers of the systems to update.
+            settings: ``InfinityConfigInput`` fields to apply to every system.
+
+        Returns:
+            Whether each serial's update succeeded, keyed by serial.
+
+        Raises:
+            ValueError: If ``settings`` includes ``serial`` or ``serials``.
+        """
+        if {"serial", "serials"} & settings.keys():
+            raise ValueError("settings must not include serial numbers")
+        if not system_serials:
+            return {}
+        if settings.keys() <= _BATCH_CONFIG_FIELDS:
+            variables = {"input": {"serials": system_serials, **settings}}
+            try:
+                response = await self._update_infinity_configs(variables)
+            except CarrierApiGraphqlError as error:
+                _LOGGER.warning(
+                    "Carrier batched config update failed for %s, retrying per serial",
+                    system_serials,
+                    exc_info=error,
+                )
+            else:
+                configs = response.get("updateInfinityConfigs") or []
+                return {
+                    system_serial: index < len(configs) and configs[index] is not None
+                    for index, system_serial in enumerate(system_serials)
+                }
+        results = await gather(
+            *(self._set_config(system_serial, settings) for system_serial in system_serials)
+        )
+        return dict(zip(system_serials, results, strict=True))
+
+    async def _set_config(self, system_serial: str, settings: dict[str, Any]) -> bool:
+        """Apply system-level settings to one system for ``set_configs``.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            settings: ``InfinityConfigInput`` fields to apply.
+
+        Returns:
+            Whether the update succeeded.
+        """
+        try:
+            await self._update_infinity_config({"input": {"serial": system_serial, **settings}})
+        except CarrierApiError as error:
+            _LOGGER.warning("Carrier config update failed for %s", system_serial, exc_info=error)
+            return False
+        return True
+
     async def set_config_heat_humidity(
         self, system_serial: str, humidity_target: int
     ) -> dict[str, Any]:
@@ -1047,3 +1646,211 @@ class ApiConnectionGraphql:
                 raise ValueError(f"{fan_mode} is not a valid fan mode")
             variables["input"]["fan"] = fan_mode.value
         return await self._update_infinity_zone_activity(variables=variables)
+
+    async def set_whole_house_activity(
+        self,
+        system_serial: str,
+        zone_ids: list[str],
+        activity_type: ActivityTypes,
+        heat_set_point: str | None = None,
+        cool_set_point: str | None = None,
+        fan_mode: FanModes | None = None,
+    ) -> dict[str, bool]:
+        """Update one activity's set points or fan mode in every zone at once.
+
+        The change is sent with one ``updateInfinityWholeHouseActivity``
+        request. When Carrier rejects it, each of ``zone_ids`` is updated with
+        its own ``updateInfinityZoneActivity`` request instead.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the system's enabled zones.
+            activity_type: Activity to update.
+            heat_set_point: Optional heat set point as Carrier expects it.
+            cool_set_point: Optional cool set point as Carrier expects it.
+            fan_mode: Optional fan mode for the activity.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+
+        Raises:
+            ValueError: If ``activity_type`` or ``fan_mode`` is not a valid
+                enum member.
+        """
+        if activity_type not in ActivityTypes:
+            raise ValueError(f"{activity_type} is not a valid activity type")
+        activity: dict[str, Any] = {"activityType": activity_type.value}
+        if heat_set_point is not None:
+            activity["htsp"] = heat_set_point
+        if cool_set_point is not None:
+            activity["clsp"] = cool_set_point
+        if fan_mode is not None:
+            if fan_mode not in FanModes:
+                raise ValueError(f"{fan_mode} is not a valid fan mode")
+            activity["fan"] = fan_mode.value
+        try:
+            await self._update_infinity_whole_house_activity(
+                {"input": {"serial": system_serial, **activity}}
+            )
+        except CarrierApiGraphqlError as error:
+            _LOGGER.warning(
+                "Carrier whole-house activity update failed for %s, retrying per zone",
+                system_serial,
+                exc_info=error,
+            )
+        else:
+            return dict.fromkeys(zone_ids, True)
+        return await self._update_zones(
+            self._update_infinity_zone_activity, system_serial, zone_ids, activity
+        )
+
+    async def set_whole_house_manual_activity(
+        self,
+        system_serial: str,
+        zone_ids: list[str],
+        heat_set_point: str,
+        cool_set_point: str,
+        fan_mode: FanModes | None = None,
+    ) -> dict[str, bool]:
+        """Update the manual activity of every zone at once.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the system's enabled zones.
+            heat_set_point: Requested heat set point as Carrier expects it.
+            cool_set_point: Requested cool set point as Carrier expects it.
+            fan_mode: Optional fan mode to include in the manual activity update.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+        """
+        return await self.set_whole_house_activity(
+            system_serial,
+            zone_ids,
+            ActivityTypes.MANUAL,
+            heat_set_point=heat_set_point,
+            cool_set_point=cool_set_point,
+            fan_mode=fan_mode,
+        )
+
+    async def set_whole_house_hold(
+        self,
+        system_serial: str,
+        zone_ids: list[str],
+        activity_type: ActivityTypes,
+        hold_until: str | None = None,
+    ) -> dict[str, bool]:
+        """Place every zone on hold for a selected activity at once.
+
+        Carrier has no whole-house hold mutation, so the zone holds are sent
+        together as the ``zones`` of one ``updateInfinityConfig`` request.
+        When Carrier rejects it, each zone is held with its own
+        ``updateInfinityZoneConfig`` request instead.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the zones to hold.
+            activity_type: Activity to hold.
+            hold_until: Optional Carrier hold-until time string. ``None`` keeps
+                the hold indefinite according to Carrier's API behavior.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+
+        Raises:
+            ValueError: If ``activity_type`` is not a valid enum member.
+        """
+        if activity_type not in ActivityTypes:
+            raise ValueError(f"{activity_type} is not a valid activity type")
+        return await self._set_zone_configs(
+            system_serial,
+            zone_ids,
+            {"hold": "on", "holdActivity": activity_type.value, "otmr": hold_until},
+        )
+
+    async def resume_whole_house_schedule(
+        self, system_serial: str, zone_ids: list[str]
+    ) -> dict[str, bool]:
+        """Clear the hold of every zone and resume their programmed schedules.
+
+        Sent like ``set_whole_house_hold``.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the zones to resume.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+        """
+        return await self._set_zone_configs(
+            system_serial, zone_ids, {"hold": "off", "holdActivity": None, "otmr": None}
+        )
+
+    async def _set_zone_configs(
+        self, system_serial: str, zone_ids: list[str], zone_config: dict[str, Any]
+    ) -> dict[str, bool]:
+        """Apply the same zone config to several zones in one system update.
+
+        Args:
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the zones to update.
+            zone_config: ``InfinityZoneConfigInput`` fields to apply.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+        """
+        if not zone_ids:
+            return {}
+        zones = [
+            {"serial": system_serial, "zoneId": zone_id, **zone_config} for zone_id in zone_ids
+        ]
+        try:
+            await self._update_infinity_config({"input": {"serial": system_serial, "zones": zones}})
+        except CarrierApiGraphqlError as error:
+            _LOGGER.warning(
+                "Carrier whole-house zone update failed for %s, retrying per zone",
+                system_serial,
+                exc_info=error,
+            )
+        else:
+            return dict.fromkeys(zone_ids, True)
+        return await self._update_zones(
+            self._update_infinity_zone_config, system_serial, zone_ids, zone_config
+        )
+
+    async def _update_zones(
+        self,
+        mutation: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        system_serial: str,
+        zone_ids: list[str],
+        zone_input: dict[str, Any],
+    ) -> dict[str, bool]:
+        """Send one zone mutation per zone, reporting each zone's result.
+
+        Args:
+            mutation: Zone mutation helper to call.
+            system_serial: Serial number of the system to update.
+            zone_ids: Carrier identifiers of the zones to update.
+            zone_input: Input fields shared by every zone.
+
+        Returns:
+            Whether each zone's update succeeded, keyed by zone id.
+        """
+
+        async def update_zone(zone_id: str) -> bool:
+            try:
+                await mutation(
+                    {"input": {"serial": system_serial, "zoneId": zone_id, **zone_input}}
+                )
+            except CarrierApiError as error:
+                _LOGGER.warning(
+                    "Carrier zone update failed for %s zone %s",
+                    system_serial,
+                    zone_id,
+                    exc_info=error,
+                )
+                return False
+            return True
+
+        results = await gather(*(update_zone(zone_id) for zone_id in zone_ids))
+        return dict(zip(zone_ids, results, strict=True))
@@ -4,20 +4,29 @@ from __future__ import annotations
 
 from asyncio import CancelledError, Task, create_task, current_task, sleep
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from logging import getLogger
 from random import random
 from typing import TYPE_CHECKING
 
 from aiohttp import ClientError, ClientWebSocketResponse, WSMsgType
 
-from .errors import CarrierApiWebsocketError
+from .const import ConnectionStates, OverflowPolicies
+from .errors import CarrierApiAuthError, CarrierApiError, CarrierApiWebsocketError
+from .websocket_dispatcher import AsyncCallback, CallbackDispatcher
 
 if TYPE_CHECKING:
     from .api_connection_graphql import ApiConnectionGraphql
 
 _LOGGER = getLogger(__name__)
 
-AsyncCallback = Callable[[str], Awaitable[None]]
+__all__ = ["ApiWebsocket", "AsyncCallback"]
+
+StateCallback = Callable[[ConnectionStates], Awaitable[None]]
+
+TOKEN_REFRESH_MARGIN_SECONDS = 600
+RECONNECT_BACKOFF_SECONDS = 1.0
+RECONNECT_BACKOFF_MAX_SECONDS = 300.0
 
 
 class _CallbackError(Exception):
@@ -37,29 +46,81 @@ class _CallbackError(Exception):
 class ApiWebsocket:
     """Manage Carrier realtime websocket connection state and callbacks."""
 
-    def __init__(self, api_connection_graphql: ApiConnectionGraphql) -> None:
+    callback_dispatcher: CallbackDispatcher | None = None
+    connection_state = ConnectionStates.DISCONNECTED
+    last_received_at: datetime | None = None
+    reconnect_attempts = 0
+    reconnect_backoff_seconds = RECONNECT_BACKOFF_SECONDS
+    reconnect_backoff_max_seconds = RECONNECT_BACKOFF_MAX_SECONDS
+    receive_idle_timeout_seconds: float | None = None
+
+    def __init__(
+        self,
+        api_connection_graphql: ApiConnectionGraphql,
+        token_refresh: bool = False,
+        token_refresh_margin_seconds: float = TOKEN_REFRESH_MARGIN_SECONDS,
+        callback_queue_size: int | None = None,
+        callback_concurrency: int = 1,
+        overflow_policy: OverflowPolicies = OverflowPolicies.BLOCK,
+        reconnect_backoff_seconds: float = RECONNECT_BACKOFF_SECONDS,
+        reconnect_backoff_max_seconds: float = RECONNECT_BACKOFF_MAX_SECONDS,
+        receive_idle_timeout_seconds: float | None = None,
+    ) -> None:
         """Create a websocket manager bound to a GraphQL API connection.
 
         Args:
             api_connection_graphql: Authenticated API connection used for token
                 refresh and websocket session creation.
+            token_refresh: Whether ``loop_listener`` also runs the background
+                token refresher.
+            token_refresh_margin_seconds: How long before the access token
+                expires the background refresher renews it.
+            callback_queue_size: Maximum number of messages queued per
+                callback. When set, callbacks run on their own tasks instead of
+                being awaited by the listener. ``None`` awaits them inline.
+            callback_concurrency: Default number of concurrent invocations per
+                callback in queued mode. Messages of one device serial are
+                always delivered to a callback in order.
+            overflow_policy: What queued mode does with a message when a
+                callback queue is full.
+            reconnect_backoff_seconds: Base delay before reconnecting. It
+                doubles with each consecutive failed connection.
+            reconnect_backoff_max_seconds: Upper bound of the reconnect delay.
+            receive_idle_timeout_seconds: Reconnect when no frame arrives for
+                this long. ``None`` waits indefinitely.
         """
         self.websocket: ClientWebSocketResponse | None = None
         self.running: bool | None = None
         self.async_callbacks: list[AsyncCallback] = []
+        self.state_callbacks: list[StateCallback] = []
+        self.reconnect_backoff_seconds = reconnect_backoff_seconds
+        self.reconnect_backoff_max_seconds = reconnect_backoff_max_seconds
+        self.receive_idle_timeout_seconds = receive_idle_timeout_seconds
+        self.callback_concurrency: dict[AsyncCallback, int] = {}
+        if callback_queue_size is not None:
+            self.callback_dispatcher = CallbackDispatcher(
+                callback_queue_size, overflow_policy, callback_concurrency
+            )
         self.task_heartbeat: Task[None] | None = None
         self.task_listener: Task[None] | None = None
+        self.task_token_refresh: Task[None] | None = None
+        self.token_refresh = token_refresh
+        self.token_refresh_margin_seconds = token_refresh_margin_seconds
         self.api_connection_graphql = api_connection_graphql
         self.api_connection_graphql.api_websocket = self
 
-    def callback_add(self, async_callback: AsyncCallback) -> None:
+    def callback_add(self, async_callback: AsyncCallback, concurrency: int | None = None) -> None:
         """Register an async callback for incoming text messages.
 
         Args:
             async_callback: Coroutine function that receives the raw websocket
                 message text.
+            concurrency: Number of concurrent invocations of this callback in
+                queued mode, overriding ``callback_concurrency``.
         """
         self.async_callbacks.append(async_callback)
+        if concurrency is not None:
+            self.callback_concurrency[async_callback] = concurrency
 
     def callback_remove(self, async_callback: AsyncCallback) -> None:
         """Remove a previously registered async callback.
@@ -71,6 +132,73 @@ class ApiWebsocket:
             ValueError: If the callback is not currently registered.
         """
         self.async_callbacks.remove(async_callback)
+        if async_callback not in self.async_callbacks:
+            self.callback_concurrency.pop(async_callback, None)
+
+    def state_callback_add(self, state_callback: StateCallback) -> None:
+        """Register an async callback for connection state changes.
+
+        Args:
+            state_callback: Coroutine function that receives the new
+                ``ConnectionStates`` value.
+        """
+        self.state_callbacks.append(state_callback)
+
+    def state_callback_remove(self, state_callback: StateCallback) -> None:
+        """Remove a previously registered connection state callback.
+
+        Args:
+            state_callback: Callback previously added with
+                ``state_callback_add``.
+
+        Raises:
+            ValueError: If the callback is not currently registered.
+        """
+        self.state_callbacks.remove(state_callback)
+
+    @property
+    def connected(self) -> bool:
+        """Return whether realtime updates are currently being received.
+
+        Returns:
+            ``True`` while the websocket is connected. Otherwise in-memory data
+            may be stale.
+        """
+        return self.connection_state == ConnectionStates.CONNECTED
+
+    async def set_connection_state(self, connection_state: ConnectionStates) -> None:
+        """Record a connection state and notify state callbacks on change.
+
+        Callback errors are logged so they cannot break the listener loop.
+
+        Args:
+            connection_state: New connection state.
+        """
+        if connection_state == self.connection_state:
+            return
+        self.connection_state = connection_state
+        _LOGGER.debug("ws: %s", connection_state.value)
+        for state_callback in list(self.state_callbacks):
+            try:
+                await state_callback(connection_state)
+            except Exception:
+                _LOGGER.exception("ws: connection state callback failed")
+
+    def reconnect_delay(self) -> float:
+        """Return the backoff delay before the next reconnect attempt.
+
+        The delay doubles with each consecutive attempt up to
+        ``reconnect_backoff_max_seconds``. Half of it is random jitter, so many
+        clients losing the connection together do not reconnect in lockstep.
+
+        Returns:
+            Delay in seconds.
+        """
+        ceiling = min(
+            self.reconnect_backoff_max_seconds,
+            self.reconnect_backoff_seconds * 2 ** min(self.reconnect_attempts, 32),
+        )
+        return ceiling / 2 + random() * ceiling / 2
 
     async def loop_heartbeat(self) -> None:
         """Send keepalive messages until the heartbeat task is cancelled.
@@ -102,27 +230,93 @@ class ApiWebsocket:
             self.loop_heartbeat(), name=f"carrier_api_ws_heartbeat:{random()}"
         )
 
+    @property
+    def next_token_refresh_at(self) -> datetime | None:
+        """Return when the background refresher next renews the access token.
+
+        Returns:
+            ``token_refresh_margin_seconds`` before the token expires, or
+            ``None`` before the connection has logged in.
+        """
+        if self.api_connection_graphql.refresh_token is None:
+            return None
+        return self.api_connection_graphql.expires_at - timedelta(
+            seconds=self.token_refresh_margin_seconds
+        )
+
+    async def loop_token_refresh(self) -> None:
+        """Renew the access token ahead of expiry until the task is cancelled.
+
+        Each pass sleeps until ``next_token_refresh_at`` and then renews through
+        the connection's shared refresh, so request paths find a fresh token. A
+        rejected refresh token falls back to a full login. Failures are logged,
+        and consecutive attempts are at least the connection's
+        ``token_refresh_retry_seconds`` apart so a short-lived token or an SSO
+        outage cannot cause a busy loop.
+        """
+        attempted = False
+        while True:
+            delay = 0.0
+            next_refresh_at = self.next_token_refresh_at
+            if next_refresh_at is not None:
+                delay = (next_refresh_at - datetime.now(UTC)).total_seconds()
+            if attempted:
+                delay = max(delay, self.api_connection_graphql.token_refresh_retry_seconds)
+            if delay > 0:
+                await sleep(delay)
+            attempted = True
+            try:
+                await self.api_connection_graphql.renew_auth(self.token_refresh_margin_seconds)
+            except CarrierApiAuthError as error:
+                _LOGGER.debug("token refresh rejected, logging in again", exc_info=error)
+                try:
+                    await self.api_connection_graphql.login()
+                except CarrierApiError as login_error:
+                    _LOGGER.warning("background login failed", exc_info=login_error)
+            except CarrierApiError as error:
+                _LOGGER.warning("background token refresh failed", exc_info=error)
+
+    async def create_task_token_refresh(self) -> None:
+        """Start the background token refresher unless it is already running."""
+        if self.task_token_refresh is None or self.task_token_refresh.done():
+            self.task_token_refresh = create_task(
+                self.loop_token_refresh(), name=f"carrier_api_token_refresh:{random()}"
+            )
+
     async def listener(self) -> None:
         """Open the websocket and dispatch incoming text messages.
 
         The listener refreshes authentication if needed, starts the heartbeat,
         forwards text payloads to registered callbacks, and clears connection
-        state when the socket closes.
+        state when the socket closes. In queued mode text payloads are handed
+        to ``callback_dispatcher`` and callback errors are logged there. When
+        no frame arrives within ``receive_idle_timeout_seconds`` the connection
+        is treated as dead and ``CarrierApiWebsocketError`` is raised.
         """
         await self.api_connection_graphql.check_auth_expiration()
         try:
+            await self.set_connection_state(ConnectionStates.CONNECTING)
             async with self.api_connection_graphql.api_session.ws_connect(
                 "wss://realtime.infinity.iot.carrier.com/"
-                f"?Token={self.api_connection_graphql.access_token}"
+                f"?Token={self.api_connection_graphql.access_token}",
+                receive_timeout=self.receive_idle_timeout_seconds,
             ) as self.websocket:
+                await self.set_connection_state(ConnectionStates.CONNECTED)
                 if self.task_heartbeat is None:
                     await self.create_task_heartbeat()
                 if self.websocket is not None:
                     async for msg in self.websocket:
+                        self.last_received_at = datetime.now(UTC)
+                        self.reconnect_attempts = 0
                         if msg.type == WSMsgType.TEXT:
                             if msg.data == "close cmd":
                                 await self.websocket.close()
                                 break
+                            if self.callback_dispatcher is not None:
+                                await self.callback_dispatcher.dispatch(
+                                    msg.data, self.async_callbacks, self.callback_concurrency
+                                )
+                                continue
                             for async_callback in self.async_callbacks:
                                 try:
                                     await async_callback(msg.data)
@@ -149,24 +343,46 @@ class ApiWebsocket:
             if self.task_heartbeat is not None:
                 self.task_heartbeat.cancel()
             self.task_heartbeat = None
+            await self.set_connection_state(ConnectionStates.DISCONNECTED)
 
     async def loop_listener(self) -> None:
         """Keep reconnecting the websocket listener while running is enabled.
 
         Cancellation stops the loop. Other listener errors are logged so a later
-        loop iteration can retry the websocket connection.
+        loop iteration can retry the websocket connection. Reconnects wait for
+        ``reconnect_delay``, which grows while connections keep failing and
+        resets once a frame is received. When ``token_refresh`` is enabled,
+        the background token refresher runs for the lifetime of this loop.
         """
         self.running = True
-        while self.running:
-            try:
-                _LOGGER.debug("websocket task listening")
-                await self.listener()
-                _LOGGER.debug("websocket task ending")
-            except CancelledError:
-                self.running = False
-                _LOGGER.debug("websocket task cancelled")
-            except Exception as websocket_error:
-                _LOGGER.exception("websocket task exception", exc_info=websocket_error)
+        if self.token_refresh:
+            await self.create_task_token_refresh()
+        reconnecting = False
+        try:
+            while self.running:
+                try:
+                    if reconnecting:
+                        delay = self.reconnect_delay()
+                        self.reconnect_attempts += 1
+                        await self.set_connection_state(ConnectionStates.RECONNECTING)
+                        _LOGGER.debug("websocket reconnecting in %.1fs", delay)
+                        await sleep(delay)
+                    reconnecting = True
+                    _LOGGER.debug("websocket task listening")
+                    await self.listener()
+                    _LOGGER.debug("websocket task ending")
+                except CancelledError:
+                    self.running = False
+                    _LOGGER.debug("websocket task cancelled")
+                except Exception as websocket_error:
+                    _LOGGER.exception("websocket task exception", exc_info=websocket_error)
+        finally:
+            if self.task_token_refresh is not None:
+                self.task_token_refresh.cancel()
+            self.task_token_refresh = None
+            await self.set_connection_state(ConnectionStates.DISCONNECTED)
+            if self.callback_dispatcher is not None:
+                await self.callback_dispatcher.close()
 
     async def create_task_listener(self) -> None:
         """Start the background websocket listener task."""
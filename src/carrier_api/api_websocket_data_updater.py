@@ -1,14 +1,30 @@
 """Apply Carrier realtime websocket messages to in-memory system models."""
 
+from asyncio import Task, TimerHandle, create_task, gather, get_running_loop
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from json import loads
 from logging import getLogger
+from typing import TYPE_CHECKING, Any
 
+from dateutil.parser import isoparse
 from deepmerge import always_merger
 
-from .config import Config
-from .status import Status
+from .config import VACATION_KEYS, Config
+from .const import ConnectionStates
+from .errors import CarrierApiError
+from .status import Status, StatusZone
 from .system import System
+from .util import FieldChanges, json_path, merge_delta
+
+if TYPE_CHECKING:
+    from .api_connection_graphql import ApiConnectionGraphql
+    from .api_websocket import ApiWebsocket, StateCallback
+
+_ENABLED = json_path("enabled")
+_UTC_TIME = json_path("utcTime")
 
 _LOGGER = getLogger(__name__)
 
@@ -32,19 +48,258 @@ def find_by_id(collection: list[dict], item_id: str) -> dict:
     raise ValueError(f"id: {item_id} not found in collection")
 
 
+@dataclass(frozen=True)
+class FieldChange:
+    """One model attribute changed by a websocket message.
+
+    Attributes:
+        serial: Carrier system serial number.
+        section: Model that changed, ``"status"`` or ``"config"``.
+        zone_id: Carrier zone id for zone attributes, ``None`` for system-level
+            attributes.
+        field: Changed attribute name. Nested models use dotted names such as
+            ``indoor_unit.cfm`` or ``activities.home.fan``.
+        old: Value before the message was applied.
+        new: Value after the message was applied.
+    """
+
+    serial: str
+    section: str
+    zone_id: str | None
+    field: str
+    old: Any
+    new: Any
+
+
+ChangeCallback = Callable[[list[FieldChange]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class ChangeSubscription:
+    """A change callback and the changes it is interested in.
+
+    Filters left as ``None`` match everything. ``field`` matches the attribute
+    name exactly or as a dotted prefix, so ``indoor_unit`` matches
+    ``indoor_unit.airflow_cfm`` and ``activities.home`` matches
+    ``activities.home.fan``.
+
+    Attributes:
+        callback: Coroutine function that receives the matching changes of one
+            websocket message.
+        serial: Carrier system serial number to match.
+        section: Model to match, ``"status"`` or ``"config"``.
+        zone_id: Carrier zone id to match.
+        field: Attribute name or dotted prefix to match.
+    """
+
+    callback: ChangeCallback
+    serial: str | None = None
+    section: str | None = None
+    zone_id: str | None = None
+    field: str | None = None
+
+    def matches(self, change: FieldChange) -> bool:
+        """Return whether a change passes this subscription's filters.
+
+        Args:
+            change: Change reported by ``WebsocketDataUpdater.apply_message``.
+
+        Returns:
+            ``True`` when every configured filter matches the change.
+        """
+        return (
+            (self.serial is None or change.serial == self.serial)
+            and (self.section is None or change.section == self.section)
+            and (self.zone_id is None or change.zone_id == self.zone_id)
+            and (
+                self.field is None
+                or change.field == self.field
+                or change.field.startswith(f"{self.field}.")
+            )
+        )
+
+
+@dataclass
+class _RawZoneIndex:
+    """Zone and activity lookups for one raw status or config payload."""
+
+    raw: dict[str, Any]
+    zones_list: list[dict[str, Any]] | None
+    zones: dict[str, dict[str, Any]] = field(default_factory=dict)
+    activities: dict[tuple[str, str], dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, raw: dict[str, Any]) -> _RawZoneIndex:
+        """Index the zones and zone activities of a raw payload by id.
+
+        Like ``find_by_id``, the first entry wins when ids repeat.
+
+        Args:
+            raw: Raw ``status`` or ``config`` payload.
+
+        Returns:
+            An index bound to ``raw``.
+        """
+        index = cls(raw, raw.get("zones"))
+        for zone in index.zones_list or []:
+            zone_id = str(zone["id"])
+            index.zones.setdefault(zone_id, zone)
+            for activity in zone.get("activities") or []:
+                index.activities.setdefault((zone_id, str(activity["id"])), activity)
+        return index
+
+
+@dataclass
+class _PendingStatus:
+    """InfinityStatus deltas of one serial waiting for the coalescing window."""
+
+    first_received_at: float
+    message_json: dict[str, Any] = field(default_factory=dict)
+    zones: dict[str, dict[str, Any]] = field(default_factory=dict)
+    timer: TimerHandle | None = None
+
+    def merge(self, message_json: dict[str, Any]) -> None:
+        """Merge a later status delta; zone deltas are merged by zone id.
+
+        Nested values are combined with ``merge_delta``, like queued
+        websocket messages, so a repeated list is not appended to itself.
+
+        Args:
+            message_json: Status message; its ``zones`` entry is consumed.
+        """
+        for zone in message_json.pop("zones", []):
+            merge_delta(self.zones.setdefault(str(zone["id"]), {}), zone)
+        merge_delta(self.message_json, message_json)
+
+    def as_message(self) -> dict[str, Any]:
+        """Return the merged deltas as one status message.
+
+        Returns:
+            A status message carrying every pending system and zone delta.
+        """
+        return {**self.message_json, "zones": list(self.zones.values())}
+
+
 class WebsocketDataUpdater:
-    """Merge Carrier websocket payloads into existing system model instances."""
+    """Merge Carrier websocket payloads into existing system model instances.
+
+    Systems are indexed by serial, and raw zones and zone activities by
+    ``(serial, zone id)`` and ``(serial, zone id, activity id)``. Assigning
+    ``systems`` rebuilds the indexes. Raw zone indexes are tied to the raw
+    payload they were built from and rebuilt when a model is replaced, for
+    example by ``ApiConnectionGraphql.refresh_system``.
+    """
 
     def __init__(
         self,
         systems: list[System],
+        status_coalesce_seconds: float | None = None,
+        status_coalesce_max_delay_seconds: float = 1.0,
     ) -> None:
         """Create a data updater for a set of Carrier systems.
 
         Args:
             systems: System objects previously loaded from the GraphQL API.
+            status_coalesce_seconds: Quiet period after which ``message_handler``
+                applies the InfinityStatus deltas received for a serial as one
+                update. ``None`` applies every message immediately.
+            status_coalesce_max_delay_seconds: Longest time a status delta may
+                wait while messages for its serial keep arriving.
         """
         self.systems = systems
+        self.subscriptions: list[ChangeSubscription] = []
+        self.status_coalesce_seconds = status_coalesce_seconds
+        self.status_coalesce_max_delay_seconds = status_coalesce_max_delay_seconds
+        self._pending_statuses: dict[str, _PendingStatus] = {}
+        self._flush_tasks: set[Task[None]] = set()
+        self._resync_task: Task[None] | None = None
+
+    def subscribe(
+        self,
+        callback: ChangeCallback,
+        *,
+        serial: str | None = None,
+        section: str | None = None,
+        zone_id: str | None = None,
+        field: str | None = None,
+    ) -> ChangeSubscription:
+        """Register a callback for changes applied by ``message_handler``.
+
+        Args:
+            callback: Coroutine function that receives the matching changes of
+                each websocket message, in the order they were applied.
+            serial: Only report changes for this system serial.
+            section: Only report ``"status"`` or ``"config"`` changes.
+            zone_id: Only report changes for this zone id.
+            field: Only report this attribute or attributes under this dotted
+                prefix.
+
+        Returns:
+            The subscription, for use with ``unsubscribe``.
+        """
+        subscription = ChangeSubscription(
+            callback,
+            serial=serial,
+            section=section,
+            zone_id=None if zone_id is None else str(zone_id),
+            field=field,
+        )
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        """Remove a subscription returned by ``subscribe``.
+
+        Args:
+            subscription: Subscription previously returned by ``subscribe``.
+
+        Raises:
+            ValueError: If the subscription is not currently registered.
+        """
+        self.subscriptions.remove(subscription)
+
+    async def publish(self, changes: list[FieldChange]) -> None:
+        """Deliver changes to every subscription with matching changes.
+
+        Subscriptions are awaited one after another in registration order and
+        are skipped when none of the changes match them.
+
+        Args:
+            changes: Changes reported by ``apply_message``.
+        """
+        if not changes:
+            return
+        for subscription in list(self.subscriptions):
+            matching = [change for change in changes if subscription.matches(change)]
+            if matching:
+                await subscription.callback(matching)
+
+    @property
+    def systems(self) -> list[System]:
+        """Return the systems updated by this instance.
+
+        Returns:
+            System objects previously loaded from the GraphQL API.
+        """
+        return self._systems
+
+    @systems.setter
+    def systems(self, systems: list[System]) -> None:
+        """Replace the updated systems and rebuild the indexes.
+
+        Args:
+            systems: System objects loaded from the GraphQL API.
+        """
+        self._systems = systems
+        self._reindex_systems()
+
+    def _reindex_systems(self) -> None:
+        """Rebuild the serial index and drop raw zone indexes."""
+        self._systems_by_serial: dict[str, System] = {
+            system.profile.serial: system for system in self._systems
+        }
+        self._status_indexes: dict[str, _RawZoneIndex] = {}
+        self._config_indexes: dict[str, _RawZoneIndex] = {}
 
     def carrier_system(self, serial_id: str) -> System:
         """Return the loaded system with the requested serial number.
@@ -58,23 +313,433 @@ class WebsocketDataUpdater:
         Raises:
             ValueError: If no loaded system has the requested serial number.
         """
-        for system in self.systems:
-            if system.profile.serial == serial_id:
-                return system
-        raise ValueError(f"No carrier_system found for serial {serial_id}")
+        system = self._systems_by_serial.get(serial_id)
+        if system is None or system.profile.serial != serial_id:
+            # The list may have been changed in place since it was assigned.
+            self._reindex_systems()
+            system = self._systems_by_serial.get(serial_id)
+        if system is None:
+            raise ValueError(f"No carrier_system found for serial {serial_id}")
+        return system
+
+    def _raw_index(
+        self,
+        indexes: dict[str, _RawZoneIndex],
+        serial_id: str,
+        raw: dict[str, Any],
+        *,
+        rebuild: bool = False,
+    ) -> _RawZoneIndex:
+        """Return the zone index for a raw payload, rebuilding it when stale.
+
+        Args:
+            indexes: Status or config indexes keyed by serial.
+            serial_id: Carrier system serial number.
+            raw: Current raw payload of the system's model.
+            rebuild: Whether to rebuild even when the index is current.
+
+        Returns:
+            An index bound to ``raw``.
+        """
+        index = indexes.get(serial_id)
+        if (
+            rebuild
+            or index is None
+            or index.raw is not raw
+            or index.zones_list is not raw.get("zones")
+        ):
+            index = indexes[serial_id] = _RawZoneIndex.build(raw)
+        return index
+
+    def _raw_zone(
+        self,
+        indexes: dict[str, _RawZoneIndex],
+        serial_id: str,
+        raw: dict[str, Any],
+        zone_id: str,
+    ) -> dict[str, Any]:
+        """Return a raw zone by id, rebuilding the index once on a miss.
+
+        Args:
+            indexes: Status or config indexes keyed by serial.
+            serial_id: Carrier system serial number.
+            raw: Current raw payload of the system's model.
+            zone_id: Zone identifier, compared as a string.
+
+        Returns:
+            The matching raw zone dictionary.
+
+        Raises:
+            ValueError: If the payload has no zone with the requested id.
+        """
+        zone_id = str(zone_id)
+        zone = self._raw_index(indexes, serial_id, raw).zones.get(zone_id)
+        if zone is None:
+            zone = self._raw_index(indexes, serial_id, raw, rebuild=True).zones.get(zone_id)
+        if zone is None:
+            raise ValueError(f"id: {zone_id} not found in collection")
+        return zone
+
+    def _raw_config_activity(
+        self, serial_id: str, raw: dict[str, Any], zone_id: str, activity_id: str
+    ) -> dict[str, Any]:
+        """Return a raw config zone activity by id, rebuilding once on a miss.
+
+        Args:
+            serial_id: Carrier system serial number.
+            raw: Current raw config payload of the system.
+            zone_id: Zone identifier, compared as a string.
+            activity_id: Activity identifier, compared as a string.
+
+        Returns:
+            The matching raw activity dictionary.
+
+        Raises:
+            ValueError: If the zone has no activity with the requested id.
+        """
+        key = (str(zone_id), str(activity_id))
+        activity = self._raw_index(self._config_indexes, serial_id, raw).activities.get(key)
+        if activity is None:
+            activity = self._raw_index(
+                self._config_indexes, serial_id, raw, rebuild=True
+            ).activities.get(key)
+        if activity is None:
+            raise ValueError(f"id: {activity_id} not found in collection")
+        return activity
 
     async def message_handler(self, websocket_message: str) -> None:
-        """Apply one raw Carrier websocket message to the matching system.
+        """Apply one raw Carrier websocket message and publish its changes.
 
-        Status messages update the raw status payload, refresh its timestamp,
-        and rebuild the ``Status`` model. Config messages merge zone activity and
-        program changes into the raw config payload before rebuilding ``Config``.
+        With ``status_coalesce_seconds`` set, InfinityStatus messages are held
+        per serial and merged until no message for the serial arrived for that
+        long, or until ``status_coalesce_max_delay_seconds`` passed since the
+        first held message. The merged deltas are then applied and published
+        once. Other messages are applied immediately.
 
         Args:
             websocket_message: JSON websocket message text from Carrier realtime
                 updates.
         """
         websocket_message_json = loads(websocket_message)
+        serial_id = websocket_message_json.get("deviceId")
+        if (
+            self.status_coalesce_seconds is not None
+            and serial_id is not None
+            and websocket_message_json.get("messageType") == "InfinityStatus"
+        ):
+            self._hold_status(self.carrier_system(serial_id).profile.serial, websocket_message_json)
+            return
+        await self.publish(self._apply_message_json(websocket_message_json))
+
+    def _hold_status(self, serial_id: str, message_json: dict[str, Any]) -> None:
+        """Merge a status message into the serial's pending deltas.
+
+        Args:
+            serial_id: Carrier system serial number.
+            message_json: Parsed InfinityStatus message.
+        """
+        loop = get_running_loop()
+        now = loop.time()
+        pending = self._pending_statuses.get(serial_id)
+        if pending is None:
+            pending = self._pending_statuses[serial_id] = _PendingStatus(now)
+        pending.merge(message_json)
+        if pending.timer is not None:
+            pending.timer.cancel()
+        delay = min(
+            self.status_coalesce_seconds or 0.0,
+            pending.first_received_at + self.status_coalesce_max_delay_seconds - now,
+        )
+        pending.timer = loop.call_later(max(delay, 0.0), self._schedule_flush, serial_id)
+
+    def _schedule_flush(self, serial_id: str) -> None:
+        """Start a task that applies a serial's pending status deltas.
+
+        Args:
+            serial_id: Carrier system serial number.
+        """
+        task = create_task(
+            self._flush_logged(serial_id), name=f"carrier_api_status_flush:{serial_id}"
+        )
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_logged(self, serial_id: str) -> None:
+        """Flush a serial from its timer, logging failures.
+
+        Args:
+            serial_id: Carrier system serial number.
+        """
+        try:
+            await self.flush(serial_id)
+        except Exception:
+            _LOGGER.exception("Unable to apply coalesced status for %s", serial_id)
+
+    async def flush(self, serial_id: str | None = None) -> None:
+        """Apply and publish pending coalesced status deltas now.
+
+        Args:
+            serial_id: Serial to flush. ``None`` flushes every serial.
+        """
+        serial_ids = list(self._pending_statuses) if serial_id is None else [serial_id]
+        for pending_serial in serial_ids:
+            pending = self._pending_statuses.pop(pending_serial, None)
+            if pending is None:
+                continue
+            if pending.timer is not None:
+                pending.timer.cancel()
+            await self.publish(self._apply_message_json(pending.as_message()))
+
+    async def resync(
+        self,
+        api_connection_graphql: ApiConnectionGraphql,
+        serials: list[str] | None = None,
+        *,
+        config: bool = False,
+    ) -> list[FieldChange]:
+        """Fetch fresh status, and optionally config, and patch the models.
+
+        Pending coalesced status deltas are applied first so they cannot
+        overwrite the fresher data. Each serial is fetched with its own
+        targeted query, concurrently. The models are patched in place as if
+        the differences had arrived as websocket messages, and the changes are
+        published to subscriptions. A serial whose queries fail is logged and
+        left as it was, without affecting the other serials.
+
+        Args:
+            api_connection_graphql: Connection used for the per-serial queries.
+            serials: Serials to resync. ``None`` resyncs every system.
+            config: Whether to fetch config as well as status.
+
+        Returns:
+            The model attributes whose values changed.
+        """
+        await self.flush()
+        systems = [
+            self.carrier_system(serial)
+            for serial in (
+                serials
+                if serials is not None
+                else [system.profile.serial for system in self.systems]
+            )
+        ]
+        refreshed = await gather(
+            *(
+                self._refresh_for_resync(
+                    api_connection_graphql, system.profile.serial, config=config
+                )
+                for system in systems
+            )
+        )
+        changes: list[FieldChange] = []
+        for system, models in zip(systems, refreshed, strict=True):
+            if models is None:
+                continue
+            status, fresh_config = models
+            changes.extend(self._resync_status(system, status.raw))
+            if fresh_config is not None:
+                changes.extend(self._resync_config(system, fresh_config.raw))
+        await self.publish(changes)
+        return changes
+
+    def resync_on_reconnect(
+        self, api_websocket: ApiWebsocket, *, config: bool = False
+    ) -> StateCallback:
+        """Resync every system whenever the websocket reconnects.
+
+        Updates sent while the websocket was down are lost, so after each
+        reconnect (but not the first connection) ``resync`` fetches fresh data
+        through the websocket's API connection. The resync runs as a separate
+        task, so the websocket reads messages and sends heartbeats meanwhile. A
+        reconnect cancels a resync that is still running and starts a new one.
+
+        Args:
+            api_websocket: Websocket manager whose reconnects trigger a resync.
+            config: Whether to fetch config as well as status.
+
+        Returns:
+            The registered state callback, for ``state_callback_remove``.
+        """
+        connected_before = False
+
+        async def resync_after_reconnect(connection_state: ConnectionStates) -> None:
+            """Resync when the websocket connects again.
+
+            Args:
+                connection_state: New websocket connection state.
+            """
+            nonlocal connected_before
+            if connection_state != ConnectionStates.CONNECTED:
+                return
+            if connected_before:
+                self._start_resync(api_websocket.api_connection_graphql, config=config)
+            connected_before = True
+
+        api_websocket.state_callback_add(resync_after_reconnect)
+        return resync_after_reconnect
+
+    def _start_resync(self, api_connection_graphql: ApiConnectionGraphql, *, config: bool) -> None:
+        """Start a resync task, replacing one that is still running.
+
+        Args:
+            api_connection_graphql: Connection used for the per-serial queries.
+            config: Whether to fetch config as well as status.
+        """
+        if self._resync_task is not None:
+            self._resync_task.cancel()
+        self._resync_task = create_task(
+            self._resync_logged(api_connection_graphql, config=config), name="carrier_api_resync"
+        )
+
+    async def _resync_logged(
+        self, api_connection_graphql: ApiConnectionGraphql, *, config: bool
+    ) -> None:
+        """Resync every system from a reconnect, logging failures.
+
+        Args:
+            api_connection_graphql: Connection used for the per-serial queries.
+            config: Whether to fetch config as well as status.
+        """
+        try:
+            await self.resync(api_connection_graphql, config=config)
+        except Exception:
+            _LOGGER.exception("Unable to resync after websocket reconnect")
+
+    async def _refresh_for_resync(
+        self, api_connection_graphql: ApiConnectionGraphql, serial_id: str, *, config: bool
+    ) -> tuple[Status, Config | None] | None:
+        """Fetch the fresh models of one serial for ``resync``.
+
+        Args:
+            api_connection_graphql: Connection used for the queries.
+            serial_id: Carrier system serial number.
+            config: Whether to fetch config as well as status.
+
+        Returns:
+            The fresh status and, when requested, config, or ``None`` when a
+            query failed.
+        """
+        try:
+            if config:
+                return await gather(
+                    api_connection_graphql.refresh_status(serial_id),
+                    api_connection_graphql.refresh_config(serial_id),
+                )
+            return await api_connection_graphql.refresh_status(serial_id), None
+        except CarrierApiError as error:
+            _LOGGER.warning("Carrier resync failed for %s", serial_id, exc_info=error)
+            return None
+
+    def _resync_status(self, system: System, raw: dict[str, Any]) -> list[FieldChange]:
+        """Patch a system's status model from a freshly fetched payload.
+
+        Args:
+            system: System whose status is patched.
+            raw: Fresh ``infinityStatus`` payload.
+
+        Returns:
+            The status attributes whose values changed.
+        """
+        serial_id = system.profile.serial
+        status = system.status
+        zone_jsons = {
+            str(zone_json["id"]): zone_json
+            for zone_json in raw.get("zones") or []
+            if _ENABLED(zone_json) == "on"
+        }
+        if [zone.api_id for zone in status.zones] != list(zone_jsons):
+            system.status = Status(raw, lazy=status.lazy)
+            return [
+                FieldChange(serial_id, "status", None, "zones", status.zones, system.status.zones)
+            ]
+        # Load every setting from the old payload so a lazy status reports its changes.
+        status.load_fields()
+        status.raw = raw
+        changes: list[FieldChange] = []
+        for zone in status.zones:
+            changes.extend(
+                _field_changes(
+                    serial_id, "status", zone.api_id, zone.apply_json(zone_jsons[zone.api_id])
+                )
+            )
+        changes.extend(
+            _field_changes(
+                serial_id,
+                "status",
+                None,
+                status.apply_json(isoparse(_UTC_TIME(raw))),
+            )
+        )
+        return changes
+
+    def _resync_config(self, system: System, raw: dict[str, Any]) -> list[FieldChange]:
+        """Patch a system's config model from a freshly fetched payload.
+
+        Args:
+            system: System whose config is patched.
+            raw: Fresh ``infinityConfig`` payload.
+
+        Returns:
+            The config attributes whose values changed.
+        """
+        serial_id = system.profile.serial
+        config = system.config
+        zone_jsons = {
+            str(zone_json["id"]): zone_json
+            for zone_json in raw.get("zones") or []
+            if _ENABLED(zone_json) == "on"
+        }
+        if [zone.api_id for zone in config.zones] != list(zone_jsons):
+            system.config = Config(raw, lazy=config.lazy)
+            return [
+                FieldChange(serial_id, "config", None, "zones", config.zones, system.config.zones)
+            ]
+        # Load every setting from the old payload so a lazy config reports its changes.
+        config.load_fields()
+        config.raw = raw
+        changes = _field_changes(serial_id, "config", None, config.apply_json())
+        vacation_json = config.vacation_activity_json()
+        for zone in config.zones:
+            changes.extend(
+                _field_changes(
+                    serial_id,
+                    "config",
+                    zone.api_id,
+                    zone.apply_json(zone_jsons[zone.api_id], vacation_json),
+                )
+            )
+        return changes
+
+    def apply_message(self, websocket_message: str) -> list[FieldChange]:
+        """Apply one raw Carrier websocket message and report what changed.
+
+        Status messages merge zone and system deltas into the raw status
+        payload, refresh its timestamp, and patch the touched ``StatusZone``
+        models and the ``Status`` settings in place. Config messages merge zone
+        activity and program changes into the raw config payload and patch the
+        touched ``ConfigZone`` models and the ``Config`` settings in place.
+        A delta that enables or disables a zone rebuilds the whole model and is
+        reported as a single ``zones`` change.
+
+        Args:
+            websocket_message: JSON websocket message text from Carrier realtime
+                updates.
+
+        Returns:
+            The model attributes whose values changed, empty for messages that
+            do not target a system or change nothing.
+        """
+        return self._apply_message_json(loads(websocket_message))
+
+    def _apply_message_json(self, websocket_message_json: dict[str, Any]) -> list[FieldChange]:
+        """Apply one parsed Carrier websocket message and report what changed.
+
+        Args:
+            websocket_message_json: Parsed websocket message; it is consumed.
+
+        Returns:
+            The model attributes whose values changed.
+        """
         message_type = websocket_message_json.pop("messageType", None)
         serial_id = websocket_message_json.pop("deviceId", None)
         _timestamp = websocket_message_json.pop("timestamp", None)
@@ -83,41 +748,143 @@ class WebsocketDataUpdater:
             _LOGGER.debug(
                 "Received message without deviceId, skipping messageType=%s", message_type
             )
-            return
+            return []
         system = self.carrier_system(serial_id=serial_id)
-        if system is None:
-            return
         match message_type:
             case "InfinityStatus":
-                _LOGGER.debug("InfinityStatus received: %s", websocket_message)
-                zones = websocket_message_json.pop("zones", [])
-                for zone in zones:
-                    _timestamp = zone.pop("timestamp", None)
-                    stale_zone = find_by_id(system.status.raw["zones"], zone["id"])
-                    always_merger.merge(stale_zone, zone)
-                merged_status = always_merger.merge(system.status.raw, websocket_message_json)
-                merged_status.update({"utcTime": datetime.now(UTC).isoformat()})
-                system.status = Status(merged_status)
+                _LOGGER.debug("InfinityStatus received: %s", websocket_message_json)
+                return self._apply_status(system, websocket_message_json)
             case "InfinityConfig":
-                _message_id = websocket_message_json.pop("id", None)
-                _config_id = websocket_message_json.pop("infinitySystemConfigurationId", None)
-                _LOGGER.debug("InfinityConfig received: %s", websocket_message)
-                zones = websocket_message_json.pop("zones", [])
-                for zone in zones:
-                    _timestamp = zone.pop("timestamp", None)
-                    if "id" in zone:
-                        zone_id = zone["id"]
-                        stale_zone = find_by_id(system.config.raw["zones"], zone_id)
-                        activities = zone.pop("activities", [])
-                        for activity in activities:
-                            _timestamp = activity.pop("timestamp", None)
-                            _zone_configuration_id = activity.pop("zoneConfigurationId", None)
-                            _fan_setting_id = activity.pop("fanSettingId", None)
-                            stale_activity = find_by_id(stale_zone["activities"], activity["id"])
-                            if stale_activity is not None:
-                                always_merger.merge(stale_activity, activity)
-                        always_merger.merge(stale_zone, zone)
-                always_merger.merge(system.config.raw, websocket_message_json)
-                system.config = Config(system.config.raw)
+                _LOGGER.debug("InfinityConfig received: %s", websocket_message_json)
+                return self._apply_config(system, websocket_message_json)
             case _:
-                _LOGGER.error("Received unknown message: %s", websocket_message)
+                _LOGGER.error("Received unknown message: %s", websocket_message_json)
+        return []
+
+    def _apply_status(self, system: System, message_json: dict[str, Any]) -> list[FieldChange]:
+        """Merge a status delta into a system and patch its status model.
+
+        Args:
+            system: System that the message targets.
+            message_json: Status message without its envelope keys.
+
+        Returns:
+            The status attributes whose values changed.
+        """
+        serial_id = system.profile.serial
+        status = system.status
+        zones = message_json.pop("zones", [])
+        rebuild = any("enabled" in zone for zone in zones)
+        # Decode the fields the delta touches before merging it, so their old
+        # values are known; other fields of a lazy status stay undecoded.
+        settings = status.load_fields(message_json) if not rebuild else ()
+        zone_fields: dict[str, tuple[StatusZone, tuple[str, ...]]] = {}
+        for zone in zones:
+            _timestamp = zone.pop("timestamp", None)
+            status_zone = status.zone(zone["id"]) if not rebuild else None
+            if status_zone is not None:
+                zone_id = str(zone["id"])
+                _, loaded = zone_fields.get(zone_id, (status_zone, ()))
+                names = tuple(dict.fromkeys((*loaded, *status_zone.load_fields(zone))))
+                zone_fields[zone_id] = (status_zone, names)
+            stale_zone = self._raw_zone(self._status_indexes, serial_id, status.raw, zone["id"])
+            always_merger.merge(stale_zone, zone)
+        merged_status = always_merger.merge(status.raw, message_json)
+        now = datetime.now(UTC)
+        merged_status.update({"utcTime": now.isoformat()})
+        if rebuild:
+            system.status = Status(merged_status, lazy=status.lazy)
+            return [
+                FieldChange(serial_id, "status", None, "zones", status.zones, system.status.zones)
+            ]
+        changes: list[FieldChange] = []
+        for zone_id, (status_zone, names) in zone_fields.items():
+            changes.extend(
+                _field_changes(serial_id, "status", zone_id, status_zone.reload_fields(names))
+            )
+        status.time_stamp = now
+        changes.extend(_field_changes(serial_id, "status", None, status.reload_fields(settings)))
+        return changes
+
+    def _apply_config(self, system: System, message_json: dict[str, Any]) -> list[FieldChange]:
+        """Merge a config delta into a system and patch its config model.
+
+        Args:
+            system: System that the message targets.
+            message_json: Config message without its envelope keys.
+
+        Returns:
+            The config attributes whose values changed.
+        """
+        serial_id = system.profile.serial
+        config = system.config
+        _message_id = message_json.pop("id", None)
+        _config_id = message_json.pop("infinitySystemConfigurationId", None)
+        zones = message_json.pop("zones", [])
+        touched_zone_ids: list[str] = []
+        rebuild = any("enabled" in zone for zone in zones)
+        settings = config.load_fields(message_json) if not rebuild else ()
+        if config.lazy and not rebuild and (zones or VACATION_KEYS.intersection(message_json)):
+            # Build the zones of a lazy config from the payload before the delta.
+            config.load_fields(("zones",))
+        for zone in zones:
+            _timestamp = zone.pop("timestamp", None)
+            if "id" in zone:
+                zone_id = zone["id"]
+                stale_zone = self._raw_zone(self._config_indexes, serial_id, config.raw, zone_id)
+                activities = zone.pop("activities", [])
+                for activity in activities:
+                    _timestamp = activity.pop("timestamp", None)
+                    _zone_configuration_id = activity.pop("zoneConfigurationId", None)
+                    _fan_setting_id = activity.pop("fanSettingId", None)
+                    # Keep the raw id as loaded; messages may send it as a number.
+                    activity_id = activity.pop("id")
+                    stale_activity = self._raw_config_activity(
+                        serial_id, config.raw, zone_id, activity_id
+                    )
+                    always_merger.merge(stale_activity, activity)
+                if isinstance(stale_zone.get("program"), dict) and "program" in zone:
+                    # Merge into a copy so the model's previous program can be compared.
+                    stale_zone["program"] = deepcopy(stale_zone["program"])
+                always_merger.merge(stale_zone, zone)
+                touched_zone_ids.append(str(zone_id))
+        always_merger.merge(config.raw, message_json)
+        if rebuild:
+            system.config = Config(config.raw, lazy=config.lazy)
+            return [
+                FieldChange(serial_id, "config", None, "zones", config.zones, system.config.zones)
+            ]
+        changes = _field_changes(serial_id, "config", None, config.reload_fields(settings))
+        if VACATION_KEYS.intersection(message_json):
+            touched_zone_ids = [zone.api_id for zone in config.zones]
+        vacation_json = config.vacation_activity_json()
+        for zone_id in dict.fromkeys(touched_zone_ids):
+            config_zone = config.zone(zone_id)
+            if config_zone is not None:
+                raw_zone = self._raw_zone(self._config_indexes, serial_id, config.raw, zone_id)
+                changes.extend(
+                    _field_changes(
+                        serial_id,
+                        "config",
+                        config_zone.api_id,
+                        config_zone.apply_json(raw_zone, vacation_json),
+                    )
+                )
+        return changes
+
+
+def _field_changes(
+    serial_id: str, section: str, zone_id: str | None, changes: FieldChanges
+) -> list[FieldChange]:
+    """Attach a system, model section, and zone to model attribute changes.
+
+    Args:
+        serial_id: Carrier system serial number.
+        section: Model that changed, ``"status"`` or ``"config"``.
+        zone_id: Carrier zone id, or ``None`` for system-level attributes.
+        changes: ``(attribute, old value, new value)`` tuples from a model.
+
+    Returns:
+        One ``FieldChange`` per changed attribute.
+    """
+    return [FieldChange(serial_id, section, zone_id, name, old, new) for name, old, new in changes]
@@ -0,0 +1,419 @@
+"""Local micro-benchmarks for Carrier API client hot paths.
+
+This module is a development harness, not part of the automated pytest suite.
+It times CPU-bound work the client repeats on every poll or realtime message so
+optimizations can be compared before and after a change on the same machine.
+Results are wall-clock timings, or allocated bytes for memory benchmarks, and
+vary between runs; compare them relative to each other rather than as absolute
+numbers.
+
+Run it through the repository helper script so it uses the repository virtual
+environment: ``scripts/benchmark``. Pass benchmark names to run a subset and
+``--iterations`` to change how many calls each timing or allocation covers.
+"""
+
+from argparse import ArgumentParser
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from json import loads
+from pathlib import Path
+from timeit import timeit
+from tracemalloc import start, stop, take_snapshot
+from typing import Any
+
+from gql import gql
+
+from carrier_api.config import Config
+from carrier_api.energy import Energy
+from carrier_api.graphql_documents import DOCUMENT_SOURCES, graphql_document
+from carrier_api.profile import Profile
+from carrier_api.status import Status
+from carrier_api.system import System, expand_schedules
+from carrier_api.util import json_path
+
+DEFAULT_ITERATIONS = 1000
+FIXTURES = Path(__file__).resolve().parents[2] / "tests" / "graphql"
+SYSTEMS_FIXTURE = FIXTURES / "systems.json"
+ENERGY_FIXTURE = FIXTURES / "energy.json"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing for one benchmarked callable."""
+
+    name: str
+    iterations: int
+    seconds: float
+
+    @property
+    def microseconds_per_call(self) -> float:
+        """Return the average wall-clock cost of one call.
+
+        Returns:
+            Average microseconds per call across all iterations.
+        """
+        return self.seconds / self.iterations * 1_000_000
+
+
+@dataclass(frozen=True)
+class MemoryResult:
+    """Memory allocated by repeated calls to one benchmarked callable."""
+
+    name: str
+    iterations: int
+    allocated_bytes: int
+
+    @property
+    def bytes_per_call(self) -> float:
+        """Return the average memory kept alive by one call.
+
+        Returns:
+            Average bytes per call across all iterations.
+        """
+        return self.allocated_bytes / self.iterations
+
+
+def run_benchmark(name: str, function: Callable[[], Any], iterations: int) -> BenchmarkResult:
+    """Time repeated calls to a callable.
+
+    Args:
+        name: Label printed with the result.
+        function: Zero-argument callable to time.
+        iterations: Number of calls to time.
+
+    Returns:
+        The total and per-call timing for the callable.
+    """
+    return BenchmarkResult(name, iterations, timeit(function, number=iterations))
+
+
+def run_memory_benchmark(name: str, function: Callable[[], Any], iterations: int) -> MemoryResult:
+    """Measure the memory held by the results of repeated calls to a callable.
+
+    The callable runs once before measuring so caches it fills are not
+    counted, and every result is kept alive until the allocations are read.
+
+    Args:
+        name: Label printed with the result.
+        function: Zero-argument callable whose results are measured.
+        iterations: Number of results to keep alive.
+
+    Returns:
+        The total and per-call bytes allocated for the results.
+    """
+    function()
+    start()
+    try:
+        before = take_snapshot()
+        results = [function() for _ in range(iterations)]
+        after = take_snapshot()
+    finally:
+        stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del results
+    return MemoryResult(name, iterations, allocated)
+
+
+def graphql_parse_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """Compare per-call GraphQL parsing with the shared document registry.
+
+    Args:
+        iterations: Number of calls to time for each variant.
+
+    Returns:
+        Timings for parsing ``getInfinitySystems`` on every call and for
+        reading it from the parsed document registry.
+    """
+    operation_name = "getInfinitySystems"
+    source = DOCUMENT_SOURCES[operation_name]
+    return [
+        run_benchmark(f"gql() per call: {operation_name}", lambda: gql(source), iterations),
+        run_benchmark(
+            f"graphql_document(): {operation_name}",
+            lambda: graphql_document(operation_name),
+            iterations,
+        ),
+    ]
+
+
+def split_key_json_value(
+    json: Mapping[str, Any] | list[Any],
+    key: str,
+    callable_to_cast: Callable[[Any], Any] | None = None,
+) -> Any:
+    """Resolve a JSON path the way ``safely_get_json_value`` did before ``JsonPath``.
+
+    Kept as the baseline for the ``json-path`` benchmark: the key is split on
+    every call and lists are walked by catching the ``TypeError`` of a string
+    index.
+
+    Args:
+        json: Mapping or list to traverse.
+        key: Dot-separated lookup path.
+        callable_to_cast: Optional callable used to convert the resolved value.
+
+    Returns:
+        The resolved and optionally cast value, or ``None``.
+    """
+    value: Any = json
+    for x in key.split("."):
+        if value is not None:
+            try:
+                value = value[x]
+            except TypeError, KeyError:
+                try:
+                    value = value[int(x)]
+                except TypeError, KeyError, ValueError, IndexError:
+                    value = None
+    try:
+        if value.lower() == "none":
+            value = None
+    except AttributeError:
+        pass
+    if callable_to_cast is not None and value is not None:
+        try:
+            value = callable_to_cast(value)
+        except ValueError:
+            value = None
+    return value
+
+
+def build_fixture_models(system_json: dict[str, Any]) -> None:
+    """Build the profile, status, and config models of one fixture system.
+
+    Args:
+        system_json: One ``infinitySystems`` entry.
+    """
+    Profile(raw=system_json["profile"])
+    Status(raw=system_json["status"])
+    Config(raw=system_json["config"])
+
+
+def read_lazy_fixture_models(system_json: dict[str, Any]) -> None:
+    """Build lazy status and config models and read one zone from each.
+
+    Args:
+        system_json: One ``infinitySystems`` entry.
+    """
+    status = Status(raw=system_json["status"], lazy=True)
+    config = Config(raw=system_json["config"], lazy=True)
+    _ = status.outdoor_temperature, status.zones[0].temperature, config.zones[0].hold
+
+
+def leaf_paths(json: Any, prefix: str = "") -> list[str]:
+    """List the dot-separated path of every scalar in a JSON value.
+
+    Args:
+        json: Decoded JSON value to walk.
+        prefix: Path of ``json`` itself.
+
+    Returns:
+        Paths to every scalar, with list positions as numeric segments.
+    """
+    if isinstance(json, dict):
+        items: list[tuple[str, Any]] = list(json.items())
+    elif isinstance(json, list):
+        items = [(str(index), item) for index, item in enumerate(json)]
+    else:
+        return [prefix]
+    return [
+        path
+        for segment, item in items
+        for path in leaf_paths(item, f"{prefix}.{segment}" if prefix else segment)
+    ]
+
+
+def json_path_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """Compare compiled JSON getters with per-call key splitting.
+
+    Both variants resolve the path of every scalar in the first system of
+    ``tests/graphql/systems.json``, so each call covers nested dicts, list
+    indexes, and ``"none"`` normalization. Model construction, which uses the
+    compiled getters, is timed as well.
+
+    Args:
+        iterations: Number of calls to time for each variant.
+
+    Returns:
+        Timings for the split-key baseline, for ``json_path`` getters, for
+        building the profile, status, and config models, and for reading a few
+        fields of lazily built status and config models.
+    """
+    system_json = loads(SYSTEMS_FIXTURE.read_text())["infinitySystems"][0]
+    paths = leaf_paths(system_json)
+    getters = [json_path(path) for path in paths]
+
+    def split_keys() -> None:
+        for path in paths:
+            split_key_json_value(system_json, path)
+
+    def compiled() -> None:
+        for getter in getters:
+            getter(system_json)
+
+    label = f"{len(paths)} systems.json paths"
+    return [
+        run_benchmark(f"split key per call: {label}", split_keys, iterations),
+        run_benchmark(f"json_path() getters: {label}", compiled, iterations),
+        run_benchmark(
+            "build Profile, Status, Config: systems.json",
+            lambda: build_fixture_models(system_json),
+            iterations,
+        ),
+        run_benchmark(
+            "lazy Status, Config, read one zone: systems.json",
+            lambda: read_lazy_fixture_models(system_json),
+            iterations,
+        ),
+    ]
+
+
+def schedule_benchmarks(iterations: int) -> list[BenchmarkResult]:
+    """Time schedule lookups on an indexed zone program.
+
+    Args:
+        iterations: Number of calls to time for each variant.
+
+    Returns:
+        Timings for resolving the scheduled activity and the next activity time
+        of one zone, for serializing the whole config, which resolves the
+        scheduled activity of every zone, and for expanding every zone program
+        into intervals over the next seven days.
+    """
+    system_json = loads(SYSTEMS_FIXTURE.read_text())["infinitySystems"][0]
+    config = Config(raw=system_json["config"])
+    zone = config.zones[0]
+    energy_json = loads(ENERGY_FIXTURE.read_text())["infinityEnergy"]
+    systems = [
+        build_fixture_system(system, energy_json)
+        for system in loads(SYSTEMS_FIXTURE.read_text())["infinitySystems"]
+    ]
+    window_start = datetime.now(UTC)
+    window_end = window_start + timedelta(days=7)
+    return [
+        run_benchmark(
+            "ConfigZone.current_scheduled_activity()", zone.current_scheduled_activity, iterations
+        ),
+        run_benchmark("ConfigZone.next_activity_time()", zone.next_activity_time, iterations),
+        run_benchmark("Config.as_dict(): systems.json", config.as_dict, iterations),
+        run_benchmark(
+            "expand_schedules() 7 days: systems.json",
+            lambda: expand_schedules(systems, window_start, window_end),
+            iterations,
+        ),
+    ]
+
+
+def build_fixture_system(system_json: dict[str, Any], energy_json: dict[str, Any]) -> System:
+    """Build a system aggregate from fixture payloads.
+
+    Args:
+        system_json: One ``infinitySystems`` entry.
+        energy_json: ``infinityEnergy`` object for the system.
+
+    Returns:
+        The system with its profile, status, config, and energy models.
+    """
+    return System(
+        profile=Profile(raw=system_json["profile"]),
+        status=Status(raw=system_json["status"]),
+        config=Config(raw=system_json["config"]),
+        energy=Energy(raw=energy_json),
+    )
+
+
+def memory_benchmarks(iterations: int) -> list[MemoryResult]:
+    """Measure the resident size of parsed system models.
+
+    Every system shares the decoded fixture payloads, so the result counts the
+    parsed models themselves rather than the raw JSON they keep a reference to.
+
+    Args:
+        iterations: Number of systems to keep alive while measuring.
+
+    Returns:
+        Bytes allocated per ``System`` built from the ``tests/graphql`` fixtures.
+    """
+    system_json = loads(SYSTEMS_FIXTURE.read_text())["infinitySystems"][0]
+    energy_json = loads(ENERGY_FIXTURE.read_text())["infinityEnergy"]
+    return [
+        run_memory_benchmark(
+            "System models: systems.json, energy.json",
+            lambda: build_fixture_system(system_json, energy_json),
+            iterations,
+        )
+    ]
+
+
+BENCHMARKS: dict[str, Callable[[int], Sequence[BenchmarkResult | MemoryResult]]] = {
+    "graphql-parse": graphql_parse_benchmarks,
+    "json-path": json_path_benchmarks,
+    "memory": memory_benchmarks,
+    "schedule": schedule_benchmarks,
+}
+
+
+def format_result(result: BenchmarkResult | MemoryResult) -> str:
+    """Format one benchmark result as a report line.
+
+    Args:
+        result: Benchmark timing or memory measurement to format.
+
+    Returns:
+        A fixed-width line with the per-call cost and iteration count.
+    """
+    if isinstance(result, MemoryResult):
+        return (
+            f"{result.name:<60} {result.bytes_per_call:>12.0f} B/call  ({result.iterations} calls)"
+        )
+    return (
+        f"{result.name:<60} {result.microseconds_per_call:>12.2f} us/call"
+        f"  ({result.iterations} calls)"
+    )
+
+
+def run_benchmarks(names: Sequence[str], iterations: int) -> list[BenchmarkResult | MemoryResult]:
+    """Run the selected benchmarks in order.
+
+    Args:
+        names: Benchmark names from ``BENCHMARKS``. All benchmarks run when empty.
+        iterations: Number of calls to time for each variant.
+
+    Returns:
+        Results from every selected benchmark.
+    """
+    results: list[BenchmarkResult | MemoryResult] = []
+    for name in names or BENCHMARKS:
+        results.extend(BENCHMARKS[name](iterations))
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse command-line arguments, run benchmarks, and print a report.
+
+    Args:
+        argv: Optional argument list. Uses process arguments when omitted.
+    """
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help=f"Benchmarks to run. Runs all when omitted: {', '.join(BENCHMARKS)}.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of calls timed or measured for each benchmark variant.",
+    )
+    namespace = parser.parse_args(argv)
+    unknown = [name for name in namespace.benchmarks if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+    for result in run_benchmarks(namespace.benchmarks, namespace.iterations):
+        print(format_result(result))
+
+
+if __name__ == "__main__":
+    main()
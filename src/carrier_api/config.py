@@ -1,17 +1,59 @@
 """Configuration models and schedule helpers for Carrier systems."""
 
-from datetime import UTC, datetime
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
 from .const import ActivityTypes, FanModes
-from .util import safely_get_json_value
+from .util import (
+    FieldChanges,
+    LazyField,
+    LazyModel,
+    SlottedModel,
+    attribute_values,
+    changed_fields,
+    json_path,
+)
 
 if TYPE_CHECKING:
     from .status import StatusZone
 
+_ENABLED = json_path("enabled")
+_ACTIVITIES = json_path("activities")
+_TYPE = json_path("type")
+_ID = json_path("id")
+_HTSP = json_path("htsp", float)
+_CLSP = json_path("clsp", float)
+_ID_STR = json_path("id", str)
+_NAME = json_path("name")
+_HOLD_ACTIVITY = json_path("holdActivity", ActivityTypes)
+_HOLD = json_path("hold")
+_OTMR = json_path("otmr")
+_PROGRAM = json_path("program")
+_OCC_ENABLED = json_path("occEnabled")
+_ACTIVITY = json_path("activity", ActivityTypes)
+_ZONES = json_path("zones")
+_VACMAXT = json_path("vacmaxt")
+_VACMINT = json_path("vacmint")
+_VACFAN = json_path("vacfan")
+_CFGEM = json_path("cfgem")
+_MODE = json_path("mode")
+_HEATSOURCE = json_path("heatsource")
+_ETAG = json_path("etag")
+_FUELTYPE = json_path("fueltype")
+_GASUNIT = json_path("gasunit")
+_CFGFAN = json_path("cfgfan")
+_CFGUV = json_path("cfguv")
+_CFGHUMID = json_path("cfghumid")
+_HUMIDITY_HOME_RHTG = json_path("humidityHome.rhtg", int)
+
 _LOGGER = getLogger(__name__)
 
+# Config keys that feed the synthetic vacation activity of every zone.
+VACATION_KEYS = frozenset({"vacmaxt", "vacmint", "vacfan"})
+
 
 def active_schedule_periods(periods_json: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter a Carrier schedule period list down to enabled periods.
@@ -22,14 +64,255 @@ def active_schedule_periods(periods_json: list[dict[str, Any]]) -> list[dict[str
     Returns:
         A list containing only periods whose ``enabled`` value is ``"on"``.
     """
-    return list(
-        filter(lambda period: safely_get_json_value(period, "enabled") == "on", periods_json)
-    )
+    return list(filter(lambda period: _ENABLED(period) == "on", periods_json))
+
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def sunday_0_weekday(moment: date) -> int:
+    """Return the schedule day index of a date, as ``strftime("%w")`` does.
+
+    Args:
+        moment: Local date, or date and time.
+
+    Returns:
+        The weekday counted from Sunday as ``0``, which indexes a zone
+        program's ``day`` list.
+    """
+    return (moment.weekday() + 1) % 7
+
+
+def _clock_time(clock: str | None) -> time | None:
+    """Parse an ``"HH:MM"`` Carrier clock time.
+
+    Args:
+        clock: Raw clock time, such as a period ``time`` or a hold ``otmr``.
+
+    Returns:
+        The time of day, or ``None`` when the value is missing or not a clock
+        time.
+    """
+    try:
+        hours, minutes = str(clock).split(":")
+        return time(int(hours), int(minutes))
+    except ValueError:
+        return None
 
 
-class ConfigZoneActivity:
+def _period_minute(period_json: dict[str, Any]) -> int:
+    """Return the minute of the day a schedule period starts.
+
+    Args:
+        period_json: Raw period object with an ``"HH:MM"`` ``time``.
+
+    Returns:
+        Minutes after midnight.
+    """
+    hours, minutes = period_json["time"].split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+@dataclass(frozen=True)
+class ScheduleInterval:
+    """A span of time a zone's schedule keeps one activity.
+
+    Attributes:
+        start: When the activity starts.
+        end: When the next activity starts, or the end of the expanded window.
+        activity: Scheduled or held activity type, ``None`` when the zone has
+            no schedule to follow.
+        heat_set_point: Heating set point of the activity, when configured.
+        cool_set_point: Cooling set point of the activity, when configured.
+    """
+
+    start: datetime
+    end: datetime
+    activity: ActivityTypes | None
+    heat_set_point: float | None
+    cool_set_point: float | None
+
+
+@dataclass(frozen=True)
+class ZoneSchedule:
+    """Enabled periods of a zone's weekly program, indexed for lookups by time.
+
+    Periods are flattened into a week sorted by start minute, counted from
+    Sunday midnight, so the period active at a time and the next period after
+    it are found by binary search within a day instead of by scanning and
+    parsing the program.
+
+    Attributes:
+        program: Raw program the index was built from. ``ConfigZone`` rebuilds
+            the index when its ``program_json`` is no longer this object.
+        day_periods: Enabled raw periods of each day, Sunday first.
+        day_starts: Offset into ``minutes`` of each day's first period, with a
+            final entry for the end of the week.
+        minutes: Start of every enabled period in minutes since Sunday midnight.
+        activities: Activity type of every period, aligned with ``minutes``.
+        times: Raw ``"HH:MM"`` time of every period, aligned with ``minutes``.
+    """
+
+    program: dict[str, Any]
+    day_periods: tuple[tuple[dict[str, Any], ...], ...]
+    day_starts: tuple[int, ...]
+    minutes: tuple[int, ...]
+    activities: tuple[ActivityTypes | None, ...]
+    times: tuple[str, ...]
+
+    @classmethod
+    def from_program(cls, program_json: dict[str, Any]) -> ZoneSchedule:
+        """Index the enabled periods of a zone program.
+
+        Args:
+            program_json: Raw zone ``program`` with one ``day`` per weekday,
+                Sunday first.
+
+        Returns:
+            The indexed schedule.
+        """
+        day_periods = []
+        day_starts = [0]
+        minutes: list[int] = []
+        activities = []
+        times = []
+        for day, day_json in enumerate(program_json["day"]):
+            periods = sorted(active_schedule_periods(day_json["period"]), key=_period_minute)
+            day_periods.append(tuple(periods))
+            for period in periods:
+                minutes.append(day * MINUTES_PER_DAY + _period_minute(period))
+                activities.append(_ACTIVITY(period))
+                times.append(period["time"])
+            day_starts.append(len(minutes))
+        return cls(
+            program=program_json,
+            day_periods=tuple(day_periods),
+            day_starts=tuple(day_starts),
+            minutes=tuple(minutes),
+            activities=tuple(activities),
+            times=tuple(times),
+        )
+
+    def periods_on(self, day: int) -> list[dict[str, Any]]:
+        """Return the enabled periods of a schedule day.
+
+        Args:
+            day: Day index counted from Sunday as ``0``; wraps around the week.
+
+        Returns:
+            The day's enabled raw periods in start order.
+        """
+        return list(self.day_periods[day % 7])
+
+    def activity_at(self, moment: datetime) -> ActivityTypes | None:
+        """Return the scheduled activity type at a local time.
+
+        Args:
+            moment: Local date and time.
+
+        Returns:
+            The activity of the latest period of the day that started at or
+            before ``moment``, else the activity of the previous day's final
+            period, or ``None`` when neither day has enabled periods.
+        """
+        day = sunday_0_weekday(moment)
+        minute = day * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+        start, end = self.day_starts[day], self.day_starts[day + 1]
+        index = bisect_right(self.minutes, minute, start, end) - 1
+        if index >= start:
+            return self.activities[index]
+        yesterday = (day - 1) % 7
+        if self.day_starts[yesterday] == self.day_starts[yesterday + 1]:
+            return None
+        return self.activities[self.day_starts[yesterday + 1] - 1]
+
+    def transitions(
+        self, start: datetime, end: datetime
+    ) -> list[tuple[datetime, ActivityTypes | None]]:
+        """Expand the weekly program into the activity changes within a window.
+
+        Period times are wall-clock times in the timezone of ``start``, so
+        aware windows follow daylight saving changes and naive windows give
+        naive times. Unlike ``activity_at``, the activity in effect at
+        ``start`` carries over from the latest earlier period in the week,
+        however many days back it is.
+
+        Args:
+            start: Start of the window.
+            end: End of the window, excluded.
+
+        Returns:
+            ``(time, activity)`` for the activity in effect at ``start``,
+            followed by every later period that changes the activity before
+            ``end``. A program without enabled periods gives one ``None``
+            activity.
+        """
+        if not self.minutes:
+            return [(start, None)]
+        day = sunday_0_weekday(start)
+        minute = day * MINUTES_PER_DAY + start.hour * 60 + start.minute
+        # Index -1 wraps to the final period of the previous week.
+        transitions = [(start, self.activities[bisect_right(self.minutes, minute) - 1])]
+        current_date = start.date()
+        while current_date <= end.date():
+            day = sunday_0_weekday(current_date)
+            for index in range(self.day_starts[day], self.day_starts[day + 1]):
+                minute = self.minutes[index] - day * MINUTES_PER_DAY
+                moment = datetime.combine(current_date, time(*divmod(minute, 60)), start.tzinfo)
+                if moment >= end:
+                    return transitions
+                if moment > start and self.activities[index] != transitions[-1][1]:
+                    transitions.append((moment, self.activities[index]))
+            current_date += timedelta(days=1)
+        return transitions
+
+    def next_time_after(self, moment: datetime) -> str | None:
+        """Return the start time of the next scheduled period after a local time.
+
+        Args:
+            moment: Local date and time.
+
+        Returns:
+            The ``"HH:MM"`` time of the day's first period starting after
+            ``moment``, else of the next day's first period, or ``None`` when
+            neither day has one.
+        """
+        day = sunday_0_weekday(moment)
+        minute = day * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+        end = self.day_starts[day + 1]
+        index = bisect_right(self.minutes, minute, self.day_starts[day], end)
+        if index < end:
+            return self.times[index]
+        tomorrow = (day + 1) % 7
+        if self.day_starts[tomorrow] == self.day_starts[tomorrow + 1]:
+            return None
+        return self.times[self.day_starts[tomorrow]]
+
+
+def _zone_activity_jsons(
+    zone_json: dict[str, Any], vacation_json: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Return the activity payloads a zone is built from.
+
+    Args:
+        zone_json: Raw zone configuration from the Carrier API.
+        vacation_json: Synthetic vacation activity payload from the config.
+
+    Returns:
+        The zone's configured activities, followed by the vacation activity
+        when the config reports a vacation fan mode.
+    """
+    activity_jsons = list(_ACTIVITIES(zone_json) or [])
+    if vacation_json["fan"] is not None:
+        activity_jsons.append(vacation_json)
+    return activity_jsons
+
+
+class ConfigZoneActivity(SlottedModel):
     """Configured set points and fan mode for a zone activity."""
 
+    __slots__ = ("api_id", "cool_set_point", "fan", "heat_set_point", "type")
+
     def __init__(self, zone_activity_json: dict[str, Any]) -> None:
         """Build a zone activity from Carrier configuration data.
 
@@ -37,11 +320,32 @@ class ConfigZoneActivity:
             zone_activity_json: Raw activity object from a zone configuration,
                 including activity type, set points, and fan mode.
         """
-        self.type: ActivityTypes = ActivityTypes(safely_get_json_value(zone_activity_json, "type"))
-        self.api_id = safely_get_json_value(zone_activity_json, "id")
+        self._parse(zone_activity_json)
+
+    def apply_json(self, zone_activity_json: dict[str, Any]) -> FieldChanges:
+        """Re-parse this activity in place from its updated payload.
+
+        Args:
+            zone_activity_json: Raw activity object after a delta was merged.
+
+        Returns:
+            The attributes whose values changed.
+        """
+        before = attribute_values(self)
+        self._parse(zone_activity_json)
+        return changed_fields(before, attribute_values(self))
+
+    def _parse(self, zone_activity_json: dict[str, Any]) -> None:
+        """Set activity attributes from a Carrier zone activity payload.
+
+        Args:
+            zone_activity_json: Raw activity object from a zone configuration.
+        """
+        self.type: ActivityTypes = ActivityTypes(_TYPE(zone_activity_json))
+        self.api_id = _ID(zone_activity_json)
         self.fan: FanModes = FanModes(zone_activity_json["fan"])
-        self.heat_set_point: float = safely_get_json_value(zone_activity_json, "htsp", float)
-        self.cool_set_point: float = safely_get_json_value(zone_activity_json, "clsp", float)
+        self.heat_set_point: float = _HTSP(zone_activity_json)
+        self.cool_set_point: float = _CLSP(zone_activity_json)
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the activity configuration.
@@ -75,9 +379,23 @@ class ConfigZoneActivity:
         return str(self.as_dict())
 
 
-class ConfigZone:
+class ConfigZone(SlottedModel):
     """Configurable schedule, hold, and activity settings for one zone."""
 
+    __slots__ = (
+        "_activities_by_type",
+        "_indexed_activities",
+        "_schedule",
+        "activities",
+        "api_id",
+        "hold",
+        "hold_activity",
+        "hold_until",
+        "name",
+        "occupancy_enabled",
+        "program_json",
+    )
+
     def __init__(self, zone_json: dict[str, Any], vacation_json: dict[str, Any]) -> None:
         """Build zone configuration from Carrier zone and vacation settings.
 
@@ -86,22 +404,84 @@ class ConfigZone:
             vacation_json: Synthetic activity payload derived from system-level
                 vacation set points and fan mode.
         """
-        self.api_id = safely_get_json_value(zone_json, "id", str)
-        self.name: str = safely_get_json_value(zone_json, "name")
-        self.hold_activity: ActivityTypes = safely_get_json_value(
-            zone_json, "holdActivity", ActivityTypes
-        )
-        self.hold: bool = safely_get_json_value(zone_json, "hold") == "on"
-        self.hold_until: str = safely_get_json_value(zone_json, "otmr")
-        self.program_json: dict = safely_get_json_value(zone_json, "program")
-        self.occupancy_enabled: bool = safely_get_json_value(zone_json, "occEnabled") == "on"
-        self.activities = []
-        for zone_activity_json in safely_get_json_value(zone_json, "activities"):
-            self.activities.append(ConfigZoneActivity(zone_activity_json=zone_activity_json))
-        if vacation_json["fan"] is not None:
-            self.activities.append(ConfigZoneActivity(zone_activity_json=vacation_json))
-
-    def find_activity(self, activity_name: ActivityTypes) -> ConfigZoneActivity | None:
+        self._parse_settings(zone_json)
+        self.activities = [
+            ConfigZoneActivity(zone_activity_json=zone_activity_json)
+            for zone_activity_json in _zone_activity_jsons(zone_json, vacation_json)
+        ]
+        self._schedule: ZoneSchedule | None = None
+        self._indexed_activities: list[ConfigZoneActivity] | None = None
+        self._activities_by_type: dict[ActivityTypes, ConfigZoneActivity] = {}
+
+    def apply_json(self, zone_json: dict[str, Any], vacation_json: dict[str, Any]) -> FieldChanges:
+        """Re-parse this zone in place from its updated payload.
+
+        Activities are updated in place while the zone keeps the same activity
+        types, and their changes are reported as
+        ``activities.<type>.<attribute>``. Otherwise the activity list is
+        rebuilt and reported as a single ``activities`` change.
+
+        Args:
+            zone_json: Raw zone configuration after a delta was merged.
+            vacation_json: Synthetic vacation activity payload from the config.
+
+        Returns:
+            The attributes whose values changed.
+        """
+        before = attribute_values(self)
+        self._parse_settings(zone_json)
+        changes = changed_fields(before, attribute_values(self), ignored=("activities",))
+        activity_jsons = _zone_activity_jsons(zone_json, vacation_json)
+        if [activity.type.value for activity in self.activities] == [
+            _TYPE(activity_json) for activity_json in activity_jsons
+        ]:
+            for activity, activity_json in zip(self.activities, activity_jsons, strict=True):
+                changes.extend(
+                    (f"activities.{activity.type.value}.{name}", old, new)
+                    for name, old, new in activity.apply_json(activity_json)
+                )
+        else:
+            activities = self.activities
+            self.activities = [
+                ConfigZoneActivity(zone_activity_json=activity_json)
+                for activity_json in activity_jsons
+            ]
+            changes.append(("activities", activities, self.activities))
+        return changes
+
+    def _parse_settings(self, zone_json: dict[str, Any]) -> None:
+        """Set zone attributes other than activities from a zone payload.
+
+        Args:
+            zone_json: Raw zone configuration from the Carrier API.
+        """
+        self.api_id = _ID_STR(zone_json)
+        self.name: str = _NAME(zone_json)
+        self.hold_activity: ActivityTypes = _HOLD_ACTIVITY(zone_json)
+        self.hold: bool = _HOLD(zone_json) == "on"
+        self.hold_until: str = _OTMR(zone_json)
+        self.program_json: dict | None = _PROGRAM(zone_json)
+        self.occupancy_enabled: bool = _OCC_ENABLED(zone_json) == "on"
+
+    @property
+    def schedule(self) -> ZoneSchedule | None:
+        """Return the zone's weekly program indexed for lookups by time.
+
+        The index is built on first use and rebuilt only once ``program_json``
+        is replaced, which the websocket updater does for messages that touch
+        the program.
+
+        Returns:
+            The indexed schedule, or ``None`` when the zone was loaded without
+            its schedule program.
+        """
+        if self.program_json is None:
+            return None
+        if self._schedule is None or self._schedule.program is not self.program_json:
+            self._schedule = ZoneSchedule.from_program(self.program_json)
+        return self._schedule
+
+    def find_activity(self, activity_name: ActivityTypes | None) -> ConfigZoneActivity | None:
         """Find a configured zone activity by activity type.
 
         Args:
@@ -111,34 +491,40 @@ class ConfigZone:
             The matching configured activity, or ``None`` when the activity is
             not present for the zone.
         """
-        for activity in self.activities:
-            if activity.type == activity_name:
-                return activity
-        return None
+        if self._indexed_activities is not self.activities:
+            self._activities_by_type = {}
+            for activity in self.activities:
+                self._activities_by_type.setdefault(activity.type, activity)
+            self._indexed_activities = self.activities
+        if activity_name is None:
+            return None
+        return self._activities_by_type.get(activity_name)
 
     def yesterday_active_periods(self) -> list[dict[str, Any]]:
         """Return enabled schedule periods for yesterday.
 
         Returns:
             Enabled schedule periods from the zone's previous schedule day,
-            using the local system date to select the day.
+            using the local system date to select the day. Empty when the
+            zone was loaded without its schedule program.
         """
-        now = datetime.now(UTC).astimezone()
-        sunday_0_index_today = int(now.date().strftime("%w"))
-        yesterday_schedule = self.program_json["day"][(sunday_0_index_today + 8) % 7]
-        return active_schedule_periods(yesterday_schedule["period"])
+        schedule = self.schedule
+        if schedule is None:
+            return []
+        return schedule.periods_on(sunday_0_weekday(datetime.now(UTC).astimezone()) - 1)
 
     def today_active_periods(self) -> list[dict[str, Any]]:
         """Return enabled schedule periods for today.
 
         Returns:
             Enabled schedule periods from the zone's current schedule day,
-            using the local system date to select the day.
+            using the local system date to select the day. Empty when the
+            zone was loaded without its schedule program.
         """
-        now = datetime.now(UTC).astimezone()
-        sunday_0_index_today = int(now.date().strftime("%w"))
-        today_schedule_json = self.program_json["day"][sunday_0_index_today]
-        return active_schedule_periods(today_schedule_json["period"])
+        schedule = self.schedule
+        if schedule is None:
+            return []
+        return schedule.periods_on(sunday_0_weekday(datetime.now(UTC).astimezone()))
 
     def current_scheduled_activity(self) -> ConfigZoneActivity | None:
         """Determine the zone activity implied by local schedule configuration.
@@ -160,20 +546,10 @@ class ConfigZone:
         """
         if self.hold:
             return self.find_activity(self.hold_activity)
-        now = datetime.now(UTC).astimezone()
-        reversed_active_periods = reversed(self.today_active_periods())
-        for active_period in reversed_active_periods:
-            hours, minutes = active_period["time"].split(":")
-            if (int(hours) < now.hour) or (int(hours) == now.hour and int(minutes) <= now.minute):
-                return self.find_activity(
-                    safely_get_json_value(active_period, "activity", ActivityTypes)
-                )
-        yesterday_active_periods = list(self.yesterday_active_periods())
-        if not yesterday_active_periods:
+        schedule = self.schedule
+        if schedule is None:
             return None
-        return self.find_activity(
-            safely_get_json_value(yesterday_active_periods[-1], "activity", ActivityTypes)
-        )
+        return self.find_activity(schedule.activity_at(datetime.now(UTC).astimezone()))
 
     def current_activity(self) -> ConfigZoneActivity | None:
         """Return the schedule-derived current activity.
@@ -222,20 +598,82 @@ class ConfigZone:
 
         Returns:
             The next enabled period time from today, the first enabled period
-            from tomorrow, or ``None`` when neither day has enabled periods.
-        """
-        now = datetime.now(UTC).astimezone()
-        sunday_0_index_today = int(now.date().strftime("%w"))
-        active_periods = self.today_active_periods()
-        for active_period in active_periods:
-            hours, minutes = active_period["time"].split(":")
-            if (int(hours) > now.hour) or (int(hours) == now.hour and int(minutes) > now.minute):
-                return active_period["time"]
-        tomorrow_schedule = self.program_json["day"][(sunday_0_index_today + 1) % 7]
-        tomorrow_active_schedule_periods = active_schedule_periods(tomorrow_schedule["period"])
-        if len(tomorrow_active_schedule_periods) > 0:
-            return tomorrow_active_schedule_periods[0]["time"]
-        return None
+            from tomorrow, or ``None`` when neither day has enabled periods or
+            the zone was loaded without its schedule program.
+        """
+        schedule = self.schedule
+        if schedule is None:
+            return None
+        return schedule.next_time_after(datetime.now(UTC).astimezone())
+
+    def schedule_intervals(self, start: datetime, end: datetime) -> list[ScheduleInterval]:
+        """Expand the zone's program into the activities it runs within a window.
+
+        A hold applies from now until the next ``hold_until`` clock time, or
+        indefinitely when it has no end time, clipped to the window. The rest
+        of the window follows the schedule, so a window that starts after the
+        hold ends is not affected by it. Period and hold times are wall-clock
+        times in the timezone of ``start``.
+
+        Args:
+            start: Start of the window.
+            end: End of the window, excluded.
+
+        Returns:
+            Contiguous intervals covering the window, one per activity change,
+            with the set points of the zone's matching activity.
+
+        Raises:
+            ValueError: If ``end`` is before ``start``.
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        if end == start:
+            return []
+        schedule = self.schedule
+        hold_start = hold_end = end
+        if self.hold:
+            now = datetime.now(start.tzinfo)
+            hold_start = min(max(now, start), end)
+            hold_end = end
+            hold_until = _clock_time(self.hold_until)
+            if hold_until is not None:
+                until = datetime.combine(now.date(), hold_until, now.tzinfo)
+                if until <= now:
+                    until += timedelta(days=1)
+                hold_end = min(max(until, hold_start), end)
+        transitions: list[tuple[datetime, ActivityTypes | None]] = []
+        for segment_start, segment_end, held in (
+            (start, hold_start, False),
+            (hold_start, hold_end, True),
+            (hold_end, end, False),
+        ):
+            if segment_start >= segment_end:
+                continue
+            moments: list[tuple[datetime, ActivityTypes | None]]
+            if held:
+                moments = [(segment_start, self.hold_activity)]
+            elif schedule is not None:
+                moments = schedule.transitions(segment_start, segment_end)
+            else:
+                moments = [(segment_start, None)]
+            for moment, activity_type in moments:
+                if not transitions or activity_type != transitions[-1][1]:
+                    transitions.append((moment, activity_type))
+        ends = [moment for moment, _ in transitions[1:]] + [end]
+        intervals = []
+        for (moment, activity_type), interval_end in zip(transitions, ends, strict=True):
+            activity = self.find_activity(activity_type)
+            intervals.append(
+                ScheduleInterval(
+                    start=moment,
+                    end=interval_end,
+                    activity=activity_type,
+                    heat_set_point=activity.heat_set_point if activity is not None else None,
+                    cool_set_point=activity.cool_set_point if activity is not None else None,
+                )
+            )
+        return intervals
 
     def as_dict(self, status_zone: StatusZone | None = None) -> dict[str, Any]:
         """Return a dictionary representation of the zone configuration.
@@ -294,54 +732,179 @@ class ConfigZone:
         return str(self.as_dict())
 
 
-class Config:
+def _config_zones(config: Config) -> list[ConfigZone]:
+    """Build the enabled zones of a config payload.
+
+    Args:
+        config: Config whose ``raw`` zones are built.
+
+    Returns:
+        Zone configurations sharing the config's vacation activity.
+    """
+    vacation_json = config.vacation_activity_json()
+    return [
+        ConfigZone(zone_json=zone_json, vacation_json=vacation_json)
+        for zone_json in _ZONES(config.raw) or []
+        if _ENABLED(zone_json) == "on"
+    ]
+
+
+def _humidifier_heat_target(config: Config) -> int | None:
+    """Return the humidifier target of a config payload in percent.
+
+    Args:
+        config: Config whose ``raw`` humidity settings are read.
+
+    Returns:
+        The heating humidity target, which Carrier reports in steps of five
+        percent, or ``None`` when it is missing.
+    """
+    target = _HUMIDITY_HOME_RHTG(config.raw)
+    return None if target is None else target * 5
+
+
+_CONFIG_FIELDS = {
+    "temperature_unit": LazyField(("cfgem",), lambda config: _CFGEM(config.raw)),
+    "mode": LazyField(("mode",), lambda config: _MODE(config.raw)),
+    "heat_source": LazyField(("heatsource",), lambda config: _HEATSOURCE(config.raw)),
+    "etag": LazyField(("etag",), lambda config: _ETAG(config.raw)),
+    "fuel_type": LazyField(("fueltype",), lambda config: _FUELTYPE(config.raw)),
+    "gas_unit": LazyField(("gasunit",), lambda config: _GASUNIT(config.raw)),
+    "fan_enabled": LazyField(
+        ("cfgfan",),
+        lambda config: None if (fan := _CFGFAN(config.raw)) is None else fan == "on",
+    ),
+    "uv_enabled": LazyField(("cfguv",), lambda config: _CFGUV(config.raw) == "on"),
+    "humidifier_enabled": LazyField(("cfghumid",), lambda config: _CFGHUMID(config.raw) == "on"),
+    "humidifier_heat_target": LazyField(("humidityHome",), _humidifier_heat_target),
+    # Vacation keys change zone activities, which ConfigZone.apply_json updates in place.
+    "zones": LazyField(("zones",), _config_zones),
+}
+
+# System-level settings re-parsed by ``Config.apply_json``.
+_CONFIG_SETTINGS = tuple(name for name in _CONFIG_FIELDS if name != "zones")
+
+
+class Config(LazyModel):
     """Configurable system settings and enabled zone configurations."""
 
-    temperature_unit: str | None = None
-    mode: str | None = None
-    heat_source: str | None = None
-    etag: str | None = None
-    fuel_type: str | None = None
-    gas_unit: str | None = None
-    fan_enabled: bool | None = None
+    __slots__ = (
+        "etag",
+        "fan_enabled",
+        "fuel_type",
+        "gas_unit",
+        "heat_source",
+        "humidifier_enabled",
+        "humidifier_heat_target",
+        "lazy",
+        "mode",
+        "raw",
+        "temperature_unit",
+        "uv_enabled",
+        "zones",
+    )
+    _fields = _CONFIG_FIELDS
+    _defaults = dict.fromkeys(
+        (
+            "temperature_unit",
+            "mode",
+            "heat_source",
+            "etag",
+            "fuel_type",
+            "gas_unit",
+            "fan_enabled",
+            "uv_enabled",
+            "humidifier_enabled",
+            "humidifier_heat_target",
+        ),
+        None,
+    )
+
+    raw: dict[str, Any]
+    lazy: bool
+    temperature_unit: str | None
+    mode: str | None
+    heat_source: str | None
+    etag: str | None
+    fuel_type: str | None
+    gas_unit: str | None
+    fan_enabled: bool | None
     zones: list[ConfigZone]
-    uv_enabled: bool | None = None
-    humidifier_enabled: bool | None = None
-    humidifier_heat_target: int | None = None
-
-    def __init__(
-        self,
-        raw: dict[str, Any],
-    ) -> None:
+    uv_enabled: bool | None
+    humidifier_enabled: bool | None
+    humidifier_heat_target: int | None
+
+    def __init__(self, raw: dict[str, Any], *, lazy: bool = False) -> None:
         """Build system configuration from a Carrier GraphQL config payload.
 
         Args:
             raw: Raw ``config`` object returned by the Carrier GraphQL API.
+                Sections left out by a query profile, including the whole
+                payload, produce ``None`` settings and no zones.
+            lazy: Decode each setting and the zone list on first access
+                instead of now.
         """
         self.raw = raw
-        self.temperature_unit = safely_get_json_value(self.raw, "cfgem")
-        self.mode = safely_get_json_value(self.raw, "mode")
-        self.heat_source = safely_get_json_value(self.raw, "heatsource")
-        self.etag = safely_get_json_value(self.raw, "etag")
-        self.fuel_type = safely_get_json_value(self.raw, "fueltype")
-        self.gas_unit = safely_get_json_value(self.raw, "gasunit")
-        raw_fan_enabled = safely_get_json_value(self.raw, "cfgfan")
-        self.fan_enabled = None if raw_fan_enabled is None else raw_fan_enabled == "on"
-        self.uv_enabled = safely_get_json_value(self.raw, "cfguv") == "on"
-        self.humidifier_enabled = safely_get_json_value(self.raw, "cfghumid") == "on"
-        self.humidifier_heat_target = safely_get_json_value(self.raw, "humidityHome.rhtg", int)
-        if self.humidifier_heat_target is not None:
-            self.humidifier_heat_target = self.humidifier_heat_target * 5
-        vacation_json = {
+        self.lazy = lazy
+        if not lazy:
+            self._decode_fields()
+
+    def zone(self, api_id: str) -> ConfigZone | None:
+        """Return the enabled zone with a Carrier zone id.
+
+        Args:
+            api_id: Carrier zone identifier, compared as a string.
+
+        Returns:
+            The matching enabled zone, or ``None`` when no enabled zone has it.
+        """
+        api_id = str(api_id)
+        for zone in self.zones:
+            if zone.api_id == api_id:
+                return zone
+        return None
+
+    def schedule_intervals(
+        self, start: datetime, end: datetime
+    ) -> dict[str, list[ScheduleInterval]]:
+        """Expand the programs of every enabled zone over a window.
+
+        Args:
+            start: Start of the window.
+            end: End of the window, excluded.
+
+        Returns:
+            Each zone's intervals from ``ConfigZone.schedule_intervals``, keyed
+            by Carrier zone id.
+        """
+        return {zone.api_id: zone.schedule_intervals(start, end) for zone in self.zones}
+
+    def vacation_activity_json(self) -> dict[str, Any]:
+        """Return the synthetic vacation activity payload shared by all zones.
+
+        Returns:
+            An activity payload built from the system-level vacation set points
+            and fan mode.
+        """
+        return {
             "type": "vacation",
-            "clsp": self.raw["vacmaxt"],
-            "htsp": self.raw["vacmint"],
-            "fan": self.raw["vacfan"],
+            "clsp": _VACMAXT(self.raw),
+            "htsp": _VACMINT(self.raw),
+            "fan": _VACFAN(self.raw),
         }
-        self.zones = []
-        for zone_json in safely_get_json_value(self.raw, "zones"):
-            if safely_get_json_value(zone_json, "enabled") == "on":
-                self.zones.append(ConfigZone(zone_json=zone_json, vacation_json=vacation_json))
+
+    def apply_json(self) -> FieldChanges:
+        """Re-parse system-level settings in place after ``raw`` was updated.
+
+        Zones are not touched; apply zone deltas with ``ConfigZone.apply_json``.
+        Settings of a lazy config that were not loaded before ``raw`` changed
+        are decoded from the updated payload and not reported; use
+        ``load_fields`` and ``reload_fields`` to limit the work to changed keys.
+
+        Returns:
+            The attributes whose values changed.
+        """
+        return self.reload_fields(_CONFIG_SETTINGS)
 
     def as_dict(self, status_zones: list[StatusZone] | None = None) -> dict[str, Any]:
         """Return a dictionary representation of the system configuration.
@@ -48,3 +48,34 @@ class HeatSourceTypes(Enum):
     IDU_ONLY = "idu only"
     ODU_ONLY = "odu only"
     SYSTEM = "system"
+
+
+class QueryProfiles(Enum):
+    """Field-selection profiles for Carrier Infinity system queries."""
+
+    # Profile and status only; config is not requested.
+    STATUS_ONLY = "status-only"
+    # Everything except schedules and away/vacation humidity settings.
+    DASHBOARD = "dashboard"
+    FULL = "full"
+
+
+class OverflowPolicies(Enum):
+    """What a websocket callback queue does with a message when it is full."""
+
+    # Wait for room, pausing websocket reads.
+    BLOCK = "block"
+    # Discard the oldest queued message.
+    DROP_OLDEST = "drop-oldest"
+    # Merge into the newest queued message of the same serial and type, or wait.
+    COALESCE = "coalesce"
+
+
+class ConnectionStates(Enum):
+    """Realtime websocket connection states reported by ``ApiWebsocket``."""
+
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    # Waiting out the reconnect backoff after the connection was lost.
+    RECONNECTING = "reconnecting"
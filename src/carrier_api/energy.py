@@ -5,7 +5,12 @@ from enum import StrEnum
 from math import isfinite
 from typing import Any
 
-from .util import safely_get_json_value
+from .util import SlottedModel, json_path, safely_get_json_value
+
+_ENERGY_PERIOD_TYPE = json_path("energyPeriodType")
+_ENERGY_CONFIG_SEER = json_path("energyConfig.seer", float)
+_ENERGY_CONFIG_HSPF = json_path("energyConfig.hspf", float)
+_ENERGY_PERIODS = json_path("energyPeriods")
 
 EnergyUsageValue = int | float | None
 
@@ -123,18 +128,44 @@ def _energy_usage_value(raw: dict[str, Any], key: str) -> EnergyUsageValue:
     return value
 
 
-class EnergyMeasurement:
+class EnergyMeasurement(SlottedModel):
     """Energy usage totals for a single Carrier reporting period."""
 
-    api_id: str | None = None
-    cooling: EnergyUsageValue = None
-    hp_heat: EnergyUsageValue = None
-    fan: EnergyUsageValue = None
-    electric_heat: EnergyUsageValue = None
-    reheat: EnergyUsageValue = None
-    fan_gas: EnergyUsageValue = None
-    gas: EnergyUsageValue = None
-    loop_pump: EnergyUsageValue = None
+    __slots__ = (
+        "api_id",
+        "cooling",
+        "electric_heat",
+        "fan",
+        "fan_gas",
+        "gas",
+        "hp_heat",
+        "loop_pump",
+        "reheat",
+    )
+    _defaults = dict.fromkeys(
+        (
+            "api_id",
+            "cooling",
+            "hp_heat",
+            "fan",
+            "electric_heat",
+            "reheat",
+            "fan_gas",
+            "gas",
+            "loop_pump",
+        ),
+        None,
+    )
+
+    api_id: str | None
+    cooling: EnergyUsageValue
+    hp_heat: EnergyUsageValue
+    fan: EnergyUsageValue
+    electric_heat: EnergyUsageValue
+    reheat: EnergyUsageValue
+    fan_gas: EnergyUsageValue
+    gas: EnergyUsageValue
+    loop_pump: EnergyUsageValue
 
     def __init__(self, energy_measurement_json: dict[str, Any]) -> None:
         """Build an energy measurement from a Carrier energy period payload.
@@ -143,7 +174,7 @@ class EnergyMeasurement:
             energy_measurement_json: Raw ``energyPeriods`` entry from the Carrier
                 GraphQL API.
         """
-        self.api_id = safely_get_json_value(energy_measurement_json, "energyPeriodType")
+        self.api_id = _ENERGY_PERIOD_TYPE(energy_measurement_json)
         for metric, spec in _ENERGY_METRICS.items():
             setattr(
                 self,
@@ -217,14 +248,15 @@ class Energy:
 
         Args:
             raw: Raw ``infinityEnergy`` object returned by the Carrier GraphQL API.
+                Missing energy periods produce an empty ``periods`` list.
         """
         self.raw = raw
-        self.seer = safely_get_json_value(self.raw, "energyConfig.seer", float)
-        self.hspf = safely_get_json_value(self.raw, "energyConfig.hspf", float)
+        self.seer = _ENERGY_CONFIG_SEER(self.raw)
+        self.hspf = _ENERGY_CONFIG_HSPF(self.raw)
         for metric in _ENERGY_METRICS:
             setattr(self, metric.value, _energy_config_metric_enabled(self.raw, metric))
         self.periods = []
-        for period_json in self.raw["energyPeriods"]:
+        for period_json in _ENERGY_PERIODS(self.raw) or []:
             self.periods.append(EnergyMeasurement(period_json))
 
     def measurement_for_period(self, period_id: EnergyPeriod | str) -> EnergyMeasurement | None:
@@ -8,12 +8,54 @@ cool/heat set points sent as a pair.
 
 from typing import Any
 
-from .util import safely_get_json_value
-
-
-class EntryLevelZone:
+from .util import SlottedModel, json_path
+
+_INDEX = json_path("index", int)
+_MODE = json_path("mode")
+_RT = json_path("rt", float)
+_RH = json_path("rh", int)
+_CLSP_CURRENT = json_path("clsp.current", float)
+_CLSP_MIN = json_path("clsp.min", float)
+_HTSP_CURRENT = json_path("htsp.current", float)
+_HTSP_MAX = json_path("htsp.max", float)
+_FAN_MODE = json_path("fan_mode")
+_SCHEDULE_ENABLED = json_path("schedule_enabled")
+_HOLD_END_TIME = json_path("hold_end_time", int)
+_HOLD_COUNTDOWN = json_path("hold_countdown", int)
+_STAGE_STATUS = json_path("stage_status")
+_OUTSIDE_TEMP = json_path("outside_temp", float)
+_SERIAL = json_path("serial")
+_NAME = json_path("name")
+_MODEL = json_path("model")
+_FIRMWARE = json_path("firmware")
+_LOCATION_ID = json_path("location_id")
+_TEMP_UNIT_FORMAT = json_path("temp_unit_format")
+_CONNECTION_IS_CONNECTED = json_path("connection.isConnected")
+_CONNECTION_DEVICE_ID = json_path("connection.deviceId")
+_ZONES = json_path("zones")
+
+
+class EntryLevelZone(SlottedModel):
     """Runtime state and set points for one entry-level thermostat zone."""
 
+    __slots__ = (
+        "cool_set_point",
+        "cool_set_point_min",
+        "fan_mode",
+        "heat_set_point",
+        "heat_set_point_max",
+        "hold_countdown",
+        "hold_end_time",
+        "humidity",
+        "index",
+        "mode",
+        "outdoor_temperature",
+        "raw",
+        "schedule_enabled",
+        "stage_status",
+        "temperature",
+    )
+
     def __init__(self, raw: dict[str, Any]) -> None:
         """Build a zone from a Carrier ``entryLevelSystems`` zone payload.
 
@@ -21,20 +63,20 @@ class EntryLevelZone:
             raw: Raw zone object from the Carrier GraphQL response.
         """
         self.raw = raw
-        self.index: int = safely_get_json_value(raw, "index", int)
-        self.mode: str | None = safely_get_json_value(raw, "mode")
-        self.temperature: float | None = safely_get_json_value(raw, "rt", float)
-        self.humidity: int | None = safely_get_json_value(raw, "rh", int)
-        self.cool_set_point: float | None = safely_get_json_value(raw, "clsp.current", float)
-        self.cool_set_point_min: float | None = safely_get_json_value(raw, "clsp.min", float)
-        self.heat_set_point: float | None = safely_get_json_value(raw, "htsp.current", float)
-        self.heat_set_point_max: float | None = safely_get_json_value(raw, "htsp.max", float)
-        self.fan_mode: str | None = safely_get_json_value(raw, "fan_mode")
-        self.schedule_enabled: bool | None = safely_get_json_value(raw, "schedule_enabled")
-        self.hold_end_time: int | None = safely_get_json_value(raw, "hold_end_time", int)
-        self.hold_countdown: int | None = safely_get_json_value(raw, "hold_countdown", int)
-        self.stage_status: str | None = safely_get_json_value(raw, "stage_status")
-        self.outdoor_temperature: float | None = safely_get_json_value(raw, "outside_temp", float)
+        self.index: int = _INDEX(raw)
+        self.mode: str | None = _MODE(raw)
+        self.temperature: float | None = _RT(raw)
+        self.humidity: int | None = _RH(raw)
+        self.cool_set_point: float | None = _CLSP_CURRENT(raw)
+        self.cool_set_point_min: float | None = _CLSP_MIN(raw)
+        self.heat_set_point: float | None = _HTSP_CURRENT(raw)
+        self.heat_set_point_max: float | None = _HTSP_MAX(raw)
+        self.fan_mode: str | None = _FAN_MODE(raw)
+        self.schedule_enabled: bool | None = _SCHEDULE_ENABLED(raw)
+        self.hold_end_time: int | None = _HOLD_END_TIME(raw)
+        self.hold_countdown: int | None = _HOLD_COUNTDOWN(raw)
+        self.stage_status: str | None = _STAGE_STATUS(raw)
+        self.outdoor_temperature: float | None = _OUTSIDE_TEMP(raw)
 
     @property
     def on_hold(self) -> bool:
@@ -82,9 +124,22 @@ class EntryLevelZone:
         return str(self.as_dict())
 
 
-class EntryLevelSystem:
+class EntryLevelSystem(SlottedModel):
     """A Carrier entry-level (Smart Thermostat) system and its zones."""
 
+    __slots__ = (
+        "device_id",
+        "firmware",
+        "is_connected",
+        "location_id",
+        "model",
+        "name",
+        "raw",
+        "serial",
+        "temperature_unit",
+        "zones",
+    )
+
     def __init__(self, raw: dict[str, Any]) -> None:
         """Build a system from a Carrier ``entryLevelSystems`` payload.
 
@@ -92,16 +147,16 @@ class EntryLevelSystem:
             raw: Raw system object from the Carrier GraphQL response.
         """
         self.raw = raw
-        self.serial: str = safely_get_json_value(raw, "serial")
-        self.name: str | None = safely_get_json_value(raw, "name")
-        self.model: str | None = safely_get_json_value(raw, "model")
-        self.firmware: str | None = safely_get_json_value(raw, "firmware")
-        self.location_id: str | None = safely_get_json_value(raw, "location_id")
-        self.temperature_unit: str | None = safely_get_json_value(raw, "temp_unit_format")
-        self.is_connected: bool | None = safely_get_json_value(raw, "connection.isConnected")
-        self.device_id: str | None = safely_get_json_value(raw, "connection.deviceId")
+        self.serial: str = _SERIAL(raw)
+        self.name: str | None = _NAME(raw)
+        self.model: str | None = _MODEL(raw)
+        self.firmware: str | None = _FIRMWARE(raw)
+        self.location_id: str | None = _LOCATION_ID(raw)
+        self.temperature_unit: str | None = _TEMP_UNIT_FORMAT(raw)
+        self.is_connected: bool | None = _CONNECTION_IS_CONNECTED(raw)
+        self.device_id: str | None = _CONNECTION_DEVICE_ID(raw)
         self.zones: list[EntryLevelZone] = [
-            EntryLevelZone(zone_json) for zone_json in (safely_get_json_value(raw, "zones") or [])
+            EntryLevelZone(zone_json) for zone_json in (_ZONES(raw) or [])
         ]
 
     def as_dict(self) -> dict[str, Any]:
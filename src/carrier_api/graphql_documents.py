@@ -0,0 +1,644 @@
+"""Parsed GraphQL operation documents shared by Carrier API connections.
+
+Operation sources are parsed lazily, once per process, on the first request for
+each operation name. Later calls return the same parsed ``GraphQLRequest``, so
+polling no longer re-lexes and re-parses documents on every query.
+"""
+
+from collections.abc import Sequence
+
+from gql import GraphQLRequest, gql
+
+from .const import QueryProfiles
+
+_ASSISTED_LOGIN = """
+    mutation assistedLogin($input: AssistedLoginInput!) {
+        assistedLogin(input: $input) {
+            success
+            status
+            errorMessage
+            data {
+                token_type
+                expires_in
+                access_token
+                scope
+                refresh_token
+            }
+        }
+    }
+"""
+
+_GET_USER = """
+    query getUser(
+        $userName: String!,
+        $appVersion: String,
+        $brand: String,
+        $os: String,
+        $osVersion: String
+    ) {
+        user(
+            userName: $userName
+            appVersion: $appVersion
+            brand: $brand
+            os: $os
+            osVersion: $osVersion
+        ) {
+            username
+            identityId
+            first
+            last
+            email
+            emailVerified
+            postal
+            locations {
+                locationId
+                name
+                systems {
+                    config {
+                        zones {
+                            id
+                            enabled
+                        }
+                    }
+                    profile {
+                        serial
+                        name
+                    }
+                    status {
+                        isDisconnected
+                    }
+                }
+                devices {
+                    deviceId
+                    type
+                    thingName
+                    name
+                    connectionStatus
+                }
+            }
+        }
+    }
+"""
+
+# One selection tree for an Infinity system. Leaves are field names; branches are
+# ``(field, children)`` pairs. The account-wide query and the per-serial slice
+# queries are all rendered from this tree, with query profiles pruning paths.
+FieldSelection = tuple["str | tuple[str, FieldSelection]", ...]
+
+INFINITY_SYSTEM_FIELDS: FieldSelection = (
+    (
+        "profile",
+        (
+            "serial",
+            "name",
+            "firmware",
+            "model",
+            "brand",
+            "indoorModel",
+            "indoorSerial",
+            "idutype",
+            "idusource",
+            "outdoorModel",
+            "outdoorSerial",
+            "odutype",
+        ),
+    ),
+    (
+        "status",
+        (
+            "localTime",
+            "localTimeOffset",
+            "utcTime",
+            "wcTime",
+            "isDisconnected",
+            "cfgem",
+            "mode",
+            "vacatrunning",
+            "oat",
+            ("odu", ("type", "opstat", "iducfm")),
+            "filtrlvl",
+            ("idu", ("type", "opstat", "cfm", "statpress", "blwrpm")),
+            "vent",
+            "ventlvl",
+            "humid",
+            "humlvl",
+            "uvlvl",
+            (
+                "zones",
+                (
+                    "id",
+                    "rt",
+                    "rh",
+                    "fan",
+                    "htsp",
+                    "clsp",
+                    "hold",
+                    "enabled",
+                    "currentActivity",
+                    "zoneconditioning",
+                ),
+            ),
+        ),
+    ),
+    (
+        "config",
+        (
+            "etag",
+            "mode",
+            "cfgem",
+            "cfgdead",
+            "cfgvent",
+            "cfghumid",
+            "cfguv",
+            "cfgfan",
+            "heatsource",
+            "vacat",
+            "vacstart",
+            "vacend",
+            "vacmint",
+            "vacmaxt",
+            "vacfan",
+            "fueltype",
+            "gasunit",
+            "filtertype",
+            "filterinterval",
+            (
+                "humidityVacation",
+                (
+                    "rclgovercool",
+                    "ventspdclg",
+                    "ventclg",
+                    "rhtg",
+                    "humidifier",
+                    "humid",
+                    "venthtg",
+                    "rclg",
+                    "ventspdhtg",
+                ),
+            ),
+            (
+                "zones",
+                (
+                    "id",
+                    "name",
+                    "enabled",
+                    "hold",
+                    "holdActivity",
+                    "otmr",
+                    "occEnabled",
+                    (
+                        "program",
+                        (
+                            "id",
+                            (
+                                "day",
+                                (
+                                    "id",
+                                    "zoneId",
+                                    (
+                                        "period",
+                                        ("id", "zoneId", "dayId", "activity", "time", "enabled"),
+                                    ),
+                                ),
+                            ),
+                        ),
+                    ),
+                    ("activities", ("id", "zoneId", "type", "fan", "htsp", "clsp")),
+                ),
+            ),
+            ("humidityAway", ("humid", "humidifier", "rhtg", "rclg", "rclgovercool")),
+            ("humidityHome", ("humid", "humidifier", "rhtg", "rclg", "rclgovercool")),
+        ),
+    ),
+)
+
+# Dotted selection paths left out of each query profile.
+QUERY_PROFILE_OMISSIONS: dict[QueryProfiles, frozenset[str]] = {
+    QueryProfiles.STATUS_ONLY: frozenset({"config"}),
+    QueryProfiles.DASHBOARD: frozenset(
+        {"config.humidityVacation", "config.humidityAway", "config.zones.program"}
+    ),
+    QueryProfiles.FULL: frozenset(),
+}
+
+# Infinity operations rendered from the selection tree: operation name mapped to
+# variable definitions, root field call, and the tree section it selects.
+_INFINITY_OPERATIONS: dict[str, tuple[str, str, str | None]] = {
+    "getInfinitySystems": ("$userName: String!", "infinitySystems(userName: $userName)", None),
+    "getInfinityProfile": ("$serial: String!", "infinityProfile(serial: $serial)", "profile"),
+    "getInfinityStatus": ("$serial: String!", "infinityStatus(serial: $serial)", "status"),
+    "getInfinityConfig": ("$serial: String!", "infinityConfig(serial: $serial)", "config"),
+}
+
+
+def prune_selection(
+    selection: FieldSelection, omitted_paths: frozenset[str], prefix: str = ""
+) -> FieldSelection:
+    """Return a selection tree without the omitted dotted paths.
+
+    Branches left without any fields are dropped as well, because GraphQL does
+    not allow empty selection sets.
+
+    Args:
+        selection: Selection tree to prune.
+        omitted_paths: Dotted field paths to leave out, such as
+            ``config.zones.program``.
+        prefix: Dotted path of ``selection`` within the full tree.
+
+    Returns:
+        The pruned selection tree.
+    """
+    pruned: list[str | tuple[str, FieldSelection]] = []
+    for entry in selection:
+        name = entry if isinstance(entry, str) else entry[0]
+        path = f"{prefix}{name}"
+        if path in omitted_paths:
+            continue
+        if isinstance(entry, str):
+            pruned.append(entry)
+            continue
+        children = prune_selection(entry[1], omitted_paths, f"{path}.")
+        if children:
+            pruned.append((name, children))
+    return tuple(pruned)
+
+
+def render_selection(selection: FieldSelection, depth: int) -> str:
+    """Render a selection tree as GraphQL selection-set text.
+
+    Args:
+        selection: Selection tree to render.
+        depth: Indentation depth of the fields, in two-space steps.
+
+    Returns:
+        GraphQL field lines, one field or branch per line.
+    """
+    indent = "  " * depth
+    lines: list[str] = []
+    for entry in selection:
+        if isinstance(entry, str):
+            lines.append(f"{indent}{entry}\n")
+        else:
+            name, children = entry
+            lines.append(f"{indent}{name} {{\n{render_selection(children, depth + 1)}{indent}}}\n")
+    return "".join(lines)
+
+
+def _select_section(selection: FieldSelection, section: str | None) -> FieldSelection:
+    """Return the children of one top-level branch, or the whole tree.
+
+    Args:
+        selection: Full Infinity system selection tree.
+        section: Top-level branch name, or ``None`` for the whole tree.
+
+    Returns:
+        The selected subtree, or an empty tree when the branch was pruned.
+    """
+    if section is None:
+        return selection
+    for entry in selection:
+        if not isinstance(entry, str) and entry[0] == section:
+            return entry[1]
+    return ()
+
+
+def _infinity_document_sources() -> tuple[dict[str, str], dict[tuple[str, QueryProfiles], str]]:
+    """Render every Infinity operation for every query profile.
+
+    A profile that selects exactly the same fields as the full document reuses
+    the full operation name, so unchanged documents are parsed only once.
+
+    Returns:
+        Document sources keyed by operation name, and the operation name to use
+        for each ``(base operation name, profile)`` pair.
+    """
+    sources: dict[str, str] = {}
+    operation_names: dict[tuple[str, QueryProfiles], str] = {}
+    for operation_name, (variables, root_field, section) in _INFINITY_OPERATIONS.items():
+        full_selection = _select_section(INFINITY_SYSTEM_FIELDS, section)
+        for profile, omitted_paths in QUERY_PROFILE_OMISSIONS.items():
+            selection = _select_section(
+                prune_selection(INFINITY_SYSTEM_FIELDS, omitted_paths), section
+            )
+            if not selection:
+                continue
+            profiled_name = operation_name
+            if selection != full_selection:
+                profiled_name += "".join(part.title() for part in profile.value.split("-"))
+            operation_names[operation_name, profile] = profiled_name
+            sources[profiled_name] = (
+                f"\n    query {profiled_name}({variables}) {{\n"
+                f"      {root_field} {{\n{render_selection(selection, 4)}      }}\n    }}\n"
+            )
+    return sources, operation_names
+
+
+_INFINITY_SOURCES, _PROFILED_OPERATION_NAMES = _infinity_document_sources()
+
+
+def infinity_operation_name(operation_name: str, profile: QueryProfiles) -> str:
+    """Return the registered operation name for an Infinity query profile.
+
+    Args:
+        operation_name: Base Infinity operation name, such as
+            ``getInfinitySystems``.
+        profile: Query profile selecting which fields to request.
+
+    Returns:
+        The operation name to pass to ``graphql_document``.
+
+    Raises:
+        ValueError: If the profile selects no fields for the operation, such
+            as ``getInfinityConfig`` with the status-only profile.
+    """
+    try:
+        return _PROFILED_OPERATION_NAMES[operation_name, profile]
+    except KeyError as error:
+        raise ValueError(
+            f"Query profile {profile.value} selects no fields for {operation_name}"
+        ) from error
+
+
+# Selection of an ``infinityEnergy`` field, shared by the single-serial and
+# aliased multi-serial energy documents.
+_INFINITY_ENERGY_FIELDS = """
+        energyConfig {
+          cooling {
+            display
+            enabled
+          }
+          eheat {
+            display
+            enabled
+          }
+          fan {
+            display
+            enabled
+          }
+          fangas {
+            display
+            enabled
+          }
+          gas {
+            display
+            enabled
+          }
+          hpheat {
+            display
+            enabled
+          }
+          looppump {
+            display
+            enabled
+          }
+          reheat {
+            display
+            enabled
+          }
+          hspf
+          seer
+        }
+        energyPeriods {
+          energyPeriodType
+          eHeatKwh
+          coolingKwh
+          fanGasKwh
+          fanKwh
+          hPHeatKwh
+          loopPumpKwh
+          gasKwh
+          reheatKwh
+        }
+"""
+
+_GET_INFINITY_ENERGY = f"""
+    query getInfinityEnergy($serial: String!) {{
+      infinityEnergy(serial: $serial) {{{_INFINITY_ENERGY_FIELDS}      }}
+    }}
+"""
+
+_GET_ENTRY_LEVEL_SYSTEMS = """
+    query getEntryLevelSystems($username: String!) {
+      entryLevelSystems(username: $username) {
+        serial
+        name
+        location_id
+        model
+        firmware
+        temp_unit_format
+        connection {
+          isConnected
+          deviceId
+        }
+        zones {
+          index
+          mode
+          rt
+          rh
+          clsp { current min }
+          htsp { current max }
+          fan_mode
+          schedule_enabled
+          hold_end_time
+          hold_countdown
+          stage_status
+          outside_temp
+        }
+      }
+    }
+"""
+
+_UPDATE_ENTRY_LEVEL_ZONE = """
+    mutation updateEntryLevelZone($input: EntryLevelZoneInput!) {
+      updateEntryLevelZone(input: $input) {
+        success
+      }
+    }
+"""
+
+_UPDATE_INFINITY_CONFIG = """
+    mutation updateInfinityConfig($input: InfinityConfigInput!) {
+        updateInfinityConfig(input: $input) {
+            etag
+        }
+    }
+"""
+
+_UPDATE_INFINITY_CONFIGS = """
+    mutation updateInfinityConfigs($input: InfinityConfigsInput!) {
+        updateInfinityConfigs(input: $input) {
+            etag
+        }
+    }
+"""
+
+_UPDATE_INFINITY_ZONE_ACTIVITY = """
+    mutation updateInfinityZoneActivity($input: InfinityZoneActivityInput!) {
+        updateInfinityZoneActivity(input: $input) {
+            etag
+        }
+    }
+"""
+
+_UPDATE_INFINITY_WHOLE_HOUSE_ACTIVITY = """
+    mutation updateInfinityWholeHouseActivity($input: InfinityWholeHouseActivityInput!) {
+        updateInfinityWholeHouseActivity(input: $input) {
+            etag
+        }
+    }
+"""
+
+_UPDATE_INFINITY_ZONE_CONFIG = """
+    mutation updateInfinityZoneConfig($input: InfinityZoneConfigInput!) {
+        updateInfinityZoneConfig(input: $input) {
+            etag
+        }
+    }
+"""
+
+# Raw operation sources keyed by GraphQL operation name.
+DOCUMENT_SOURCES: dict[str, str] = {
+    "assistedLogin": _ASSISTED_LOGIN,
+    "getUser": _GET_USER,
+    **_INFINITY_SOURCES,
+    "getInfinityEnergy": _GET_INFINITY_ENERGY,
+    "getEntryLevelSystems": _GET_ENTRY_LEVEL_SYSTEMS,
+    "updateEntryLevelZone": _UPDATE_ENTRY_LEVEL_ZONE,
+    "updateInfinityConfig": _UPDATE_INFINITY_CONFIG,
+    "updateInfinityConfigs": _UPDATE_INFINITY_CONFIGS,
+    "updateInfinityWholeHouseActivity": _UPDATE_INFINITY_WHOLE_HOUSE_ACTIVITY,
+    "updateInfinityZoneActivity": _UPDATE_INFINITY_ZONE_ACTIVITY,
+    "updateInfinityZoneConfig": _UPDATE_INFINITY_ZONE_CONFIG,
+}
+
+_PARSED_DOCUMENTS: dict[str, GraphQLRequest] = {}
+
+
+def energy_batch_alias(index: int) -> str:
+    """Return the response alias of one serial in a batched energy query.
+
+    Args:
+        index: Position of the serial in the batch.
+
+    Returns:
+        The alias, such as ``energy0``.
+    """
+    return f"energy{index}"
+
+
+def energy_batch_operation_name(size: int) -> str:
+    """Return the operation name of an aliased energy query for ``size`` serials.
+
+    The document selects ``infinityEnergy`` once per serial, aliased with
+    ``energy_batch_alias`` and bound to variables ``serial0`` to
+    ``serial<size - 1>``. Its source is registered on first use, so there is
+    one document per batch size.
+
+    Args:
+        size: Number of serials in the batch.
+
+    Returns:
+        The operation name, such as ``getInfinityEnergyBatch3``.
+
+    Raises:
+        ValueError: If ``size`` is less than one.
+    """
+    if size < 1:
+        raise ValueError("An energy batch needs at least one serial")
+    operation_name = f"getInfinityEnergyBatch{size}"
+    if operation_name not in DOCUMENT_SOURCES:
+        variables = ", ".join(f"$serial{index}: String!" for index in range(size))
+        fields = "".join(
+            f"\n      {energy_batch_alias(index)}: infinityEnergy(serial: $serial{index}) {{"
+            f"{_INFINITY_ENERGY_FIELDS}      }}"
+            for index in range(size)
+        )
+        DOCUMENT_SOURCES[operation_name] = f"""
+    query {operation_name}({variables}) {{{fields}
+    }}
+"""
+    return operation_name
+
+
+# Input types of the zone mutations that can share one aliased request.
+_ZONE_MUTATION_INPUTS = {
+    "updateInfinityZoneActivity": ("Activity", "InfinityZoneActivityInput"),
+    "updateInfinityZoneConfig": ("Config", "InfinityZoneConfigInput"),
+}
+
+
+def zone_mutation_batch_alias(index: int) -> str:
+    """Return the response alias of one mutation in a batched zone mutation.
+
+    Args:
+        index: Position of the mutation in the batch.
+
+    Returns:
+        The alias, such as ``update0``. Its input variable is ``input0``.
+    """
+    return f"update{index}"
+
+
+def zone_mutation_batch_operation_name(operation_names: Sequence[str]) -> str:
+    """Return the operation name of an aliased mutation running zone mutations in order.
+
+    The document runs each mutation once, aliased with
+    ``zone_mutation_batch_alias`` and bound to variables ``input0`` to
+    ``input<len - 1>``. GraphQL runs the fields of a mutation one after the
+    other, in document order. Its source is registered on first use, so there
+    is one document per sequence of operations.
+
+    Args:
+        operation_names: ``updateInfinityZoneActivity`` or
+            ``updateInfinityZoneConfig`` for each mutation, in order.
+
+    Returns:
+        The operation name, such as ``updateInfinityZoneBatchActivityConfig``.
+
+    Raises:
+        ValueError: If the sequence is empty or names another operation.
+    """
+    if not operation_names:
+        raise ValueError("A zone mutation batch needs at least one mutation")
+    if unknown := set(operation_names).difference(_ZONE_MUTATION_INPUTS):
+        raise ValueError(f"{sorted(unknown)} cannot be batched as zone mutations")
+    operation_name = "updateInfinityZoneBatch" + "".join(
+        _ZONE_MUTATION_INPUTS[name][0] for name in operation_names
+    )
+    if operation_name not in DOCUMENT_SOURCES:
+        variables = ", ".join(
+            f"$input{index}: {_ZONE_MUTATION_INPUTS[name][1]}!"
+            for index, name in enumerate(operation_names)
+        )
+        fields = "".join(
+            f"\n        {zone_mutation_batch_alias(index)}: {name}(input: $input{index}) {{"
+            "\n            etag\n        }"
+            for index, name in enumerate(operation_names)
+        )
+        DOCUMENT_SOURCES[operation_name] = f"""
+    mutation {operation_name}({variables}) {{{fields}
+    }}
+"""
+    return operation_name
+
+
+def graphql_document(operation_name: str) -> GraphQLRequest:
+    """Return the parsed document for a Carrier GraphQL operation.
+
+    The document is parsed on first use and cached in a process-wide registry
+    keyed by operation name.
+
+    Args:
+        operation_name: GraphQL operation name, such as ``getInfinitySystems``.
+
+    Returns:
+        The shared parsed GraphQL request for the operation.
+
+    Raises:
+        KeyError: If no document is registered for ``operation_name``.
+    """
+    document = _PARSED_DOCUMENTS.get(operation_name)
+    if document is None:
+        document = gql(DOCUMENT_SOURCES[operation_name])
+        _PARSED_DOCUMENTS[operation_name] = document
+    return document
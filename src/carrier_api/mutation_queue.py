@@ -0,0 +1,185 @@
+"""Short-window coalescing of GraphQL mutations that target the same zone."""
+
+from asyncio import Future, Task, TimerHandle, create_task, gather, get_running_loop, shield
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from typing import Any
+
+_LOGGER = getLogger(__name__)
+
+MutationSender = Callable[[dict[str, Any]], Coroutine[Any, Any, dict[str, Any]]]
+MutationBatchSender = Callable[
+    [list[tuple[Hashable, dict[str, Any]]]], Coroutine[Any, Any, list[dict[str, Any]]]
+]
+
+
+@dataclass
+class _PendingPart:
+    """Merged input of one mutation kind of a target."""
+
+    send: MutationSender
+    mutation_input: dict[str, Any]
+    result: Future[dict[str, Any]]
+    callers: int = 1
+
+
+@dataclass
+class _PendingMutation:
+    """Mutations of one target, waiting for its window to close."""
+
+    parts: dict[Hashable, _PendingPart] = field(default_factory=dict)
+    timer: TimerHandle | None = None
+
+
+class MutationQueue:
+    """Merge mutations submitted for the same target within a short window.
+
+    The first mutation for a target opens a window. Mutations submitted for
+    that target before the window closes are merged into the pending input of
+    the same part, with later fields winning. When the window closes, each
+    part is sent as one request, or, with ``send_batch`` set and several
+    parts pending, all parts are sent together in submission order. Every
+    caller gets the response or error of its part.
+    """
+
+    def __init__(
+        self, window_seconds: float, send_batch: MutationBatchSender | None = None
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            window_seconds: How long the first mutation for a target waits for
+                further mutations before it is sent.
+            send_batch: Coroutine function that sends the merged variables of
+                several parts in one request and returns one response per
+                part. ``None`` sends every part on its own.
+        """
+        self.window_seconds = window_seconds
+        self.send_batch = send_batch
+        self.coalesced = 0
+        self._pending: dict[Hashable, _PendingMutation] = {}
+        self._tasks: set[Task[Any]] = set()
+
+    async def submit(
+        self,
+        target: Hashable,
+        variables: dict[str, Any],
+        send: MutationSender,
+        part: Hashable = None,
+    ) -> dict[str, Any]:
+        """Queue a mutation, merging it with pending ones for the same target.
+
+        Args:
+            target: Key of the mutated object, such as a serial and zone.
+            variables: GraphQL variables with the mutation ``input``.
+            send: Coroutine function that sends the merged variables of the part.
+            part: Key of the mutation kind within the target. Only inputs of
+                the same part are merged, so it must include the operation name
+                when a target receives several operations.
+
+        Returns:
+            The decoded response of the part the mutation was sent with.
+        """
+        loop = get_running_loop()
+        pending = self._pending.get(target)
+        if pending is None:
+            pending = self._pending[target] = _PendingMutation()
+            pending.timer = loop.call_later(self.window_seconds, self._start, target)
+        elif part not in pending.parts and self.send_batch is not None:
+            self.coalesced += 1
+        pending_part = pending.parts.get(part)
+        if pending_part is None:
+            pending_part = pending.parts[part] = _PendingPart(
+                send=send, mutation_input=dict(variables["input"]), result=loop.create_future()
+            )
+        else:
+            pending_part.mutation_input.update(variables["input"])
+            pending_part.callers += 1
+            self.coalesced += 1
+        return await shield(pending_part.result)
+
+    async def flush(self) -> None:
+        """Send every pending mutation now and wait for the responses."""
+        for target in list(self._pending):
+            self._start(target)
+        await gather(*self._tasks, return_exceptions=True)
+
+    def _start(self, target: Hashable) -> None:
+        """Close a target's window and start sending its merged mutations.
+
+        Args:
+            target: Key of the pending mutations.
+        """
+        pending = self._pending.pop(target, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        parts = list(pending.parts.items())
+        if self.send_batch is not None and len(parts) > 1:
+            _LOGGER.debug("sending %s merged mutations in one request", len(parts))
+            batch = [(part, {"input": pending_part.mutation_input}) for part, pending_part in parts]
+            self._track(
+                create_task(self.send_batch(batch), name="carrier_api_mutation_batch"),
+                partial(_resolve_batch, [pending_part.result for _, pending_part in parts]),
+            )
+            return
+        for _, pending_part in parts:
+            _LOGGER.debug(
+                "sending mutation merged from %s calls: %s",
+                pending_part.callers,
+                pending_part.mutation_input,
+            )
+            self._track(
+                create_task(
+                    pending_part.send({"input": pending_part.mutation_input}),
+                    name="carrier_api_mutation",
+                ),
+                partial(_resolve, pending_part.result),
+            )
+
+    def _track(self, task: Task[Any], resolve: Callable[[Task[Any]], None]) -> None:
+        """Keep a send task until it finishes and pass its outcome to the callers.
+
+        Args:
+            task: Task sending one or more parts.
+            resolve: Callback that resolves the waiting callers.
+        """
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(resolve)
+
+
+def _resolve(result: Future[dict[str, Any]], task: Task[dict[str, Any]]) -> None:
+    """Pass the outcome of a sent mutation to every caller waiting for it.
+
+    Args:
+        result: Future shared by the merged callers.
+        task: Finished task that sent the mutation.
+    """
+    if task.cancelled():
+        result.cancel()
+    elif (error := task.exception()) is not None:
+        result.set_exception(error)
+    else:
+        result.set_result(task.result())
+
+
+def _resolve_batch(results: list[Future[dict[str, Any]]], task: Task[list[dict[str, Any]]]) -> None:
+    """Pass the outcome of a batch to the callers of each of its parts.
+
+    Args:
+        results: Futures of the parts, in batch order.
+        task: Finished task that sent the batch.
+    """
+    if task.cancelled():
+        for result in results:
+            result.cancel()
+    elif (error := task.exception()) is not None:
+        for result in results:
+            result.set_exception(error)
+    else:
+        for result, response in zip(results, task.result(), strict=True):
+            result.set_result(response)
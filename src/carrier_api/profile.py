@@ -3,24 +3,68 @@
 from logging import getLogger
 from typing import Any
 
-from .util import safely_get_json_value
+from .util import SlottedModel, json_path
+
+_NAME = json_path("name")
+_SERIAL = json_path("serial")
+_MODEL = json_path("model")
+_BRAND = json_path("brand")
+_FIRMWARE = json_path("firmware")
+_INDOOR_MODEL = json_path("indoorModel")
+_INDOOR_SERIAL = json_path("indoorSerial")
+_IDUTYPE = json_path("idutype")
+_IDUSOURCE = json_path("idusource")
+_OUTDOOR_MODEL = json_path("outdoorModel")
+_OUTDOOR_SERIAL = json_path("outdoorSerial")
+_ODUTYPE = json_path("odutype")
 
 _LOGGER = getLogger(__name__)
 
 
-class Profile:
+class Profile(SlottedModel):
     """Static identity and equipment metadata for a Carrier system."""
 
-    model: str | None = None
-    brand: str | None = None
-    firmware: str | None = None
-    indoor_model: str | None = None
-    indoor_serial: str | None = None
-    indoor_unit_type: str | None = None
-    indoor_unit_source: str | None = None
-    outdoor_model: str | None = None
-    outdoor_serial: str | None = None
-    outdoor_unit_type: str | None = None
+    __slots__ = (
+        "brand",
+        "firmware",
+        "indoor_model",
+        "indoor_serial",
+        "indoor_unit_source",
+        "indoor_unit_type",
+        "model",
+        "name",
+        "outdoor_model",
+        "outdoor_serial",
+        "outdoor_unit_type",
+        "raw",
+        "serial",
+    )
+    _defaults = dict.fromkeys(
+        (
+            "model",
+            "brand",
+            "firmware",
+            "indoor_model",
+            "indoor_serial",
+            "indoor_unit_type",
+            "indoor_unit_source",
+            "outdoor_model",
+            "outdoor_serial",
+            "outdoor_unit_type",
+        ),
+        None,
+    )
+
+    model: str | None
+    brand: str | None
+    firmware: str | None
+    indoor_model: str | None
+    indoor_serial: str | None
+    indoor_unit_type: str | None
+    indoor_unit_source: str | None
+    outdoor_model: str | None
+    outdoor_serial: str | None
+    outdoor_unit_type: str | None
 
     def __init__(
         self,
@@ -32,18 +76,18 @@ class Profile:
             raw: Raw ``profile`` object returned by the Carrier GraphQL API.
         """
         self.raw = raw
-        self.name: str = safely_get_json_value(raw, "name")
-        self.serial: str = safely_get_json_value(raw, "serial")
-        self.model = safely_get_json_value(self.raw, "model")
-        self.brand = safely_get_json_value(self.raw, "brand")
-        self.firmware = safely_get_json_value(self.raw, "firmware")
-        self.indoor_model = safely_get_json_value(self.raw, "indoorModel")
-        self.indoor_serial = safely_get_json_value(self.raw, "indoorSerial")
-        self.indoor_unit_type = safely_get_json_value(self.raw, "idutype")
-        self.indoor_unit_source = safely_get_json_value(self.raw, "idusource")
-        self.outdoor_model = safely_get_json_value(self.raw, "outdoorModel")
-        self.outdoor_serial = safely_get_json_value(self.raw, "outdoorSerial")
-        self.outdoor_unit_type = safely_get_json_value(self.raw, "odutype")
+        self.name: str = _NAME(raw)
+        self.serial: str = _SERIAL(raw)
+        self.model = _MODEL(self.raw)
+        self.brand = _BRAND(self.raw)
+        self.firmware = _FIRMWARE(self.raw)
+        self.indoor_model = _INDOOR_MODEL(self.raw)
+        self.indoor_serial = _INDOOR_SERIAL(self.raw)
+        self.indoor_unit_type = _IDUTYPE(self.raw)
+        self.indoor_unit_source = _IDUSOURCE(self.raw)
+        self.outdoor_model = _OUTDOOR_MODEL(self.raw)
+        self.outdoor_serial = _OUTDOOR_SERIAL(self.raw)
+        self.outdoor_unit_type = _ODUTYPE(self.raw)
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dictionary representation suitable for logs and debugging.
@@ -6,12 +6,54 @@ from typing import Any
 from dateutil.parser import isoparse
 
 from .const import ActivityTypes, FanModes, SystemModes, TemperatureUnits
-from .util import safely_get_json_value
-
-
-class StatusUnit:
+from .util import (
+    FieldChanges,
+    LazyField,
+    LazyModel,
+    SlottedModel,
+    attribute_values,
+    changed_fields,
+    json_path,
+)
+
+_TYPE = json_path("type")
+_OPSTAT = json_path("opstat")
+_CFM = json_path("cfm", int)
+_STATPRESS = json_path("statpress", float)
+_BLWRPM = json_path("blwrpm", int)
+_ID = json_path("id", str)
+_NAME = json_path("name")
+_RT = json_path("rt", float)
+_RH = json_path("rh", int)
+_OCCUPANCY = json_path("occupancy")
+_HOLD = json_path("hold")
+_OTMR = json_path("otmr")
+_HTSP = json_path("htsp", float)
+_CLSP = json_path("clsp", float)
+_ZONECONDITIONING = json_path("zoneconditioning")
+_DAMPERPOSITION = json_path("damperposition", int)
+_UTC_TIME = json_path("utcTime")
+_ENABLED = json_path("enabled")
+_OAT = json_path("oat", float)
+_MODE = json_path("mode")
+_FILTRLVL = json_path("filtrlvl", int)
+_HUMLVL = json_path("humlvl", int)
+_HUMID = json_path("humid", str)
+_UVLVL = json_path("uvlvl", int)
+_IS_DISCONNECTED = json_path("isDisconnected", bool)
+_IDU_CFM = json_path("idu.cfm", int)
+_ODU_IDUCFM = json_path("odu.iducfm", int)
+_IDU_BLWRPM = json_path("idu.blwrpm", int)
+_IDU_STATPRESS = json_path("idu.statpress", float)
+_ODU_OPSTAT = json_path("odu.opstat")
+_IDU_OPSTAT = json_path("idu.opstat")
+
+
+class StatusUnit(SlottedModel):
     """Runtime status details for a Carrier indoor or outdoor unit."""
 
+    __slots__ = ("airflow_cfm", "blower_rpm", "operational_status", "static_pressure", "type")
+
     def __init__(self, status_unit_json: dict[str, Any]) -> None:
         """Build unit status details from a Carrier unit status payload.
 
@@ -19,13 +61,32 @@ class StatusUnit:
             status_unit_json: Raw ``idu`` or ``odu`` object from the Carrier
                 status response.
         """
-        self.type: str | None = safely_get_json_value(status_unit_json, "type")
-        self.operational_status: str | None = safely_get_json_value(status_unit_json, "opstat")
-        self.airflow_cfm: int | None = safely_get_json_value(status_unit_json, "cfm", int)
-        self.static_pressure: float | None = safely_get_json_value(
-            status_unit_json, "statpress", float
-        )
-        self.blower_rpm: int | None = safely_get_json_value(status_unit_json, "blwrpm", int)
+        self._parse(status_unit_json)
+
+    def apply_json(self, status_unit_json: dict[str, Any]) -> FieldChanges:
+        """Re-parse this unit in place from its updated payload.
+
+        Args:
+            status_unit_json: Raw unit object after a websocket delta was merged.
+
+        Returns:
+            The attributes whose values changed.
+        """
+        before = attribute_values(self)
+        self._parse(status_unit_json)
+        return changed_fields(before, attribute_values(self))
+
+    def _parse(self, status_unit_json: dict[str, Any]) -> None:
+        """Set unit attributes from a Carrier unit status payload.
+
+        Args:
+            status_unit_json: Raw ``idu`` or ``odu`` object.
+        """
+        self.type: str | None = _TYPE(status_unit_json)
+        self.operational_status: str | None = _OPSTAT(status_unit_json)
+        self.airflow_cfm: int | None = _CFM(status_unit_json)
+        self.static_pressure: float | None = _STATPRESS(status_unit_json)
+        self.blower_rpm: int | None = _BLWRPM(status_unit_json)
 
     def as_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of unit runtime details.
@@ -59,33 +120,174 @@ class StatusUnit:
         return str(self.as_dict())
 
 
-class StatusZone:
+def _status_zones(status: Status) -> list[StatusZone]:
+    """Build the enabled zones of a status payload.
+
+    Args:
+        status: Status whose ``raw`` zones are built.
+
+    Returns:
+        Status zones, decoded lazily when the status is lazy.
+    """
+    return [
+        StatusZone(zone_json, lazy=status.lazy)
+        for zone_json in status.raw["zones"]
+        if _ENABLED(zone_json) == "on"
+    ]
+
+
+def _airflow_cfm(status: Status) -> int | None:
+    """Return the system airflow of a status payload.
+
+    Args:
+        status: Status whose ``raw`` airflow is read.
+
+    Returns:
+        The indoor unit's airflow, falling back to the airflow the outdoor unit
+        reports for the indoor unit.
+    """
+    airflow_cfm = _IDU_CFM(status.raw)
+    if airflow_cfm is None:
+        airflow_cfm = _ODU_IDUCFM(status.raw)
+    return airflow_cfm
+
+
+def _indoor_unit(status: Status) -> StatusUnit | None:
+    """Build the indoor unit of a status payload.
+
+    Args:
+        status: Status whose ``raw`` indoor unit is built.
+
+    Returns:
+        The indoor unit, with the outdoor unit's airflow when the indoor unit
+        reports none, or ``None`` when the payload has no indoor unit.
+    """
+    if status.raw.get("idu") is None:
+        return None
+    indoor_unit = StatusUnit(status.raw["idu"])
+    if indoor_unit.airflow_cfm is None:
+        indoor_unit.airflow_cfm = _ODU_IDUCFM(status.raw)
+    return indoor_unit
+
+
+_STATUS_ZONE_FIELDS = {
+    "api_id": LazyField(("id",), lambda zone: _ID(zone.raw)),
+    "name": LazyField(("name",), lambda zone: _NAME(zone.raw)),
+    # This is only Carrier's reported activity type. Use
+    # ConfigZone.current_status_activity(status_zone) to resolve the full
+    # activity profile with fan mode and heat/cool set points.
+    "current_status_activity_type": LazyField(
+        ("currentActivity",), lambda zone: ActivityTypes(zone.raw["currentActivity"])
+    ),
+    "temperature": LazyField(("rt",), lambda zone: _RT(zone.raw)),
+    "humidity": LazyField(("rh",), lambda zone: _RH(zone.raw)),
+    "occupancy": LazyField(("occupancy",), lambda zone: _OCCUPANCY(zone.raw) == "occupied"),
+    "fan": LazyField(("fan",), lambda zone: FanModes(zone.raw["fan"])),
+    "hold": LazyField(("hold",), lambda zone: _HOLD(zone.raw) == "on"),
+    "hold_until": LazyField(("otmr",), lambda zone: _OTMR(zone.raw)),
+    "heat_set_point": LazyField(("htsp",), lambda zone: _HTSP(zone.raw)),
+    "cool_set_point": LazyField(("clsp",), lambda zone: _CLSP(zone.raw)),
+    "conditioning": LazyField(("zoneconditioning",), lambda zone: _ZONECONDITIONING(zone.raw)),
+    "damper_position": LazyField(("damperposition",), lambda zone: _DAMPERPOSITION(zone.raw)),
+}
+
+_STATUS_FIELDS = {
+    "outdoor_temperature": LazyField(("oat",), lambda status: _OAT(status.raw)),
+    "mode": LazyField(("mode",), lambda status: _MODE(status.raw)),
+    "temperature_unit": LazyField(("cfgem",), lambda status: TemperatureUnits(status.raw["cfgem"])),
+    "filter_used": LazyField(("filtrlvl",), lambda status: _FILTRLVL(status.raw)),
+    "humidity_level": LazyField(("humlvl",), lambda status: _HUMLVL(status.raw)),
+    "humidifier_on": LazyField(
+        ("humid",),
+        lambda status: _HUMID(status.raw) == "on" if status.raw.get("humid") is not None else None,
+    ),
+    "uv_lamp_level": LazyField(("uvlvl",), lambda status: _UVLVL(status.raw)),
+    "is_disconnected": LazyField(("isDisconnected",), lambda status: _IS_DISCONNECTED(status.raw)),
+    "outdoor_unit": LazyField(
+        ("odu",),
+        lambda status: StatusUnit(status.raw["odu"]) if status.raw.get("odu") is not None else None,
+    ),
+    "indoor_unit": LazyField(("idu", "odu"), _indoor_unit),
+    "airflow_cfm": LazyField(
+        ("idu", "odu"),
+        lambda status: (
+            cfm if (cfm := _IDU_CFM(status.raw)) is not None else _ODU_IDUCFM(status.raw)
+        ),
+    ),
+    "blower_rpm": LazyField(("idu",), lambda status: _IDU_BLWRPM(status.raw)),
+    "static_pressure": LazyField(("idu",), lambda status: _IDU_STATPRESS(status.raw)),
+    "outdoor_unit_operational_status": LazyField(("odu",), lambda status: _ODU_OPSTAT(status.raw)),
+    "indoor_unit_operational_status": LazyField(("idu",), lambda status: _IDU_OPSTAT(status.raw)),
+    # The updater sets the receive time directly, so no key reloads it.
+    "time_stamp": LazyField((), lambda status: isoparse(_UTC_TIME(status.raw))),
+    "zones": LazyField(("zones",), _status_zones),
+}
+
+# System-level settings re-parsed by ``Status.apply_json``.
+_STATUS_SETTINGS = tuple(name for name in _STATUS_FIELDS if name not in ("time_stamp", "zones"))
+
+_UNIT_KEYS = {"indoor_unit": "idu", "outdoor_unit": "odu"}
+
+
+class StatusZone(LazyModel):
     """Runtime status reported by Carrier for a single zone."""
 
-    def __init__(self, status_zone_json: dict[str, Any]) -> None:
+    __slots__ = (
+        "api_id",
+        "conditioning",
+        "cool_set_point",
+        "current_status_activity_type",
+        "damper_position",
+        "fan",
+        "heat_set_point",
+        "hold",
+        "hold_until",
+        "humidity",
+        "name",
+        "occupancy",
+        "raw",
+        "temperature",
+    )
+    _fields = _STATUS_ZONE_FIELDS
+
+    raw: dict[str, Any]
+    api_id: str
+    name: str
+    current_status_activity_type: ActivityTypes
+    temperature: float
+    humidity: int
+    occupancy: bool
+    fan: FanModes
+    hold: bool
+    hold_until: str
+    heat_set_point: float
+    cool_set_point: float
+    conditioning: str
+    damper_position: int
+
+    def __init__(self, status_zone_json: dict[str, Any], *, lazy: bool = False) -> None:
         """Build zone status from a Carrier status zone payload.
 
         Args:
             status_zone_json: Raw zone object from the Carrier status response.
+            lazy: Decode each attribute on first access instead of now.
+        """
+        self.raw = status_zone_json
+        if not lazy:
+            self._decode_fields()
+
+    def apply_json(self, status_zone_json: dict[str, Any]) -> FieldChanges:
+        """Re-parse this zone in place from its updated payload.
+
+        Args:
+            status_zone_json: Raw zone object after a websocket delta was merged.
+
+        Returns:
+            The attributes whose values changed.
         """
-        self.api_id = safely_get_json_value(status_zone_json, "id", str)
-        self.name: str = safely_get_json_value(status_zone_json, "name")
-        # This is only Carrier's reported activity type. Use
-        # ConfigZone.current_status_activity(status_zone) to resolve the full
-        # activity profile with fan mode and heat/cool set points.
-        self.current_status_activity_type: ActivityTypes = ActivityTypes(
-            status_zone_json["currentActivity"]
-        )
-        self.temperature: float = safely_get_json_value(status_zone_json, "rt", float)
-        self.humidity: int = safely_get_json_value(status_zone_json, "rh", int)
-        self.occupancy: bool = safely_get_json_value(status_zone_json, "occupancy") == "occupied"
-        self.fan: FanModes = FanModes(status_zone_json["fan"])
-        self.hold: bool = safely_get_json_value(status_zone_json, "hold") == "on"
-        self.hold_until: str = safely_get_json_value(status_zone_json, "otmr")
-        self.heat_set_point: float = safely_get_json_value(status_zone_json, "htsp", float)
-        self.cool_set_point: float = safely_get_json_value(status_zone_json, "clsp", float)
-        self.conditioning: str = safely_get_json_value(status_zone_json, "zoneconditioning")
-        self.damper_position: int = safely_get_json_value(status_zone_json, "damperposition", int)
+        names = self.load_fields()
+        self.raw = status_zone_json
+        return self.reload_fields(names)
 
     @property
     def current_activity(self) -> ActivityTypes:
@@ -175,64 +377,146 @@ class StatusZone:
         return str(self.as_dict())
 
 
-class Status:
+class Status(LazyModel):
     """Runtime operating status for a Carrier system."""
 
-    outdoor_temperature: int | None = None
-    mode: str | None = None
+    __slots__ = (
+        "airflow_cfm",
+        "blower_rpm",
+        "filter_used",
+        "humidifier_on",
+        "humidity_level",
+        "indoor_unit",
+        "indoor_unit_operational_status",
+        "is_disconnected",
+        "lazy",
+        "mode",
+        "outdoor_temperature",
+        "outdoor_unit",
+        "outdoor_unit_operational_status",
+        "raw",
+        "static_pressure",
+        "temperature_unit",
+        "time_stamp",
+        "uv_lamp_level",
+        "zones",
+    )
+    _fields = _STATUS_FIELDS
+    _defaults = dict.fromkeys(
+        (
+            "outdoor_temperature",
+            "mode",
+            "filter_used",
+            "is_disconnected",
+            "airflow_cfm",
+            "blower_rpm",
+            "static_pressure",
+            "humidity_level",
+            "humidifier_on",
+            "uv_lamp_level",
+            "outdoor_unit_operational_status",
+            "indoor_unit_operational_status",
+            "outdoor_unit",
+            "indoor_unit",
+            "time_stamp",
+        ),
+        None,
+    )
+
+    raw: dict[str, Any]
+    lazy: bool
+    outdoor_temperature: float | None
+    mode: str | None
     temperature_unit: TemperatureUnits
-    filter_used: int | None = None
-    is_disconnected: bool | None = None
-    airflow_cfm: int | None = None
-    blower_rpm: int | None = None
-    static_pressure: float | None = None
-    humidity_level: int | None = None
-    humidifier_on: bool | None = None
-    uv_lamp_level: int | None = None
-    outdoor_unit_operational_status: str | None = None
-    indoor_unit_operational_status: str | None = None
-    outdoor_unit: StatusUnit | None = None
-    indoor_unit: StatusUnit | None = None
-    time_stamp: datetime | None = None
+    filter_used: int | None
+    is_disconnected: bool | None
+    airflow_cfm: int | None
+    blower_rpm: int | None
+    static_pressure: float | None
+    humidity_level: int | None
+    humidifier_on: bool | None
+    uv_lamp_level: int | None
+    outdoor_unit_operational_status: str | None
+    indoor_unit_operational_status: str | None
+    outdoor_unit: StatusUnit | None
+    indoor_unit: StatusUnit | None
+    time_stamp: datetime | None
     zones: list[StatusZone]
 
-    def __init__(
-        self,
-        raw: dict[str, Any],
-    ) -> None:
+    def __init__(self, raw: dict[str, Any], *, lazy: bool = False) -> None:
         """Build system status from a Carrier GraphQL status payload.
 
         Args:
             raw: Raw ``status`` object returned by the Carrier GraphQL API.
+            lazy: Decode each attribute, zone, and zone attribute on first
+                access instead of now.
         """
         self.raw = raw
-        self.outdoor_temperature: float = safely_get_json_value(self.raw, "oat", float)
-        self.mode: str = safely_get_json_value(self.raw, "mode")
-        self.temperature_unit: TemperatureUnits = TemperatureUnits(self.raw["cfgem"])
-        self.filter_used: int = safely_get_json_value(self.raw, "filtrlvl", int)
-        self.humidity_level: int = safely_get_json_value(self.raw, "humlvl", int)
-        if self.raw.get("humid") is not None:
-            self.humidifier_on: bool = safely_get_json_value(self.raw, "humid", str) == "on"
-        self.uv_lamp_level: int = safely_get_json_value(self.raw, "uvlvl", int)
-        self.is_disconnected: bool = safely_get_json_value(self.raw, "isDisconnected", bool)
-        if self.raw.get("odu") is not None:
-            self.outdoor_unit = StatusUnit(self.raw["odu"])
-        if self.raw.get("idu") is not None:
-            self.indoor_unit = StatusUnit(self.raw["idu"])
-        self.airflow_cfm: int | None = safely_get_json_value(self.raw, "idu.cfm", int)
-        if self.airflow_cfm is None:
-            self.airflow_cfm = safely_get_json_value(self.raw, "odu.iducfm", int)
-        if self.indoor_unit is not None and self.indoor_unit.airflow_cfm is None:
-            self.indoor_unit.airflow_cfm = self.airflow_cfm
-        self.blower_rpm: int = safely_get_json_value(self.raw, "idu.blwrpm", int)
-        self.static_pressure: int = safely_get_json_value(self.raw, "idu.statpress", float)
-        self.outdoor_unit_operational_status: str = safely_get_json_value(self.raw, "odu.opstat")
-        self.indoor_unit_operational_status: str = safely_get_json_value(self.raw, "idu.opstat")
-        self.time_stamp = isoparse(safely_get_json_value(self.raw, "utcTime"))
-        self.zones = []
-        for zone_json in self.raw["zones"]:
-            if safely_get_json_value(zone_json, "enabled") == "on":
-                self.zones.append(StatusZone(zone_json))
+        self.lazy = lazy
+        if not lazy:
+            self._decode_fields()
+
+    def zone(self, api_id: str) -> StatusZone | None:
+        """Return the enabled zone with a Carrier zone id.
+
+        Args:
+            api_id: Carrier zone identifier, compared as a string.
+
+        Returns:
+            The matching enabled zone, or ``None`` when no enabled zone has it.
+        """
+        api_id = str(api_id)
+        for zone in self.zones:
+            if zone.api_id == api_id:
+                return zone
+        return None
+
+    def apply_json(self, time_stamp: datetime, *, settings_changed: bool = True) -> FieldChanges:
+        """Re-parse system-level status in place after ``raw`` was updated.
+
+        Zones are not touched; apply zone deltas with ``StatusZone.apply_json``.
+        Indoor and outdoor units are updated in place, and their changes are
+        reported as ``indoor_unit.<attribute>`` and ``outdoor_unit.<attribute>``.
+        Settings of a lazy status that were not loaded before ``raw`` changed
+        are decoded from the updated payload and not reported; use
+        ``load_fields`` and ``reload_fields`` to limit the work to changed keys.
+
+        Args:
+            time_stamp: Time the update was received. It replaces
+                ``time_stamp`` directly and is not reported as a change.
+            settings_changed: Whether any system-level key changed. When
+                ``False`` only the timestamp is updated.
+
+        Returns:
+            The attributes whose values changed.
+        """
+        self.time_stamp = time_stamp
+        if not settings_changed:
+            return []
+        return self.reload_fields(_STATUS_SETTINGS)
+
+    def _reload_field(self, name: str) -> FieldChanges:
+        """Reload one field, updating indoor and outdoor units in place.
+
+        Args:
+            name: Field to reload.
+
+        Returns:
+            The field's change, or the changed attributes of a unit that was
+            updated in place.
+        """
+        unit_key = _UNIT_KEYS.get(name)
+        unit = getattr(self, name) if unit_key is not None else None
+        if unit is None or unit_key is None or self.raw.get(unit_key) is None:
+            return super()._reload_field(name)
+        before = attribute_values(unit)
+        unit.apply_json(self.raw[unit_key])
+        if name == "indoor_unit" and unit.airflow_cfm is None:
+            unit.airflow_cfm = _ODU_IDUCFM(self.raw)
+        return [
+            (f"{name}.{attribute}", old, new)
+            for attribute, old, new in changed_fields(before, attribute_values(unit))
+        ]
 
     @property
     def mode_const(self) -> SystemModes:
@@ -1,9 +1,11 @@
 """Aggregate model for a Carrier system and its related state."""
 
+from collections.abc import Iterable
+from datetime import datetime
 from logging import getLogger
 from typing import Any
 
-from .config import Config
+from .config import Config, ScheduleInterval
 from .energy import Energy
 from .profile import Profile
 from .status import Status
@@ -20,6 +22,30 @@ FAN_INDOOR_UNIT_TYPES = ("fancoil",)
 COOL_INDOOR_UNIT_TYPES = ()
 
 
+def expand_schedules(
+    systems: Iterable[System], start: datetime, end: datetime
+) -> dict[str, dict[str, list[ScheduleInterval]]]:
+    """Expand the zone programs of many systems over one window.
+
+    Each zone's weekly program is indexed once and walked day by day, so a
+    forecast over hundreds of zones needs no repeated ``next_activity_time``
+    calls.
+
+    Args:
+        systems: Systems whose zones are expanded.
+        start: Start of the window. Period times are wall-clock times in its
+            timezone.
+        end: End of the window, excluded.
+
+    Returns:
+        Zone intervals from ``Config.schedule_intervals``, keyed by system
+        serial and then by zone id.
+    """
+    return {
+        system.profile.serial: system.config.schedule_intervals(start, end) for system in systems
+    }
+
+
 class System:
     """Carrier system composed from profile, status, config, and energy data."""
 
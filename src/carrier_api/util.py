@@ -1,12 +1,127 @@
 """Utility helpers shared by Carrier API model parsers."""
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from logging import getLogger
-from typing import Any
+from types import MemberDescriptorType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 _LOGGER = getLogger(__name__)
 
 
+_MISSING = object()
+
+# Getter compiled by ``json_path``: takes a mapping or list, returns the resolved value.
+JsonGetter = Callable[[Mapping[str, Any] | list[Any]], Any]
+
+_JSON_PATHS: dict[tuple[str, Callable[[Any], Any] | None], JsonGetter] = {}
+
+
+def json_path(key: str, callable_to_cast: Callable[[Any], Any] | None = None) -> JsonGetter:
+    """Compile a dot-separated JSON lookup into a reusable getter.
+
+    The getter resolves the path like ``safely_get_json_value`` with the same
+    key and cast, but splits the key once here instead of on every call and
+    walks dicts and lists without raising exceptions. Models compile their
+    field paths at import. Getters are cached, so compiling the same path and
+    cast twice returns the same function.
+
+    Args:
+        key: Dot-separated lookup path, with numeric segments allowed for lists.
+        callable_to_cast: Optional callable used to convert the resolved value.
+
+    Returns:
+        A function that takes a mapping or list and returns the resolved and
+        optionally cast value, or ``None`` when the path cannot be resolved or
+        casting fails.
+    """
+    getter = _JSON_PATHS.get((key, callable_to_cast))
+    if getter is None:
+        getter = _JSON_PATHS[key, callable_to_cast] = _compile_json_path(key, callable_to_cast)
+    return getter
+
+
+def _compile_json_path(key: str, callable_to_cast: Callable[[Any], Any] | None) -> JsonGetter:
+    """Build the getter for ``json_path``.
+
+    Args:
+        key: Dot-separated lookup path.
+        callable_to_cast: Optional callable used to convert the resolved value.
+
+    Returns:
+        The compiled getter.
+    """
+    steps = tuple((segment, _segment_index(segment)) for segment in key.split("."))
+    (first_segment, first_index), rest = steps[0], steps[1:]
+
+    def get(json: Mapping[str, Any] | list[Any]) -> Any:
+        # Most model fields are one key of a dict, so that case is inlined.
+        value = json.get(first_segment, _MISSING) if type(json) is dict else _MISSING
+        if value is _MISSING:
+            value = _lookup(json, first_segment, first_index)
+        for segment, index in rest:
+            if value is None:
+                break
+            value = _lookup(value, segment, index)
+        if value is None or (
+            isinstance(value, str) and len(value) == 4 and value.lower() == "none"
+        ):
+            return None
+        if callable_to_cast is None:
+            return value
+        try:
+            return callable_to_cast(value)
+        except ValueError:
+            _LOGGER.exception("Unable to cast JSON value")
+            return None
+
+    return get
+
+
+def _segment_index(segment: str) -> int | None:
+    """Return a path segment as a list index when it is numeric.
+
+    Args:
+        segment: One segment of a dot-separated path.
+
+    Returns:
+        The segment converted with ``int``, or ``None`` when it is not numeric.
+    """
+    try:
+        return int(segment)
+    except ValueError:
+        return None
+
+
+def _lookup(value: Any, segment: str, index: int | None) -> Any:
+    """Resolve one path segment.
+
+    Args:
+        value: Container, or other value, to look the segment up in.
+        segment: Path segment, tried as a key and then as an integer index.
+        index: ``segment`` converted to an integer, or ``None``.
+
+    Returns:
+        The looked-up value, or ``None`` when the lookup fails.
+    """
+    if type(value) is dict:
+        found = value.get(segment, _MISSING)
+        if found is _MISSING:
+            return None if index is None else value.get(index)
+        return found
+    if type(value) is list:
+        if index is None or not -len(value) <= index < len(value):
+            return None
+        return value[index]
+    try:
+        return value[segment]
+    except TypeError, KeyError:
+        try:
+            return value[int(segment)]
+        except TypeError, KeyError, ValueError, IndexError:
+            return None
+
+
 def safely_get_json_value(
     json: Mapping[str, Any] | list[Any],
     key: str,
@@ -17,7 +132,8 @@ def safely_get_json_value(
     Dot-separated key segments traverse dictionaries and lists. Missing keys,
     invalid indexes, and incompatible container types resolve to ``None`` so
     model constructors can tolerate partial Carrier payloads. String values of
-    ``"none"`` are normalized to ``None`` before optional casting.
+    ``"none"`` are normalized to ``None`` before optional casting. Hot paths
+    should compile their lookups once with ``json_path`` instead.
 
     Args:
         json: Mapping or list to traverse.
@@ -28,27 +144,280 @@ def safely_get_json_value(
         The resolved and optionally cast value, or ``None`` when the path cannot
         be resolved or casting fails.
     """
-    value: Any = json
-    for x in key.split("."):
-        if value is not None:
+    return json_path(key, callable_to_cast)(json)
+
+
+# Changed model attributes as ``(attribute, old value, new value)`` tuples.
+FieldChanges = list[tuple[str, Any, Any]]
+
+
+def changed_fields(
+    before: Mapping[str, Any],
+    after: Mapping[str, Any],
+    ignored: Sequence[str] = (),
+) -> FieldChanges:
+    """Compare two attribute snapshots of a model.
+
+    Args:
+        before: Attribute values captured before an update, usually from
+            ``attribute_values(model)``.
+        after: Attribute values after the update.
+        ignored: Attribute names left out of the comparison.
+
+    Returns:
+        ``(attribute, old value, new value)`` for every attribute whose value
+        changed, in ``after`` order.
+    """
+    return [
+        (name, before.get(name), value)
+        for name, value in after.items()
+        if name not in ignored and before.get(name) != value
+    ]
+
+
+def merge_delta(stale: Any, update: Any) -> Any:
+    """Merge a later websocket delta into an earlier one.
+
+    Objects are merged key by key. Lists whose entries are all objects with an
+    ``id``, such as zones, activities, days, and periods, are merged entry by
+    entry on that id. Any other value, including other lists, is replaced by
+    the later one.
+
+    Args:
+        stale: Earlier value, updated in place when it is an object or list.
+        update: Later value whose fields win.
+
+    Returns:
+        The merged value.
+    """
+    if isinstance(stale, dict) and isinstance(update, dict):
+        for key, value in update.items():
+            stale[key] = merge_delta(stale[key], value) if key in stale else value
+        return stale
+    if _is_id_list(stale) and _is_id_list(update):
+        entries = {str(entry["id"]): entry for entry in stale}
+        for entry in update:
+            entry_id = str(entry["id"])
+            if entry_id in entries:
+                merge_delta(entries[entry_id], entry)
+            else:
+                entries[entry_id] = entry
+                stale.append(entry)
+        return stale
+    return update
+
+
+def _is_id_list(value: Any) -> bool:
+    """Return whether a value is a list of objects that all carry an ``id``.
+
+    Args:
+        value: Value from a websocket payload.
+
+    Returns:
+        ``True`` for lists of objects keyed by id.
+    """
+    return isinstance(value, list) and all(
+        isinstance(entry, dict) and "id" in entry for entry in value
+    )
+
+
+class _SlottedModelType(type):
+    """Metaclass that keeps class-level attribute defaults of slotted models readable."""
+
+    def __getattribute__(cls, name: str) -> Any:
+        """Return a slot's default from ``_defaults`` instead of its slot descriptor.
+
+        Only lookups on the class go through here; instance attribute reads
+        are unaffected.
+
+        Args:
+            name: Class attribute name.
+
+        Returns:
+            The attribute's default for a slot that has one, otherwise the
+            class attribute.
+        """
+        value = super().__getattribute__(name)
+        if type(value) is MemberDescriptorType:
+            defaults = super().__getattribute__("_defaults")
+            if name in defaults:
+                return defaults[name]
+        return value
+
+
+class SlottedModel(metaclass=_SlottedModelType):
+    """Base for models that keep their attributes in ``__slots__``.
+
+    Slotted instances have no per-instance ``__dict__``, which keeps resident
+    models small. A slot cannot share its name with a class attribute, so
+    class-level defaults are declared in ``_defaults`` instead. They are
+    returned for slots that were never assigned and, as before, when the
+    attribute is read from the class, such as ``Status.outdoor_unit``.
+    """
+
+    __slots__ = ()
+    _defaults: ClassVar[Mapping[str, Any]] = {}
+    attribute_names: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls) -> None:
+        """Collect the public slots of a model class and its bases, base classes first."""
+        super().__init_subclass__()
+        cls.attribute_names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in vars(klass).get("__slots__", ())
+            if not name.startswith("_")
+        )
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Return the class-level default of an unassigned slot.
+
+            Args:
+                name: Attribute name that normal lookup did not find.
+
+            Returns:
+                The attribute's default from ``_defaults``.
+
+            Raises:
+                AttributeError: If the attribute has no default.
+            """
             try:
-                value = value[x]
-            except TypeError, KeyError:
-                try:
-                    value = value[int(x)]
-                except TypeError, KeyError, ValueError, IndexError:
-                    value = None
+                return self._defaults[name]
+            except KeyError:
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no attribute {name!r}"
+                ) from None
 
-    try:
-        if value.lower() == "none":
-            value = None
-    except AttributeError:
-        pass
 
-    if callable_to_cast is not None and value is not None:
-        try:
-            value = callable_to_cast(value)
-        except ValueError:
-            _LOGGER.exception("Unable to cast JSON value")
-            value = None
-    return value
+def attribute_values(model: SlottedModel) -> dict[str, Any]:
+    """Snapshot a slotted model's attributes, as ``vars()`` does for other objects.
+
+    Args:
+        model: Model to snapshot.
+
+    Returns:
+        Attribute values keyed by name, in slot order. Unassigned slots report
+        their default, or ``None``.
+    """
+    return {name: getattr(model, name, None) for name in model.attribute_names}
+
+
+@dataclass(frozen=True)
+class LazyField:
+    """How a ``LazyModel`` attribute is decoded from its ``raw`` payload.
+
+    Attributes:
+        keys: Top-level ``raw`` keys the attribute is decoded from.
+        parse: Function that decodes the attribute from the model.
+    """
+
+    keys: tuple[str, ...]
+    parse: Callable[[Any], Any]
+
+
+class LazyModel(SlottedModel):
+    """Slotted model whose fields are decoded from ``raw`` on first access.
+
+    Every attribute in ``_fields`` is decoded by its ``LazyField`` the first
+    time it is read and kept in its slot until it is reloaded. Models built
+    eagerly load every field up front, so lazy and eager models only differ in
+    when the work is done.
+
+    To update a model after ``raw`` changes, call ``load_fields`` with the keys
+    about to change before updating ``raw``, so the old values are known, then
+    ``reload_fields`` with the returned names. Fields that read other keys are
+    neither decoded nor reloaded.
+    """
+
+    __slots__ = ()
+    _fields: ClassVar[Mapping[str, LazyField]] = {}
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            """Decode and memoize a field that was not loaded yet.
+
+            Args:
+                name: Attribute name that normal lookup did not find.
+
+            Returns:
+                The decoded field, or the attribute's default from ``_defaults``.
+            """
+            field = self._fields.get(name)
+            if field is None:
+                return super().__getattr__(name)
+            value = field.parse(self)
+            setattr(self, name, value)
+            return value
+
+    def _decode_fields(self) -> None:
+        """Decode every field now, as eager models do when they are built."""
+        for name, field in self._fields.items():
+            setattr(self, name, field.parse(self))
+
+    def loaded_fields(self) -> list[str]:
+        """Return the fields that are decoded and memoized.
+
+        Returns:
+            Names of the loaded fields, in ``_fields`` order.
+        """
+        loaded = []
+        for name in self._fields:
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+            loaded.append(name)
+        return loaded
+
+    def load_fields(self, keys: Iterable[str] | None = None) -> tuple[str, ...]:
+        """Decode the fields that read any of ``keys``.
+
+        Args:
+            keys: Top-level ``raw`` keys, such as those of a websocket delta.
+                Every field is loaded when omitted.
+
+        Returns:
+            Names of the fields that read the keys, to pass to ``reload_fields``
+            once ``raw`` is updated.
+        """
+        if keys is None:
+            names = tuple(self._fields)
+        else:
+            keys = set(keys)
+            names = tuple(
+                name for name, field in self._fields.items() if not keys.isdisjoint(field.keys)
+            )
+        for name in names:
+            getattr(self, name)
+        return names
+
+    def reload_fields(self, names: Iterable[str]) -> FieldChanges:
+        """Decode fields again from the updated ``raw`` payload.
+
+        Args:
+            names: Fields returned by ``load_fields`` before ``raw`` changed.
+
+        Returns:
+            The reloaded attributes whose values changed.
+        """
+        changes: FieldChanges = []
+        for name in names:
+            changes.extend(self._reload_field(name))
+        return changes
+
+    def _reload_field(self, name: str) -> FieldChanges:
+        """Decode one field again and compare it with its memoized value.
+
+        Args:
+            name: Field to reload.
+
+        Returns:
+            The field's change, if its value changed.
+        """
+        old = getattr(self, name)
+        new = self._fields[name].parse(self)
+        setattr(self, name, new)
+        return [] if old == new else [(name, old, new)]
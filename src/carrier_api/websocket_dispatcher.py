@@ -0,0 +1,283 @@
+"""Queued, concurrent delivery of websocket messages to callbacks."""
+
+from asyncio import CancelledError, Condition, Task, create_task, gather
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from json import JSONDecodeError, dumps, loads
+from logging import getLogger
+from typing import Any
+
+from .const import OverflowPolicies
+from .util import merge_delta
+
+_LOGGER = getLogger(__name__)
+
+AsyncCallback = Callable[[str], Awaitable[None]]
+
+
+@dataclass
+class _QueuedMessage:
+    """A websocket message waiting for one callback."""
+
+    text: str
+    message_json: dict[str, Any] | None
+    serial: str | None
+    message_type: str | None
+
+    @classmethod
+    def parse(cls, text: str) -> _QueuedMessage:
+        """Read the ordering key of a raw websocket message.
+
+        Args:
+            text: Raw websocket message text.
+
+        Returns:
+            The queued message. Text that is not a JSON object has no serial
+            and is ordered with the other messages without one.
+        """
+        try:
+            message_json = loads(text)
+        except JSONDecodeError:
+            message_json = None
+        if not isinstance(message_json, dict):
+            return cls(text, None, None, None)
+        return cls(
+            text, message_json, message_json.get("deviceId"), message_json.get("messageType")
+        )
+
+    def merge(self, other: _QueuedMessage) -> None:
+        """Merge a later message of the same serial and type into this one.
+
+        The payload is copied first because queued messages of different
+        callbacks share it.
+
+        Args:
+            other: Later message whose values win.
+        """
+        self.message_json = merge_delta(deepcopy(self.message_json), other.message_json)
+        self.text = dumps(self.message_json)
+
+
+class _CallbackLane:
+    """Bounded queue and workers that deliver messages to one callback.
+
+    Messages of one serial are delivered in arrival order, one at a time.
+    Messages of different serials run concurrently, up to ``concurrency``.
+    """
+
+    def __init__(
+        self,
+        callback: AsyncCallback,
+        concurrency: int,
+        max_queue_size: int,
+        overflow_policy: OverflowPolicies,
+    ) -> None:
+        """Create a lane and start its workers.
+
+        Args:
+            callback: Coroutine function that receives raw message text.
+            concurrency: Maximum number of concurrent callback invocations.
+            max_queue_size: Maximum number of messages waiting for delivery.
+            overflow_policy: What ``put`` does when the queue is full.
+        """
+        self.callback = callback
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.pending: deque[_QueuedMessage] = deque()
+        self.active_serials: set[str | None] = set()
+        self.dropped = 0
+        self.coalesced = 0
+        self.changed = Condition()
+        self.workers: list[Task[None]] = [
+            create_task(self.loop_worker(), name=f"carrier_api_ws_callback:{index}")
+            for index in range(concurrency)
+        ]
+
+    def _coalesce_target(self, message: _QueuedMessage) -> _QueuedMessage | None:
+        """Return the queued message a new message can be merged into.
+
+        Args:
+            message: Message that does not fit in the queue.
+
+        Returns:
+            The newest queued message of the same serial when it also has the
+            same message type, otherwise ``None``.
+        """
+        if message.message_json is None or message.serial is None:
+            return None
+        for queued in reversed(self.pending):
+            if queued.serial == message.serial:
+                if queued.message_type == message.message_type:
+                    return queued
+                return None
+        return None
+
+    async def put(self, message: _QueuedMessage) -> None:
+        """Queue a message, applying the overflow policy when the queue is full.
+
+        Args:
+            message: Message to deliver.
+        """
+        async with self.changed:
+            if len(self.pending) >= self.max_queue_size:
+                if self.overflow_policy == OverflowPolicies.DROP_OLDEST:
+                    self.pending.popleft()
+                    self.dropped += 1
+                    _LOGGER.debug("ws: callback queue full, dropped oldest message")
+                elif self.overflow_policy == OverflowPolicies.COALESCE and (
+                    target := self._coalesce_target(message)
+                ):
+                    target.merge(message)
+                    self.coalesced += 1
+                    return
+                if len(self.pending) >= self.max_queue_size:
+                    await self.changed.wait_for(lambda: len(self.pending) < self.max_queue_size)
+            self.pending.append(message)
+            self.changed.notify_all()
+
+    def _next_message(self) -> _QueuedMessage | None:
+        """Return the oldest queued message whose serial is not in flight.
+
+        Returns:
+            The next deliverable message, or ``None`` when every queued message
+            waits for an earlier message of its serial.
+        """
+        for message in self.pending:
+            if message.serial not in self.active_serials:
+                return message
+        return None
+
+    async def loop_worker(self) -> None:
+        """Deliver queued messages until the worker is cancelled.
+
+        Callback errors are logged; they cannot reach the websocket reader.
+        """
+        while True:
+            async with self.changed:
+                while (message := self._next_message()) is None:
+                    await self.changed.wait()
+                self.pending.remove(message)
+                self.active_serials.add(message.serial)
+                self.changed.notify_all()
+            try:
+                await self.callback(message.text)
+            except CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception("ws: callback failed")
+            finally:
+                async with self.changed:
+                    self.active_serials.discard(message.serial)
+                    self.changed.notify_all()
+
+    async def join(self) -> None:
+        """Wait until every queued message has been delivered."""
+        async with self.changed:
+            await self.changed.wait_for(lambda: not self.pending and not self.active_serials)
+
+    async def close(self) -> None:
+        """Cancel the workers and discard queued messages."""
+        for worker in self.workers:
+            worker.cancel()
+        await gather(*self.workers, return_exceptions=True)
+        self.pending.clear()
+
+
+class CallbackDispatcher:
+    """Deliver websocket messages to callbacks without blocking the reader.
+
+    Every callback gets its own bounded queue and worker tasks, so a slow
+    callback delays only its own messages. Messages of one device serial reach
+    each callback in arrival order; messages of different serials may be
+    delivered concurrently. When a queue is full, ``overflow_policy`` decides
+    whether ``dispatch`` waits, drops the oldest queued message, or merges the
+    message into a queued one of the same serial and type.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        overflow_policy: OverflowPolicies = OverflowPolicies.BLOCK,
+        concurrency: int = 1,
+    ) -> None:
+        """Create a dispatcher.
+
+        Args:
+            max_queue_size: Maximum number of messages waiting per callback.
+            overflow_policy: What to do with a message when a queue is full.
+            concurrency: Default number of concurrent invocations per callback.
+
+        Raises:
+            ValueError: If the queue size or concurrency is less than one.
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.concurrency = concurrency
+        self._lanes: dict[AsyncCallback, _CallbackLane] = {}
+
+    @property
+    def dropped(self) -> int:
+        """Return how many messages the drop-oldest policy discarded.
+
+        Returns:
+            Messages dropped across all current callback queues.
+        """
+        return sum(lane.dropped for lane in self._lanes.values())
+
+    @property
+    def coalesced(self) -> int:
+        """Return how many messages the coalesce policy merged.
+
+        Returns:
+            Messages merged across all current callback queues.
+        """
+        return sum(lane.coalesced for lane in self._lanes.values())
+
+    async def dispatch(
+        self,
+        text: str,
+        callbacks: Sequence[AsyncCallback],
+        concurrency: Mapping[AsyncCallback, int] | None = None,
+    ) -> None:
+        """Queue a message for every callback.
+
+        Queues are created for new callbacks and closed for callbacks that are
+        no longer in ``callbacks``.
+
+        Args:
+            text: Raw websocket message text.
+            callbacks: Currently registered callbacks.
+            concurrency: Per-callback concurrency overriding the default.
+        """
+        concurrency = concurrency or {}
+        for callback in [callback for callback in self._lanes if callback not in callbacks]:
+            await self._lanes.pop(callback).close()
+        message = _QueuedMessage.parse(text)
+        for callback in callbacks:
+            lane = self._lanes.get(callback)
+            if lane is None:
+                lane = self._lanes[callback] = _CallbackLane(
+                    callback,
+                    concurrency.get(callback, self.concurrency),
+                    self.max_queue_size,
+                    self.overflow_policy,
+                )
+            await lane.put(replace(message))
+
+    async def join(self) -> None:
+        """Wait until every queued message has been delivered."""
+        for lane in list(self._lanes.values()):
+            await lane.join()
+
+    async def close(self) -> None:
+        """Stop delivery and discard queued messages."""
+        lanes = list(self._lanes.values())
+        self._lanes.clear()
+        for lane in lanes:
+            await lane.close()
@@ -1,17 +1,24 @@
 """Tests for Carrier GraphQL API connection helpers."""
 
+import asyncio
+import copy
 from datetime import UTC, datetime, timedelta
-from typing import Any, Self, cast
+import gc
+from typing import Any, ClassVar, Self, cast
 
 from aiohttp import ClientConnectionError, ClientError, ClientResponseError, ClientSession
 from gql import GraphQLRequest, gql
-from gql.transport.exceptions import TransportQueryError, TransportServerError
+from gql.transport.exceptions import TransportClosed, TransportQueryError, TransportServerError
 import pytest
 
 import carrier_api
 from carrier_api import errors
 from carrier_api.api_connection_graphql import ApiConnectionGraphql
-from carrier_api.const import ActivityTypes, FanModes, HeatSourceTypes, SystemModes
+from carrier_api.config import Config
+from carrier_api.const import ActivityTypes, FanModes, HeatSourceTypes, QueryProfiles, SystemModes
+from carrier_api.energy import Energy
+from carrier_api.profile import Profile
+from carrier_api.status import Status
 from carrier_api.system import System
 
 
@@ -100,6 +107,7 @@ class FakeGraphQLClient:
     """Minimal gql client double that captures constructor arguments."""
 
     execute_timeout: int | float | None = None
+    instances: ClassVar[list[FakeGraphQLClient]] = []
 
     def __init__(self, **kwargs: Any) -> None:
         """Capture gql client keyword arguments.
@@ -108,7 +116,10 @@ class FakeGraphQLClient:
             kwargs: Keyword arguments passed to ``gql.Client``.
         """
         self.kwargs = kwargs
+        self.connect_count = 0
+        self.closed = False
         FakeGraphQLClient.execute_timeout = kwargs.get("execute_timeout")
+        FakeGraphQLClient.instances.append(self)
 
     async def __aenter__(self) -> Self:
         """Enter the fake async context manager.
@@ -125,6 +136,19 @@ class FakeGraphQLClient:
             args: Context manager exception details.
         """
 
+    async def connect_async(self) -> Self:
+        """Record a persistent connection.
+
+        Returns:
+            The fake GraphQL session.
+        """
+        self.connect_count += 1
+        return self
+
+    async def close_async(self) -> None:
+        """Record that the persistent connection was closed."""
+        self.closed = True
+
     async def execute(
         self,
         query: GraphQLRequest,
@@ -181,6 +205,17 @@ def graphql_client_double(
         async def __aexit__(self, *args: object) -> None:
             """Exit the fake session context."""
 
+        async def connect_async(self) -> Self:
+            """Return the fake persistent session.
+
+            Returns:
+                The fake GraphQL session.
+            """
+            return self
+
+        async def close_async(self) -> None:
+            """Close the fake persistent session."""
+
         async def execute(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
             """Return or raise the configured GraphQL result.
 
@@ -309,6 +344,139 @@ async def test_authed_query_uses_extended_execute_timeout(monkeypatch: pytest.Mo
     assert FakeGraphQLClient.execute_timeout == 60
 
 
+@pytest.mark.asyncio
+async def test_authed_query_reuses_pooled_session_until_token_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Reuse one GraphQL session across operations and rebuild it on token change.
+
+    Args:
+        monkeypatch: Pytest helper for replacing the GraphQL client.
+    """
+    monkeypatch.setattr("carrier_api.api_connection_graphql.Client", FakeGraphQLClient)
+    monkeypatch.setattr(FakeGraphQLClient, "instances", [])
+    session = FakeSession()
+    connection = ApiConnectionGraphql(
+        username="user@example.com",
+        password="password",
+        client_session=cast("ClientSession", session),
+    )
+    connection.refresh_token = "refresh"
+    connection.token_type = "Bearer"
+    connection.access_token = "access"
+    connection.expires_at = datetime.now(UTC) + timedelta(hours=1)
+    query = gql("query ExampleQuery { example }")
+
+    await connection.authed_query(operation_name="ExampleQuery", query=query, variable_values={})
+    await connection.authed_query(operation_name="ExampleQuery", query=query, variable_values={})
+
+    assert len(FakeGraphQLClient.instances) == 1
+    first_client = FakeGraphQLClient.instances[0]
+    assert first_client.connect_count == 1
+
+    connection.access_token = "rotated"
+    await connection.authed_query(operation_name="ExampleQuery", query=query, variable_values={})
+
+    assert len(FakeGraphQLClient.instances) == 2
+    assert first_client.closed
+    assert connection._graphql_pool is not None
+    assert connection._graphql_pool.authorization == "Bearer rotated"
+
+    await connection.cleanup()
+
+    assert FakeGraphQLClient.instances[1].closed
+    assert session.closed
+
+
+class GatedGraphQLClient(FakeGraphQLClient):
+    """GraphQL client double whose operations wait for a gate and fail once closed."""
+
+    gate: ClassVar[asyncio.Event]
+    closed_errors: ClassVar[int] = 0
+
+    async def execute(
+        self,
+        query: GraphQLRequest,
+        *,
+        variable_values: dict[str, Any],
+        operation_name: str,
+    ) -> dict[str, Any]:
+        """Wait for the gate, then fail when closed or pretend to have been closed.
+
+        Args:
+            query: GraphQL request.
+            variable_values: Variables supplied to the query.
+            operation_name: GraphQL operation name.
+
+        Returns:
+            Captured query metadata.
+
+        Raises:
+            TransportClosed: When the client was closed or a closed error is queued.
+        """
+        if operation_name == "Slow":
+            await GatedGraphQLClient.gate.wait()
+        if self.closed:
+            raise TransportClosed("Transport is not connected")
+        if GatedGraphQLClient.closed_errors:
+            GatedGraphQLClient.closed_errors -= 1
+            raise TransportClosed("Transport is not connected")
+        return await super().execute(
+            query, variable_values=variable_values, operation_name=operation_name
+        )
+
+
+@pytest.mark.asyncio
+async def test_token_change_keeps_replaced_session_open_for_running_operations(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Close a replaced session only after its running operations finish.
+
+    Args:
+        monkeypatch: Pytest helper for replacing the GraphQL client.
+    """
+    monkeypatch.setattr("carrier_api.api_connection_graphql.Client", GatedGraphQLClient)
+    monkeypatch.setattr(FakeGraphQLClient, "instances", [])
+    monkeypatch.setattr(GatedGraphQLClient, "gate", asyncio.Event(), raising=False)
+    connection = ApiConnectionGraphql(
+        username="user@example.com",
+        password="password",
+        client_session=cast("ClientSession", FakeSession()),
+    )
+    connection.refresh_token = "refresh"
+    connection.token_type = "Bearer"
+    connection.access_token = "access"
+    connection.expires_at = datetime.now(UTC) + timedelta(hours=1)
+
+    slow = asyncio.create_task(
+        connection.authed_query(
+            operation_name="Slow", query=gql("query Slow { example }"), variable_values={}
+        )
+    )
+    await asyncio.sleep(0)
+    connection.access_token = "rotated"
+    await connection.authed_query(
+        operation_name="Fast", query=gql("query Fast { example }"), variable_values={}
+    )
+    first_client, second_client = FakeGraphQLClient.instances
+
+    assert not first_client.closed
+    GatedGraphQLClient.gate.set()
+    assert (await slow)["operation_name"] == "Slow"
+    assert first_client.closed
+    assert not second_client.closed
+
+    monkeypatch.setattr(GatedGraphQLClient, "closed_errors", 1)
+    result = await connection.authed_query(
+        operation_name="Fast", query=gql("query Fast { example }"), variable_values={}
+    )
+
+    assert result["operation_name"] == "Fast"
+    assert second_client.closed
+    assert len(FakeGraphQLClient.instances) == 3
+    await connection.cleanup()
+
+
 @pytest.fixture
 def connection() -> SpyConnection:
     """Build a spy connection for API helper tests.
@@ -704,6 +872,136 @@ async def test_check_auth_expiration_logs_in_then_refreshes_when_expired(
     assert connection.refresh_count == 1
 
 
+class SlowRefreshConnection(SpyConnection):
+    """Spy connection whose token refresh waits until released."""
+
+    def __init__(self) -> None:
+        """Initialize a valid token state and the refresh gate."""
+        super().__init__()
+        self.refresh_token = "refresh"
+        self.release_refresh = asyncio.Event()
+        self.refresh_error: BaseException | None = None
+
+    async def refresh_auth_token(self) -> None:
+        """Record the refresh, wait for release, then extend or fail.
+
+        Raises:
+            BaseException: When ``refresh_error`` is configured.
+        """
+        self.refresh_count += 1
+        await self.release_refresh.wait()
+        if self.refresh_error is not None:
+            raise self.refresh_error
+        self.expires_at = datetime.now(UTC) + timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_check_auth_expiration_shares_one_refresh_for_concurrent_callers() -> None:
+    """Make concurrent callers with an expired token await a single refresh."""
+    connection = SlowRefreshConnection()
+    connection.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+
+    callers = asyncio.gather(*(connection.check_auth_expiration() for _ in range(5)))
+    await asyncio.sleep(0)
+    connection.release_refresh.set()
+    await callers
+
+    assert connection.refresh_count == 1
+    assert connection.expires_at > datetime.now(UTC) + timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_check_auth_expiration_shares_refresh_failures() -> None:
+    """Raise the shared refresh failure to every waiting caller."""
+    connection = SlowRefreshConnection()
+    connection.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+    connection.refresh_error = errors.CarrierApiTokenRefreshError("refresh failed")
+
+    callers = asyncio.gather(
+        *(connection.check_auth_expiration() for _ in range(3)), return_exceptions=True
+    )
+    await asyncio.sleep(0)
+    connection.release_refresh.set()
+
+    assert await callers == [connection.refresh_error] * 3
+    assert connection.refresh_count == 1
+
+
+@pytest.mark.asyncio
+async def test_check_auth_expiration_refreshes_proactively_within_skew() -> None:
+    """Return immediately near expiry while one refresh runs in the background."""
+    connection = SlowRefreshConnection()
+    connection.token_refresh_skew_seconds = 120
+    connection.expires_at = datetime.now(UTC) + timedelta(seconds=60)
+
+    await connection.check_auth_expiration()
+    await connection.check_auth_expiration()
+    await asyncio.sleep(0)
+
+    assert connection.refresh_count == 1
+    assert connection.expires_at < datetime.now(UTC) + timedelta(seconds=61)
+
+    connection.release_refresh.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert connection.expires_at > datetime.now(UTC) + timedelta(minutes=30)
+    await connection.check_auth_expiration()
+    assert connection.refresh_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_backs_off_and_warns(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Wait before retrying a failed background refresh and log the failure as a warning.
+
+    Args:
+        caplog: Pytest helper for captured log records.
+    """
+    connection = SlowRefreshConnection()
+    connection.token_refresh_skew_seconds = 120
+    connection.expires_at = datetime.now(UTC) + timedelta(seconds=60)
+    connection.refresh_error = errors.CarrierApiTokenRefreshError("refresh failed")
+    connection.release_refresh.set()
+
+    await connection.check_auth_expiration()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await connection.check_auth_expiration()
+    await asyncio.sleep(0)
+
+    assert connection.refresh_count == 1
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+
+    connection.token_refresh_retry_seconds = 0
+    connection.refresh_error = None
+    await connection.check_auth_expiration()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert connection.refresh_count == 2
+    assert connection._auth_failed_at is None
+
+
+@pytest.mark.asyncio
+async def test_renew_auth_refreshes_within_requested_margin(connection: SpyConnection) -> None:
+    """Refresh only when the token expires inside the caller's margin.
+
+    Args:
+        connection: Spy connection under test.
+    """
+    connection.refresh_token = "refresh"
+    connection.expires_at = datetime.now(UTC) + timedelta(minutes=20)
+
+    await connection.renew_auth(margin_seconds=600)
+    assert connection.refresh_count == 0
+
+    await connection.renew_auth(margin_seconds=1800)
+    assert connection.refresh_count == 1
+    assert connection.login_count == 0
+
+
 @pytest.mark.asyncio
 async def test_login_wraps_graphql_query_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     """Raise Carrier GraphQL errors instead of raw GraphQL query exceptions.
@@ -898,11 +1196,17 @@ async def test_query_helpers_send_expected_operation_and_variables(
         "operation": "getInfinityEnergy",
         "variables": {"serial": "SERIAL"},
     }
+    await connection.get_profile("SERIAL")
+    await connection.get_status("SERIAL")
+    await connection.get_config("SERIAL")
 
     assert connection.authed_calls == [
         ("getUser", {"userName": "user@example.com"}),
         ("getInfinitySystems", {"userName": "user@example.com"}),
         ("getInfinityEnergy", {"serial": "SERIAL"}),
+        ("getInfinityProfile", {"serial": "SERIAL"}),
+        ("getInfinityStatus", {"serial": "SERIAL"}),
+        ("getInfinityConfig", {"serial": "SERIAL"}),
     ]
 
 
@@ -962,9 +1266,14 @@ async def test_load_data_builds_systems_from_query_payloads(
     class FixtureConnection(SpyConnection):
         """Connection that returns fixture-backed system and energy payloads."""
 
-        async def get_systems(self) -> dict[str, Any]:
+        async def get_systems(
+            self, query_profile: QueryProfiles = QueryProfiles.FULL
+        ) -> dict[str, Any]:
             """Return fixture system data.
 
+            Args:
+                query_profile: Field-selection profile requested by ``load_data``.
+
             Returns:
                 Stored GraphQL systems fixture.
             """
@@ -991,88 +1300,539 @@ async def test_load_data_builds_systems_from_query_payloads(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    ("method_name", "args", "expected"),
-    [
-        (
-            "set_config_mode",
-            ("SERIAL", SystemModes.HEAT),
-            {"input": {"serial": "SERIAL", "mode": "heat"}},
-        ),
-        (
-            "set_config_heat_humidity",
-            ("SERIAL", 0),
-            {"input": {"serial": "SERIAL", "humidityHome": {"humidifier": "off"}}},
-        ),
-        (
-            "set_config_heat_humidity",
-            ("SERIAL", 35),
-            {"input": {"serial": "SERIAL", "humidityHome": {"humidifier": "on", "rhtg": 7.0}}},
-        ),
-        (
-            "set_heat_source",
-            ("SERIAL", HeatSourceTypes.SYSTEM),
-            {"input": {"serial": "SERIAL", "heatsource": "system"}},
-        ),
-    ],
-)
-async def test_system_config_mutations_build_expected_variables(
-    connection: SpyConnection,
-    method_name: str,
-    args: tuple[Any, ...],
-    expected: dict[str, Any],
+async def test_load_data_status_only_profile_builds_empty_configs(
+    system_response: dict[str, Any],
 ) -> None:
-    """Build expected system-level config mutation variables.
+    """Request the status-only document and tolerate the omitted config.
 
     Args:
-        connection: Spy connection under test.
-        method_name: Name of the mutation helper to call.
-        args: Arguments passed to the helper.
-        expected: Expected mutation variables.
+        system_response: Parsed systems fixture.
     """
-    method = getattr(connection, method_name)
+    status_only_response = {
+        "infinitySystems": [
+            {key: value for key, value in system.items() if key != "config"}
+            for system in system_response["infinitySystems"]
+        ]
+    }
 
-    assert await method(*args) == {"ok": True, "variables": expected}
-    assert connection.config_updates[-1] == expected
+    class StatusOnlyConnection(SpyConnection):
+        """Connection that answers with a status-only systems payload."""
+
+        async def authed_query(
+            self,
+            operation_name: str,
+            query: GraphQLRequest,
+            variable_values: dict[str, Any],
+        ) -> dict[str, Any]:
+            """Return the status-only fixture or empty energy data.
+
+            Args:
+                operation_name: GraphQL operation name.
+                query: Parsed GraphQL request.
+                variable_values: GraphQL variables.
+
+            Returns:
+                A response shaped like the requested operation result.
+            """
+            await super().authed_query(operation_name, query, variable_values)
+            if operation_name == "getInfinityEnergy":
+                return {"infinityEnergy": {}}
+            return status_only_response
+
+    connection = StatusOnlyConnection()
+
+    systems = await connection.load_data(QueryProfiles.STATUS_ONLY)
+
+    assert connection.authed_calls[0][0] == "getInfinitySystemsStatusOnly"
+    assert systems[0].status.zones
+    assert systems[0].config.zones == []
+    assert systems[0].as_dict()["config"]["zones"] == []
 
 
 @pytest.mark.asyncio
-async def test_set_humidifier_builds_combined_home_humidity_payload(
-    connection: SpyConnection,
+async def test_load_data_fetches_energy_concurrently_and_isolates_failures(
+    system_response: dict[str, Any],
+    energy_response: dict[str, Any],
 ) -> None:
-    """Build combined humidifier, over-cooling, cooling, and heating settings.
+    """Fetch energy concurrently within the limit and tolerate per-serial failures.
 
     Args:
-        connection: Spy connection under test.
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
     """
-    await connection.set_humidifier(
-        system_serial="SERIAL",
-        over_cooling=True,
-        cooling_percent=40,
-        heating_percent=25,
-    )
-    await connection.set_humidifier(system_serial="SERIAL", humidifier_on=False)
+    template = system_response["infinitySystems"][0]
+    serials = [f"SERIAL{index}" for index in range(5)]
+    multi_system_response = {
+        "infinitySystems": [
+            {**template, "profile": {**template["profile"], "serial": serial}} for serial in serials
+        ]
+    }
 
-    assert connection.config_updates == [
-        {
-            "input": {
-                "serial": "SERIAL",
-                "humidityHome": {
-                    "humid": "manual",
-                    "humidifier": "on",
-                    "rclgovercool": "on",
-                    "rclg": 8.0,
-                    "rhtg": 5.0,
-                },
-            }
-        },
-        {
-            "input": {
-                "serial": "SERIAL",
-                "humidityHome": {
-                    "humid": "off",
-                    "humidifier": "off",
-                },
+    class ConcurrentConnection(SpyConnection):
+        """Connection that records energy query concurrency."""
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_systems(
+            self, query_profile: QueryProfiles = QueryProfiles.FULL
+        ) -> dict[str, Any]:
+            """Return a multi-system fixture.
+
+            Args:
+                query_profile: Field-selection profile requested by ``load_data``.
+
+            Returns:
+                Systems fixture with several serial numbers.
+            """
+            return multi_system_response
+
+        async def get_energy(self, system_serial: str) -> dict[str, Any]:
+            """Return fixture energy, failing for one serial.
+
+            Args:
+                system_serial: Serial requested by ``load_data``.
+
+            Returns:
+                Stored GraphQL energy fixture.
+
+            Raises:
+                CarrierApiConnectionError: For the failing serial.
+            """
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            if system_serial == "SERIAL2":
+                raise errors.CarrierApiConnectionError("energy unavailable")
+            return energy_response
+
+    connection = ConcurrentConnection()
+    connection.energy_concurrency = 2
+
+    systems = await connection.load_data()
+
+    assert [system.profile.serial for system in systems] == serials
+    assert connection.max_in_flight == 2
+    assert systems[2].energy.periods == []
+    assert systems[2].energy.current_year_measurements() is None
+    assert systems[3].energy.current_year_measurements() is not None
+
+
+@pytest.mark.asyncio
+async def test_load_data_batches_energy_queries_and_falls_back_per_serial(
+    system_response: dict[str, Any],
+    energy_response: dict[str, Any],
+) -> None:
+    """Fetch energy with aliased chunked queries and retry failed chunks per serial.
+
+    Args:
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
+    """
+    template = system_response["infinitySystems"][0]
+    serials = [f"SERIAL{index}" for index in range(5)]
+    multi_system_response = {
+        "infinitySystems": [
+            {**template, "profile": {**template["profile"], "serial": serial}} for serial in serials
+        ]
+    }
+
+    class BatchConnection(SpyConnection):
+        """Connection that answers batched energy queries."""
+
+        async def get_systems(
+            self, query_profile: QueryProfiles = QueryProfiles.FULL
+        ) -> dict[str, Any]:
+            """Return a multi-system fixture.
+
+            Args:
+                query_profile: Field-selection profile requested by ``load_data``.
+
+            Returns:
+                Systems fixture with several serial numbers.
+            """
+            return multi_system_response
+
+        async def authed_query(
+            self,
+            operation_name: str,
+            query: GraphQLRequest,
+            variable_values: dict[str, Any],
+        ) -> dict[str, Any]:
+            """Answer energy queries, failing the chunk that contains ``SERIAL2``.
+
+            Args:
+                operation_name: GraphQL operation name.
+                query: Parsed GraphQL request.
+                variable_values: GraphQL variables.
+
+            Returns:
+                Aliased or single energy payloads.
+
+            Raises:
+                CarrierApiConnectionError: For queries that include ``SERIAL2``.
+            """
+            self.authed_calls.append((operation_name, variable_values))
+            if "SERIAL2" in variable_values.values():
+                raise errors.CarrierApiConnectionError("energy unavailable")
+            if operation_name == "getInfinityEnergy":
+                return energy_response
+            return {
+                name.replace("serial", "energy"): energy_response["infinityEnergy"]
+                for name in variable_values
+            }
+
+    connection = BatchConnection()
+    connection.energy_batch_size = 2
+
+    systems = await connection.load_data()
+
+    assert [system.profile.serial for system in systems] == serials
+    expected_calls = [
+        ("getInfinityEnergyBatch2", {"serial0": "SERIAL0", "serial1": "SERIAL1"}),
+        ("getInfinityEnergyBatch2", {"serial0": "SERIAL2", "serial1": "SERIAL3"}),
+        ("getInfinityEnergyBatch1", {"serial0": "SERIAL4"}),
+        ("getInfinityEnergy", {"serial": "SERIAL2"}),
+        ("getInfinityEnergy", {"serial": "SERIAL3"}),
+    ]
+    assert len(connection.authed_calls) == len(expected_calls)
+    assert all(call in connection.authed_calls for call in expected_calls)
+    assert systems[2].energy.periods == []
+    assert all(
+        systems[index].energy.current_year_measurements() is not None for index in (0, 1, 3, 4)
+    )
+
+
+class FixtureQueryConnection(SpyConnection):
+    """Connection that answers read queries from fixtures after yielding once."""
+
+    def __init__(self, system_response: dict[str, Any], energy_response: dict[str, Any]) -> None:
+        """Store the fixtures used to answer queries.
+
+        Args:
+            system_response: Parsed systems fixture.
+            energy_response: Parsed energy fixture.
+        """
+        super().__init__()
+        self.system_response = system_response
+        self.energy_response = energy_response
+
+    async def authed_query(
+        self,
+        operation_name: str,
+        query: GraphQLRequest,
+        variable_values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return the fixture for the operation, letting other callers run first.
+
+        Args:
+            operation_name: GraphQL operation name.
+            query: Parsed GraphQL request.
+            variable_values: GraphQL variables.
+
+        Returns:
+            A copy of the systems or energy fixture.
+        """
+        await super().authed_query(operation_name, query, variable_values)
+        await asyncio.sleep(0)
+        if operation_name == "getInfinityEnergy":
+            return copy.deepcopy(self.energy_response)
+        return copy.deepcopy(self.system_response)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_request(
+    system_response: dict[str, Any], energy_response: dict[str, Any]
+) -> None:
+    """Send one request for concurrent identical reads and give each caller its own result.
+
+    Args:
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
+    """
+    connection = FixtureQueryConnection(system_response, energy_response)
+
+    first, second, other_profile = await asyncio.gather(
+        connection.get_systems(),
+        connection.get_systems(),
+        connection.get_systems(QueryProfiles.STATUS_ONLY),
+    )
+
+    assert [call[0] for call in connection.authed_calls] == [
+        "getInfinitySystems",
+        "getInfinitySystemsStatusOnly",
+    ]
+    assert first == second == system_response
+    assert first is not second
+    assert other_profile is not first
+
+    await connection.get_systems()
+    assert len(connection.authed_calls) == 3
+
+    connection.deduplicate_reads = False
+    await asyncio.gather(connection.get_user_info(), connection.get_user_info())
+    assert len(connection.authed_calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_load_data_calls_share_one_load(
+    system_response: dict[str, Any], energy_response: dict[str, Any]
+) -> None:
+    """Share the queries of concurrent ``load_data`` calls and build models per caller.
+
+    Args:
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
+    """
+    connection = FixtureQueryConnection(system_response, energy_response)
+    connection.lazy_models = True
+
+    first, second = await asyncio.gather(connection.load_data(), connection.load_data())
+
+    assert [call[0] for call in connection.authed_calls] == [
+        "getInfinitySystems",
+        "getInfinityEnergy",
+    ]
+    assert [system.profile.serial for system in first] == ["SERIALXXX"]
+    assert [system.profile.serial for system in second] == ["SERIALXXX"]
+    assert first[0] is not second[0]
+    assert first[0].status.raw is not second[0].status.raw
+    assert first[0].status.loaded_fields() == second[0].status.loaded_fields() == []
+
+
+@pytest.mark.asyncio
+async def test_shared_read_errors_reach_every_caller() -> None:
+    """Raise a shared read's error to every caller and retry on the next call."""
+
+    class FailingConnection(SpyConnection):
+        """Connection whose reads fail after yielding once."""
+
+        async def authed_query(
+            self,
+            operation_name: str,
+            query: GraphQLRequest,
+            variable_values: dict[str, Any],
+        ) -> dict[str, Any]:
+            """Record a read and fail it.
+
+            Args:
+                operation_name: GraphQL operation name.
+                query: Parsed GraphQL request.
+                variable_values: GraphQL variables.
+
+            Raises:
+                CarrierApiConnectionError: Always.
+            """
+            await super().authed_query(operation_name, query, variable_values)
+            await asyncio.sleep(0)
+            raise errors.CarrierApiConnectionError("unavailable")
+
+    connection = FailingConnection()
+
+    results = await asyncio.gather(
+        connection.get_user_info(), connection.get_user_info(), return_exceptions=True
+    )
+
+    assert all(isinstance(result, errors.CarrierApiConnectionError) for result in results)
+    assert len(connection.authed_calls) == 1
+    with pytest.raises(errors.CarrierApiConnectionError):
+        await connection.get_user_info()
+    assert len(connection.authed_calls) == 2
+
+
+class SliceConnection(SpyConnection):
+    """Connection that answers per-serial slice queries from the systems fixture."""
+
+    def __init__(self, system_response: dict[str, Any]) -> None:
+        """Store the fixture used to answer slice queries.
+
+        Args:
+            system_response: Parsed systems fixture.
+        """
+        super().__init__()
+        self.system_payload = system_response["infinitySystems"][0]
+
+    async def authed_query(
+        self,
+        operation_name: str,
+        query: GraphQLRequest,
+        variable_values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return the fixture slice matching the requested operation.
+
+        Args:
+            operation_name: GraphQL operation name.
+            query: Parsed GraphQL request.
+            variable_values: GraphQL variables.
+
+        Returns:
+            A response shaped like Carrier's per-serial query result.
+        """
+        await super().authed_query(operation_name, query, variable_values)
+        section = operation_name.removeprefix("getInfinity").lower()
+        return {f"infinity{section.title()}": copy.deepcopy(self.system_payload[section])}
+
+
+@pytest.mark.asyncio
+async def test_refresh_system_rebuilds_only_requested_models(
+    system_response: dict[str, Any],
+) -> None:
+    """Fetch only the selected slices and replace only those models.
+
+    Args:
+        system_response: Parsed systems fixture.
+    """
+    connection = SliceConnection(system_response)
+    system = System(
+        profile=Profile(raw=system_response["infinitySystems"][0]["profile"]),
+        status=Status(raw={**system_response["infinitySystems"][0]["status"], "oat": 1}),
+        config=Config(raw=system_response["infinitySystems"][0]["config"]),
+        energy=Energy(raw={}),
+    )
+    original_profile = system.profile
+    original_config = system.config
+    original_energy = system.energy
+
+    refreshed = await connection.refresh_system(system)
+
+    assert refreshed is system
+    assert connection.authed_calls == [("getInfinityStatus", {"serial": "SERIALXXX"})]
+    assert system.status.outdoor_temperature != 1
+    assert system.profile is original_profile
+    assert system.config is original_config
+    assert system.energy is original_energy
+
+    connection.authed_calls.clear()
+    await connection.refresh_system(system, status=False, config=True, profile=True)
+
+    assert sorted(operation for operation, _ in connection.authed_calls) == [
+        "getInfinityConfig",
+        "getInfinityProfile",
+    ]
+    assert system.config is not original_config
+    assert system.config.etag == original_config.etag
+    assert system.profile is not original_profile
+    assert system.profile.serial == "SERIALXXX"
+
+
+@pytest.mark.asyncio
+async def test_refresh_status_rejects_missing_serial_payload(
+    monkeypatch: pytest.MonkeyPatch,
+    connection: SpyConnection,
+) -> None:
+    """Raise a GraphQL error when Carrier returns no data for the serial.
+
+    Args:
+        monkeypatch: Pytest helper for replacing the status query.
+        connection: Spy connection under test.
+    """
+
+    async def empty_status(
+        system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
+        """Return an empty status response.
+
+        Args:
+            system_serial: Serial requested by ``refresh_status``.
+            query_profile: Field-selection profile requested by ``refresh_status``.
+
+        Returns:
+            A response without a status object.
+        """
+        return {"infinityStatus": None, "serial": system_serial}
+
+    monkeypatch.setattr(connection, "get_status", empty_status)
+
+    with pytest.raises(errors.CarrierApiGraphqlError, match="infinityStatus") as error:
+        await connection.refresh_status("UNKNOWN")
+
+    assert error.value.payload == {"infinityStatus": None, "serial": "UNKNOWN"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method_name", "args", "expected"),
+    [
+        (
+            "set_config_mode",
+            ("SERIAL", SystemModes.HEAT),
+            {"input": {"serial": "SERIAL", "mode": "heat"}},
+        ),
+        (
+            "set_config_heat_humidity",
+            ("SERIAL", 0),
+            {"input": {"serial": "SERIAL", "humidityHome": {"humidifier": "off"}}},
+        ),
+        (
+            "set_config_heat_humidity",
+            ("SERIAL", 35),
+            {"input": {"serial": "SERIAL", "humidityHome": {"humidifier": "on", "rhtg": 7.0}}},
+        ),
+        (
+            "set_heat_source",
+            ("SERIAL", HeatSourceTypes.SYSTEM),
+            {"input": {"serial": "SERIAL", "heatsource": "system"}},
+        ),
+    ],
+)
+async def test_system_config_mutations_build_expected_variables(
+    connection: SpyConnection,
+    method_name: str,
+    args: tuple[Any, ...],
+    expected: dict[str, Any],
+) -> None:
+    """Build expected system-level config mutation variables.
+
+    Args:
+        connection: Spy connection under test.
+        method_name: Name of the mutation helper to call.
+        args: Arguments passed to the helper.
+        expected: Expected mutation variables.
+    """
+    method = getattr(connection, method_name)
+
+    assert await method(*args) == {"ok": True, "variables": expected}
+    assert connection.config_updates[-1] == expected
+
+
+@pytest.mark.asyncio
+async def test_set_humidifier_builds_combined_home_humidity_payload(
+    connection: SpyConnection,
+) -> None:
+    """Build combined humidifier, over-cooling, cooling, and heating settings.
+
+    Args:
+        connection: Spy connection under test.
+    """
+    await connection.set_humidifier(
+        system_serial="SERIAL",
+        over_cooling=True,
+        cooling_percent=40,
+        heating_percent=25,
+    )
+    await connection.set_humidifier(system_serial="SERIAL", humidifier_on=False)
+
+    assert connection.config_updates == [
+        {
+            "input": {
+                "serial": "SERIAL",
+                "humidityHome": {
+                    "humid": "manual",
+                    "humidifier": "on",
+                    "rclgovercool": "on",
+                    "rclg": 8.0,
+                    "rhtg": 5.0,
+                },
+            }
+        },
+        {
+            "input": {
+                "serial": "SERIAL",
+                "humidityHome": {
+                    "humid": "off",
+                    "humidifier": "off",
+                },
             }
         },
     ]
@@ -1142,43 +1902,44 @@ async def test_zone_mutations_build_expected_variables(connection: SpyConnection
     ]
 
 
-@pytest.mark.asyncio
-async def test_update_methods_send_reconcile_when_websocket_exists() -> None:
-    """Send reconcile after low-level mutation helpers when websocket is available."""
+class ReconcileWebsocket:
+    """Fake websocket that records reconcile requests."""
 
-    class ReconcileWebsocket:
-        """Fake websocket that records reconcile requests."""
+    def __init__(self) -> None:
+        """Initialize call count."""
+        self.calls = 0
 
-        def __init__(self) -> None:
-            """Initialize call count."""
-            self.calls = 0
+    async def send_reconcile(self) -> None:
+        """Record a reconcile request."""
+        self.calls += 1
 
-        async def send_reconcile(self) -> None:
-            """Record a reconcile request."""
-            self.calls += 1
 
-    class MutatingConnection(ApiConnectionGraphql):
-        """Connection with authed queries stubbed for mutation helper tests."""
+class MutatingConnection(ApiConnectionGraphql):
+    """Connection with authed queries stubbed for mutation helper tests."""
 
-        async def authed_query(
-            self,
-            operation_name: str,
-            query: GraphQLRequest,
-            variable_values: dict[str, Any],
-        ) -> dict[str, Any]:
-            """Return captured mutation metadata.
+    async def authed_query(
+        self,
+        operation_name: str,
+        query: GraphQLRequest,
+        variable_values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return captured mutation metadata.
 
-            Args:
-                operation_name: GraphQL operation name.
-                query: Parsed GraphQL request.
-                variable_values: GraphQL variables.
+        Args:
+            operation_name: GraphQL operation name.
+            query: Parsed GraphQL request.
+            variable_values: GraphQL variables.
+
+        Returns:
+            Mutation metadata.
+        """
+        assert query is not None
+        return {"operation": operation_name, "variables": variable_values}
 
-            Returns:
-                Mutation metadata.
-            """
-            assert query is not None
-            return {"operation": operation_name, "variables": variable_values}
 
+@pytest.mark.asyncio
+async def test_update_methods_send_reconcile_when_websocket_exists() -> None:
+    """Send reconcile after low-level mutation helpers when websocket is available."""
     websocket = ReconcileWebsocket()
     connection = MutatingConnection(
         username="user@example.com",
@@ -1205,6 +1966,353 @@ async def test_update_methods_send_reconcile_when_websocket_exists() -> None:
     assert websocket.calls == 3
 
 
+class BatchConfigConnection(SpyConnection):
+    """Connection that answers multi-system config mutations and fails chosen serials."""
+
+    batch_error: errors.CarrierApiError | None = None
+    failing_serials: ClassVar[set[str]] = {"SERIAL1"}
+
+    async def authed_query(
+        self,
+        operation_name: str,
+        query: GraphQLRequest,
+        variable_values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Answer ``updateInfinityConfigs`` with one config per serial.
+
+        Args:
+            operation_name: GraphQL operation name.
+            query: Parsed GraphQL request.
+            variable_values: GraphQL variables.
+
+        Returns:
+            Configs for the batch, with ``None`` for failing serials.
+
+        Raises:
+            CarrierApiError: The configured ``batch_error``.
+        """
+        await super().authed_query(operation_name, query, variable_values)
+        if self.batch_error is not None:
+            raise self.batch_error
+        return {
+            "updateInfinityConfigs": [
+                None if serial in self.failing_serials else {"etag": serial}
+                for serial in variable_values["input"]["serials"]
+            ]
+        }
+
+    async def _update_infinity_config(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Capture per-serial config mutations, failing chosen serials.
+
+        Args:
+            variables: Mutation variables.
+
+        Returns:
+            A small mutation result.
+
+        Raises:
+            CarrierApiGraphqlError: For serials in ``failing_serials``.
+        """
+        await super()._update_infinity_config(variables)
+        if variables["input"]["serial"] in self.failing_serials:
+            raise errors.CarrierApiGraphqlError("rejected")
+        return {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_set_config_modes_sends_one_batched_mutation() -> None:
+    """Update every serial with one request and report each serial's result."""
+    connection = BatchConfigConnection()
+
+    results = await connection.set_config_modes(["SERIAL0", "SERIAL1"], SystemModes.HEAT)
+
+    assert results == {"SERIAL0": True, "SERIAL1": False}
+    assert connection.authed_calls == [
+        ("updateInfinityConfigs", {"input": {"serials": ["SERIAL0", "SERIAL1"], "mode": "heat"}})
+    ]
+    assert connection.config_updates == []
+
+
+@pytest.mark.asyncio
+async def test_set_configs_falls_back_per_serial() -> None:
+    """Send unsupported fields, and rejected batches, one serial at a time."""
+    connection = BatchConfigConnection()
+
+    results = await connection.set_configs(
+        ["SERIAL0", "SERIAL1"], {"heatsource": HeatSourceTypes.SYSTEM.value}
+    )
+
+    assert results == {"SERIAL0": True, "SERIAL1": False}
+    assert connection.authed_calls == []
+    assert connection.config_updates == [
+        {"input": {"serial": "SERIAL0", "heatsource": HeatSourceTypes.SYSTEM.value}},
+        {"input": {"serial": "SERIAL1", "heatsource": HeatSourceTypes.SYSTEM.value}},
+    ]
+
+    connection.config_updates.clear()
+    connection.batch_error = errors.CarrierApiGraphqlError("unsupported")
+    results = await connection.set_configs(["SERIAL0", "SERIAL2"], {"sound": "on"})
+
+    assert results == {"SERIAL0": True, "SERIAL2": True}
+    assert [call[0] for call in connection.authed_calls] == ["updateInfinityConfigs"]
+    assert len(connection.config_updates) == 2
+    assert await connection.set_configs([], {"sound": "on"}) == {}
+    with pytest.raises(ValueError, match="serial"):
+        await connection.set_configs(["SERIAL0"], {"serial": "OTHER"})
+
+
+class WholeHouseConnection(SpyConnection):
+    """Connection that can reject whole-house mutations and single zones."""
+
+    reject_whole_house = False
+    failing_zones: ClassVar[set[str]] = {"2"}
+
+    async def authed_query(
+        self,
+        operation_name: str,
+        query: GraphQLRequest,
+        variable_values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Capture queries, rejecting the whole-house mutation when asked.
+
+        Args:
+            operation_name: GraphQL operation name.
+            query: Parsed GraphQL request.
+            variable_values: GraphQL variables.
+
+        Returns:
+            A small response containing the operation metadata.
+
+        Raises:
+            CarrierApiGraphqlError: When ``reject_whole_house`` is set.
+        """
+        response = await super().authed_query(operation_name, query, variable_values)
+        if self.reject_whole_house:
+            raise errors.CarrierApiGraphqlError("rejected")
+        return response
+
+    async def _update_infinity_config(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Capture system config mutations, rejecting zone lists when asked.
+
+        Args:
+            variables: Mutation variables.
+
+        Returns:
+            A small mutation result.
+
+        Raises:
+            CarrierApiGraphqlError: When ``reject_whole_house`` is set.
+        """
+        response = await super()._update_infinity_config(variables)
+        if self.reject_whole_house:
+            raise errors.CarrierApiGraphqlError("rejected")
+        return response
+
+    async def _update_infinity_zone_activity(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Capture zone activity mutations, failing chosen zones.
+
+        Args:
+            variables: Mutation variables.
+
+        Returns:
+            A small mutation result.
+
+        Raises:
+            CarrierApiConnectionError: For zones in ``failing_zones``.
+        """
+        response = await super()._update_infinity_zone_activity(variables)
+        if variables["input"]["zoneId"] in self.failing_zones:
+            raise errors.CarrierApiConnectionError("zone unavailable")
+        return response
+
+
+@pytest.mark.asyncio
+async def test_set_whole_house_activity_sends_one_mutation() -> None:
+    """Update every zone's activity with one whole-house request."""
+    connection = WholeHouseConnection()
+
+    results = await connection.set_whole_house_manual_activity(
+        "SERIAL", ["1", "2"], heat_set_point="68", cool_set_point="74", fan_mode=FanModes.LOW
+    )
+
+    assert results == {"1": True, "2": True}
+    assert connection.authed_calls == [
+        (
+            "updateInfinityWholeHouseActivity",
+            {
+                "input": {
+                    "serial": "SERIAL",
+                    "activityType": "manual",
+                    "htsp": "68",
+                    "clsp": "74",
+                    "fan": "low",
+                }
+            },
+        )
+    ]
+    assert connection.zone_activity_updates == []
+
+
+@pytest.mark.asyncio
+async def test_set_whole_house_activity_falls_back_per_zone() -> None:
+    """Update zones one at a time when Carrier rejects the whole-house request."""
+    connection = WholeHouseConnection()
+    connection.reject_whole_house = True
+
+    results = await connection.set_whole_house_activity(
+        "SERIAL", ["1", "2"], ActivityTypes.AWAY, fan_mode=FanModes.HIGH
+    )
+
+    assert results == {"1": True, "2": False}
+    assert connection.zone_activity_updates == [
+        {"input": {"serial": "SERIAL", "zoneId": zone_id, "activityType": "away", "fan": "high"}}
+        for zone_id in ("1", "2")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_set_whole_house_hold_sends_zone_list() -> None:
+    """Hold every zone through one config update, falling back to zone updates."""
+    connection = WholeHouseConnection()
+    hold = {"hold": "on", "holdActivity": "away", "otmr": None}
+
+    assert await connection.set_whole_house_hold("SERIAL", ["1", "2"], ActivityTypes.AWAY) == {
+        "1": True,
+        "2": True,
+    }
+    assert connection.config_updates == [
+        {
+            "input": {
+                "serial": "SERIAL",
+                "zones": [
+                    {"serial": "SERIAL", "zoneId": zone_id, **hold} for zone_id in ("1", "2")
+                ],
+            }
+        }
+    ]
+    assert connection.zone_config_updates == []
+
+    connection.reject_whole_house = True
+    assert await connection.resume_whole_house_schedule("SERIAL", ["1", "2"]) == {
+        "1": True,
+        "2": True,
+    }
+    assert connection.zone_config_updates == [
+        {
+            "input": {
+                "serial": "SERIAL",
+                "zoneId": zone_id,
+                "hold": "off",
+                "holdActivity": None,
+                "otmr": None,
+            }
+        }
+        for zone_id in ("1", "2")
+    ]
+    assert await connection.resume_whole_house_schedule("SERIAL", []) == {}
+
+
+@pytest.mark.asyncio
+async def test_zone_mutations_coalesce_per_zone() -> None:
+    """Send the zone updates of a coalescing window in one request per zone."""
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    class RecordingConnection(MutatingConnection):
+        """Mutating connection that records the requests it sends."""
+
+        async def authed_query(
+            self,
+            operation_name: str,
+            query: GraphQLRequest,
+            variable_values: dict[str, Any],
+        ) -> dict[str, Any]:
+            """Record a request and return its metadata.
+
+            Args:
+                operation_name: GraphQL operation name.
+                query: Parsed GraphQL request.
+                variable_values: GraphQL variables.
+
+            Returns:
+                Mutation metadata.
+            """
+            calls.append((operation_name, variable_values))
+            if operation_name.startswith("updateInfinityZoneBatch"):
+                return {f"update{index}": {"etag": index} for index in range(len(variable_values))}
+            return await super().authed_query(operation_name, query, variable_values)
+
+    websocket = ReconcileWebsocket()
+    connection = RecordingConnection(
+        username="user@example.com",
+        password="password",
+        client_session=cast("ClientSession", FakeSession()),
+        mutation_coalesce_seconds=0.01,
+    )
+    connection.api_websocket = websocket  # type: ignore[assignment]
+
+    fan, manual, home_fan, hold, other_zone = await asyncio.gather(
+        connection.update_fan("SERIAL", "1", ActivityTypes.MANUAL, FanModes.LOW),
+        connection.set_config_manual_activity("SERIAL", "1", "68", "74"),
+        connection.update_fan("SERIAL", "1", ActivityTypes.HOME, FanModes.HIGH),
+        connection.set_config_hold("SERIAL", "1", ActivityTypes.MANUAL),
+        connection.set_config_hold("SERIAL", "2", ActivityTypes.MANUAL),
+    )
+
+    assert calls == [
+        (
+            "updateInfinityZoneBatchActivityActivityConfig",
+            {
+                "input0": {
+                    "serial": "SERIAL",
+                    "zoneId": "1",
+                    "activityType": "manual",
+                    "fan": "low",
+                    "clsp": "74",
+                    "htsp": "68",
+                },
+                "input1": {
+                    "serial": "SERIAL",
+                    "zoneId": "1",
+                    "activityType": "home",
+                    "fan": "high",
+                },
+                "input2": {
+                    "serial": "SERIAL",
+                    "zoneId": "1",
+                    "hold": "on",
+                    "holdActivity": "manual",
+                    "otmr": None,
+                },
+            },
+        ),
+        (
+            "updateInfinityZoneConfig",
+            {
+                "input": {
+                    "serial": "SERIAL",
+                    "zoneId": "2",
+                    "hold": "on",
+                    "holdActivity": "manual",
+                    "otmr": None,
+                }
+            },
+        ),
+    ]
+    assert fan is manual
+    assert fan == {"updateInfinityZoneActivity": {"etag": 0}}
+    assert home_fan == {"updateInfinityZoneActivity": {"etag": 1}}
+    assert hold == {"updateInfinityZoneConfig": {"etag": 2}}
+    assert other_zone["operation"] == "updateInfinityZoneConfig"
+    assert connection.mutation_queue is not None
+    assert connection.mutation_queue.coalesced == 3
+    assert websocket.calls == 2
+
+    pending = asyncio.create_task(connection.resume_schedule("SERIAL", "1"))
+    await asyncio.sleep(0)
+    await connection.cleanup()
+    assert (await pending)["operation"] == "updateInfinityZoneConfig"
+
+
 @pytest.mark.asyncio
 async def test_get_entry_level_systems_sends_username(connection: SpyConnection) -> None:
     """Query entry-level systems by account username."""
@@ -1275,3 +2383,82 @@ async def test_load_entry_level_data_parses_systems(
     assert len(systems) == 1
     assert systems[0].serial == "SERIALXXX"
     assert systems[0].zones[0].mode == "cool"
+
+
+@pytest.mark.asyncio
+async def test_reconcile_is_debounced_after_mutation_bursts() -> None:
+    """Send one reconcile after a burst of mutations, or immediately on flush."""
+    websocket = ReconcileWebsocket()
+    connection = MutatingConnection(
+        username="user@example.com",
+        password="password",
+        client_session=cast("ClientSession", FakeSession()),
+        reconcile_debounce_seconds=0.01,
+    )
+    connection.api_websocket = websocket  # type: ignore[assignment]
+    variables: dict[str, Any] = {"input": {"serial": "SERIAL"}}
+
+    for _ in range(6):
+        await connection._update_infinity_zone_activity(variables)
+        await connection._update_infinity_zone_config(variables)
+    assert websocket.calls == 0
+
+    await asyncio.sleep(0.05)
+    assert websocket.calls == 1
+
+    await connection._update_infinity_config(variables)
+    await connection.flush_reconcile()
+    await connection.flush_reconcile()
+    await asyncio.sleep(0.05)
+    assert websocket.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_read_error_is_retrieved_after_every_caller_cancels() -> None:
+    """Retrieve a shared read's error when no caller is left to receive it."""
+    release = asyncio.Event()
+
+    class GatedFailingConnection(SpyConnection):
+        """Connection whose reads fail once released."""
+
+        async def authed_query(
+            self,
+            operation_name: str,
+            query: GraphQLRequest,
+            variable_values: dict[str, Any],
+        ) -> dict[str, Any]:
+            """Record a read, wait for the release, and fail it.
+
+            Args:
+                operation_name: GraphQL operation name.
+                query: Parsed GraphQL request.
+                variable_values: GraphQL variables.
+
+            Raises:
+                CarrierApiConnectionError: Always.
+            """
+            await super().authed_query(operation_name, query, variable_values)
+            await release.wait()
+            raise errors.CarrierApiConnectionError("unavailable")
+
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    connection = GatedFailingConnection()
+    callers = [asyncio.create_task(connection.get_user_info()) for _ in range(2)]
+    await asyncio.sleep(0)
+    (flight,) = connection._flights.values()  # type: ignore[union-attr]
+    read = flight.task
+    del flight
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.wait(callers)
+    release.set()
+    await asyncio.wait([read])
+    del read, callers, caller
+    gc.collect()
+    loop.set_exception_handler(None)
+
+    assert connection._flights == {}
+    assert unhandled == []
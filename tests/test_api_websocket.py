@@ -1,13 +1,24 @@
 """Tests for websocket connection state isolation."""
 
+from asyncio import CancelledError, Event, Task, sleep
 from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import cast
 
 from aiohttp import ClientConnectionError, ClientError, ClientSession, WSMsgType
 import pytest
 
-from carrier_api import ApiConnectionGraphql, ApiWebsocket, CarrierApiWebsocketError
+from carrier_api import (
+    ApiConnectionGraphql,
+    ApiWebsocket,
+    CallbackDispatcher,
+    CarrierApiAuthError,
+    CarrierApiTokenRefreshError,
+    CarrierApiWebsocketError,
+    ConnectionStates,
+    api_websocket as api_websocket_module,
+)
 
 
 class DummyApiConnectionGraphql(ApiConnectionGraphql):
@@ -95,16 +106,19 @@ class FakeListenerWebsocket:
         self,
         messages: list[SimpleNamespace],
         exception: BaseException | None = None,
+        receive_error: BaseException | None = None,
     ) -> None:
         """Initialize queued websocket messages.
 
         Args:
             messages: Messages yielded by the websocket iterator.
             exception: Optional websocket error reported by ``exception``.
+            receive_error: Optional error raised once the messages run out.
         """
         self.messages = messages
         self.closed = False
         self.exception_value = exception
+        self.receive_error = receive_error
 
     def __aiter__(self) -> AsyncIterator[SimpleNamespace]:
         """Return this websocket as an async iterator.
@@ -124,6 +138,8 @@ class FakeListenerWebsocket:
             StopAsyncIteration: When no messages remain.
         """
         if not self.messages:
+            if self.receive_error is not None:
+                raise self.receive_error
             raise StopAsyncIteration
         return self.messages.pop(0)
 
@@ -174,17 +190,20 @@ class FakeListenerSession:
         """
         self.websocket = websocket
         self.connected_url: str | None = None
+        self.receive_timeout: float | None = None
 
-    def ws_connect(self, url: str) -> FakeWebsocketContext:
+    def ws_connect(self, url: str, receive_timeout: float | None = None) -> FakeWebsocketContext:
         """Capture websocket URL and return a fake context.
 
         Args:
             url: Websocket URL.
+            receive_timeout: Receive idle timeout requested by the listener.
 
         Returns:
             Fake websocket context manager.
         """
         self.connected_url = url
+        self.receive_timeout = receive_timeout
         return FakeWebsocketContext(self.websocket)
 
 
@@ -199,11 +218,12 @@ class FailingListenerSession:
         """
         self.error = error
 
-    def ws_connect(self, url: str) -> FakeWebsocketContext:
+    def ws_connect(self, url: str, receive_timeout: float | None = None) -> FakeWebsocketContext:
         """Raise the configured websocket connection error.
 
         Args:
             url: Websocket URL.
+            receive_timeout: Receive idle timeout requested by the listener.
 
         Raises:
             ClientError | TimeoutError | OSError: Always raised for this
@@ -311,6 +331,42 @@ async def test_listener_dispatches_text_and_closes_on_close_command() -> None:
     assert api_websocket.task_heartbeat is None
 
 
+@pytest.mark.asyncio
+async def test_listener_hands_text_to_callback_dispatcher() -> None:
+    """Queue text messages for callbacks instead of awaiting them inline."""
+    websocket = FakeListenerWebsocket(
+        [
+            SimpleNamespace(type=WSMsgType.TEXT, data="first"),
+            SimpleNamespace(type=WSMsgType.TEXT, data="second"),
+        ]
+    )
+    api_websocket = FakeHeartbeatApiWebsocket(
+        FakeListenerConnection(websocket), FakeHeartbeatTask()
+    )
+    api_websocket.callback_dispatcher = CallbackDispatcher(max_queue_size=4)
+    release = Event()
+    received: list[str] = []
+
+    async def slow_capture(message: str) -> None:
+        """Capture a message once released.
+
+        Args:
+            message: Raw websocket text.
+        """
+        await release.wait()
+        received.append(message)
+
+    api_websocket.callback_add(slow_capture, concurrency=2)
+
+    await api_websocket.listener()
+
+    assert received == []
+    release.set()
+    await api_websocket.callback_dispatcher.join()
+    assert received == ["first", "second"]
+    await api_websocket.callback_dispatcher.close()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "connection_error",
@@ -408,3 +464,228 @@ async def test_listener_raises_websocket_error_messages(
     assert heartbeat_task.cancelled
     assert api_websocket.websocket is None
     assert api_websocket.task_heartbeat is None
+
+
+class RenewingConnection(DummyApiConnectionGraphql):
+    """Connection double that records background auth renewals."""
+
+    def __init__(self, renew_errors: list[BaseException | None]) -> None:
+        """Initialize token state and queued renewal outcomes.
+
+        Args:
+            renew_errors: Errors raised by successive renewals; ``None``
+                extends the token instead.
+        """
+        super().__init__()
+        self.refresh_token = "refresh"
+        self.expires_at = datetime.now(UTC) + timedelta(seconds=30)
+        self.renew_errors = renew_errors
+        self.renew_margins: list[float] = []
+        self.login_count = 0
+
+    async def renew_auth(self, margin_seconds: float) -> None:
+        """Record a renewal and apply the next queued outcome.
+
+        Args:
+            margin_seconds: Refresh margin requested by the refresher.
+
+        Raises:
+            BaseException: When the next queued outcome is an error.
+        """
+        self.renew_margins.append(margin_seconds)
+        error = self.renew_errors.pop(0)
+        if error is not None:
+            raise error
+        self.expires_at = datetime.now(UTC) + timedelta(hours=1)
+
+    async def login(self) -> None:
+        """Record a fallback login without extending the token."""
+        self.login_count += 1
+
+
+def test_next_token_refresh_at_uses_margin_before_expiry() -> None:
+    """Report the next background refresh time once the connection has a token."""
+    connection = RenewingConnection([])
+    api_websocket = ApiWebsocket(connection, token_refresh_margin_seconds=120)
+
+    assert api_websocket.next_token_refresh_at == connection.expires_at - timedelta(seconds=120)
+
+    connection.refresh_token = None
+
+    assert api_websocket.next_token_refresh_at is None
+
+
+@pytest.mark.asyncio
+async def test_loop_token_refresh_renews_ahead_of_expiry_and_recovers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Renew when due, re-login after rejection, and pace later attempts.
+
+    Args:
+        monkeypatch: Pytest helper for replacing the refresher's sleep.
+    """
+    connection = RenewingConnection(
+        [CarrierApiAuthError("refresh rejected"), CarrierApiTokenRefreshError("sso down"), None]
+    )
+    connection.token_refresh_retry_seconds = 45
+    api_websocket = ApiWebsocket(connection, token_refresh_margin_seconds=60)
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        """Record refresher delays and stop after the third renewal.
+
+        Args:
+            delay: Requested sleep in seconds.
+
+        Raises:
+            CancelledError: Once the queued renewals are exhausted.
+        """
+        delays.append(delay)
+        if not connection.renew_errors:
+            raise CancelledError
+
+    monkeypatch.setattr(api_websocket_module, "sleep", fake_sleep)
+
+    with pytest.raises(CancelledError):
+        await api_websocket.loop_token_refresh()
+
+    assert connection.renew_margins == [60, 60, 60]
+    assert connection.login_count == 1
+    assert delays[:2] == [45, 45]
+    assert delays[2] > 3000
+
+
+@pytest.mark.asyncio
+async def test_loop_listener_owns_optional_token_refresh_task() -> None:
+    """Run the token refresher only while an opted-in listener loop runs."""
+    connection = RenewingConnection([])
+    connection.expires_at = datetime.now(UTC) + timedelta(hours=1)
+    api_websocket = ApiWebsocket(connection, token_refresh=True)
+    started: list[Task[None] | None] = []
+
+    async def stop_listener() -> None:
+        """Capture the refresher task and stop the listener loop."""
+        started.append(api_websocket.task_token_refresh)
+        api_websocket.running = False
+
+    api_websocket.listener = stop_listener  # type: ignore[method-assign]
+
+    await api_websocket.loop_listener()
+    await sleep(0)
+
+    assert started[0] is not None
+    assert started[0].cancelled()
+    assert api_websocket.task_token_refresh is None
+    assert ApiWebsocket(connection).token_refresh is False
+
+
+def test_reconnect_delay_grows_with_jitter_up_to_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Double the reconnect delay per attempt, with jitter, up to the cap.
+
+    Args:
+        monkeypatch: Pytest fixture used to pin the jitter.
+    """
+    api_websocket = ApiWebsocket(
+        DummyApiConnectionGraphql(), reconnect_backoff_seconds=2, reconnect_backoff_max_seconds=30
+    )
+    monkeypatch.setattr(api_websocket_module, "random", lambda: 1.0)
+    delays = []
+    for attempts in range(6):
+        api_websocket.reconnect_attempts = attempts
+        delays.append(api_websocket.reconnect_delay())
+    assert delays == [2, 4, 8, 16, 30, 30]
+
+    monkeypatch.setattr(api_websocket_module, "random", lambda: 0.0)
+    assert api_websocket.reconnect_delay() == 15
+
+
+@pytest.mark.asyncio
+async def test_listener_reports_state_and_detects_idle_connections() -> None:
+    """Report connection states and treat a receive timeout as a dead socket."""
+    websocket = FakeListenerWebsocket(
+        [SimpleNamespace(type=WSMsgType.TEXT, data="payload")], receive_error=TimeoutError()
+    )
+    connection = FakeListenerConnection(websocket)
+    api_websocket = FakeHeartbeatApiWebsocket(connection, FakeHeartbeatTask())
+    api_websocket.receive_idle_timeout_seconds = 90
+    api_websocket.reconnect_attempts = 3
+    states: list[ConnectionStates] = []
+
+    async def record_state(state: ConnectionStates) -> None:
+        """Record a connection state change.
+
+        Args:
+            state: New connection state.
+        """
+        states.append(state)
+        assert api_websocket.connected == (state == ConnectionStates.CONNECTED)
+
+    api_websocket.state_callback_add(record_state)
+
+    with pytest.raises(CarrierApiWebsocketError):
+        await api_websocket.listener()
+
+    assert connection.listener_session.receive_timeout == 90
+    assert states == [
+        ConnectionStates.CONNECTING,
+        ConnectionStates.CONNECTED,
+        ConnectionStates.DISCONNECTED,
+    ]
+    assert api_websocket.last_received_at is not None
+    assert api_websocket.reconnect_attempts == 0
+    api_websocket.state_callback_remove(record_state)
+    assert api_websocket.state_callbacks == []
+
+
+@pytest.mark.asyncio
+async def test_loop_listener_backs_off_between_failed_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Wait a growing delay between reconnects instead of hot-spinning.
+
+    Args:
+        monkeypatch: Pytest fixture used to capture backoff sleeps.
+    """
+    api_websocket = ApiWebsocket(DummyApiConnectionGraphql())
+    monkeypatch.setattr(api_websocket_module, "random", lambda: 1.0)
+    delays: list[float] = []
+    states: list[ConnectionStates] = []
+    attempts = 0
+
+    async def record_sleep(delay: float) -> None:
+        """Record a backoff delay.
+
+        Args:
+            delay: Requested delay in seconds.
+        """
+        delays.append(delay)
+
+    async def record_state(state: ConnectionStates) -> None:
+        """Record a connection state change.
+
+        Args:
+            state: New connection state.
+        """
+        states.append(state)
+
+    async def failing_listener() -> None:
+        """Fail three connections, then stop the loop.
+
+        Raises:
+            CarrierApiWebsocketError: For the first three connections.
+        """
+        nonlocal attempts
+        attempts += 1
+        if attempts > 3:
+            api_websocket.running = False
+            return
+        raise CarrierApiWebsocketError("Carrier websocket connection failed")
+
+    monkeypatch.setattr(api_websocket_module, "sleep", record_sleep)
+    api_websocket.state_callback_add(record_state)
+    api_websocket.listener = failing_listener  # type: ignore[method-assign]
+
+    await api_websocket.loop_listener()
+
+    assert delays == [1, 2, 4]
+    assert states == [ConnectionStates.RECONNECTING, ConnectionStates.DISCONNECTED]
@@ -1,12 +1,20 @@
 """Tests for configuration schedule behavior."""
 
-from datetime import datetime, tzinfo
-from typing import Self
+from datetime import UTC, datetime, timedelta, tzinfo
+import json
+from pathlib import Path
+from typing import Any, Self
 
 import pytest
 
 from carrier_api import config as config_module
-from carrier_api.config import ConfigZone
+from carrier_api.config import (
+    Config,
+    ConfigZone,
+    ScheduleInterval,
+    ZoneSchedule,
+    active_schedule_periods,
+)
 from carrier_api.const import ActivityTypes
 
 
@@ -99,3 +107,222 @@ def test_current_scheduled_activity_includes_period_start_minute(
 
     assert current_scheduled_activity is not None
     assert current_scheduled_activity.type == ActivityTypes.HOME
+
+
+def test_zone_without_program_has_no_schedule() -> None:
+    """Tolerate zone configs loaded through a profile that omits schedules."""
+    zone = build_zone_with_periods([])
+    zone.program_json = None
+
+    assert zone.today_active_periods() == []
+    assert zone.yesterday_active_periods() == []
+    assert zone.current_scheduled_activity() is None
+    assert zone.next_activity_time() is None
+    assert zone.as_dict()["current_activity"]["from_schedule"] is None
+
+
+def test_config_tolerates_omitted_sections() -> None:
+    """Build an empty config when a status-only profile omits the payload."""
+    config = Config(raw={})
+
+    assert config.zones == []
+    assert config.mode is None
+    assert config.humidifier_heat_target is None
+    assert config.as_dict()["zones"] == []
+
+
+def scanned_schedule(program_json: dict[str, Any], moment: datetime) -> tuple[Any, Any]:
+    """Resolve a schedule by scanning its periods, as a reference for the index.
+
+    Args:
+        program_json: Raw zone program.
+        moment: Local time to resolve.
+
+    Returns:
+        The activity at ``moment`` and the next period time after it.
+    """
+    day = int(moment.strftime("%w"))
+    days = [active_schedule_periods(day_json["period"]) for day_json in program_json["day"]]
+    clock = moment.strftime("%H:%M")
+    started = [period for period in days[day] if period["time"] <= clock]
+    if started:
+        activity = started[-1]["activity"]
+    else:
+        activity = days[(day - 1) % 7][-1]["activity"] if days[(day - 1) % 7] else None
+    upcoming = [period["time"] for period in days[day] if period["time"] > clock]
+    tomorrow = days[(day + 1) % 7]
+    next_time = upcoming[0] if upcoming else (tomorrow[0]["time"] if tomorrow else None)
+    return activity, next_time
+
+
+def test_zone_schedule_index_matches_period_scan() -> None:
+    """Resolve every quarter hour of the fixture week the same way a period scan does."""
+    systems = json.loads((Path(__file__).parent / "graphql/systems.json").read_text())
+    program_json = systems["infinitySystems"][0]["config"]["zones"][0]["program"]
+    program_json["day"][3]["period"] = []
+    schedule = ZoneSchedule.from_program(program_json)
+    start = datetime(2026, 5, 24, tzinfo=UTC)
+
+    for quarter in range(7 * 24 * 4):
+        moment = start + timedelta(minutes=15 * quarter)
+        activity = schedule.activity_at(moment)
+
+        assert (activity.value if activity else None, schedule.next_time_after(moment)) == (
+            scanned_schedule(program_json, moment)
+        )
+
+
+def test_yesterday_active_periods_use_previous_day(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Select yesterday's periods from the day before the local date."""
+    monkeypatch.setattr(config_module, "datetime", FixedDateTime)
+    zone = build_zone_with_periods([])
+    assert zone.program_json is not None
+    for day, day_json in enumerate(zone.program_json["day"]):
+        day_json["period"] = [{"enabled": "on", "time": f"0{day}:00", "activity": "home"}]
+    zone.program_json = dict(zone.program_json)
+
+    assert [period["time"] for period in zone.today_active_periods()] == ["02:00"]
+    assert [period["time"] for period in zone.yesterday_active_periods()] == ["01:00"]
+    assert zone.next_activity_time() == "03:00"
+
+
+def test_schedule_lookups_order_periods_by_start_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolve periods by start time even when the program lists them out of order."""
+    monkeypatch.setattr(config_module, "datetime", FixedDateTime)
+    zone = build_wake_sleep_zone()
+    assert zone.program_json is not None
+    periods = [
+        {"enabled": "on", "time": time, "activity": activity}
+        for time, activity in (("10:00", "sleep"), ("07:00", "wake"), ("06:00", "sleep"))
+    ]
+    periods.append({"enabled": "on", "time": "09:00", "activity": "wake"})
+    zone.program_json = {"day": [{"period": periods} for _ in range(7)]}
+
+    assert [period["time"] for period in zone.today_active_periods()] == [
+        "06:00",
+        "07:00",
+        "09:00",
+        "10:00",
+    ]
+    activity = zone.current_scheduled_activity()
+    assert activity is not None
+    assert activity.type == ActivityTypes.WAKE
+    assert zone.next_activity_time() == "09:00"
+
+
+def test_scheduled_activity_before_first_period_uses_previous_day(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Resolve times before today's first period from the previous day's final period."""
+    monkeypatch.setattr(config_module, "datetime", FixedDateTime)
+    zone = build_wake_sleep_zone()
+    assert zone.program_json is not None
+    days: list[dict[str, Any]] = [{"period": []} for _ in range(7)]
+    days[1]["period"] = [{"enabled": "on", "time": "20:00", "activity": "sleep"}]
+    days[2]["period"] = [{"enabled": "on", "time": "10:00", "activity": "wake"}]
+    days[3]["period"] = [{"enabled": "on", "time": "20:00", "activity": "wake"}]
+    zone.program_json = {"day": days}
+
+    activity = zone.current_scheduled_activity()
+    assert activity is not None
+    assert activity.type == ActivityTypes.SLEEP
+
+
+def build_wake_sleep_zone(hold: str = "off", hold_until: str | None = None) -> ConfigZone:
+    """Build a zone that wakes at 06:00 and sleeps at 22:00 every day.
+
+    Args:
+        hold: Raw hold state.
+        hold_until: Raw hold end time.
+
+    Returns:
+        A config zone with wake and sleep activities.
+    """
+    period = [
+        {"enabled": "on", "time": "06:00", "activity": "wake"},
+        {"enabled": "on", "time": "22:00", "activity": "sleep"},
+    ]
+    return ConfigZone(
+        zone_json={
+            "id": "1",
+            "name": "Zone 1",
+            "holdActivity": "sleep",
+            "hold": hold,
+            "otmr": hold_until,
+            "occEnabled": "off",
+            "activities": [
+                {"type": "wake", "id": "1", "fan": "low", "htsp": "70", "clsp": "74"},
+                {"type": "sleep", "id": "2", "fan": "low", "htsp": "65", "clsp": "78"},
+            ],
+            "program": {"day": [{"period": period} for _ in range(7)]},
+        },
+        vacation_json={"type": "vacation", "fan": None, "htsp": None, "clsp": None},
+    )
+
+
+def test_schedule_intervals_expand_program_over_window() -> None:
+    """Expand a daily program into contiguous intervals with activity set points."""
+    zone = build_wake_sleep_zone()
+    monday = datetime(2026, 5, 25, tzinfo=UTC)
+
+    def interval(start: int, end: int, activity: ActivityTypes) -> ScheduleInterval:
+        set_points = {ActivityTypes.WAKE: (70.0, 74.0), ActivityTypes.SLEEP: (65.0, 78.0)}
+        return ScheduleInterval(
+            monday + timedelta(hours=start),
+            monday + timedelta(hours=end),
+            activity,
+            *set_points[activity],
+        )
+
+    assert zone.schedule_intervals(monday, monday + timedelta(days=2)) == [
+        interval(0, 6, ActivityTypes.SLEEP),
+        interval(6, 22, ActivityTypes.WAKE),
+        interval(22, 30, ActivityTypes.SLEEP),
+        interval(30, 46, ActivityTypes.WAKE),
+        interval(46, 48, ActivityTypes.SLEEP),
+    ]
+    assert zone.schedule_intervals(monday, monday) == []
+    with pytest.raises(ValueError, match="end must not be before start"):
+        zone.schedule_intervals(monday, monday - timedelta(hours=1))
+
+
+def test_schedule_intervals_apply_hold_from_now_until_it_ends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Apply a hold from now until ``hold_until`` and follow the schedule elsewhere.
+
+    Args:
+        monkeypatch: Pytest helper for fixing the current time at 08:30 local.
+    """
+    monkeypatch.setattr(config_module, "datetime", FixedDateTime)
+    tuesday = datetime(2026, 5, 26).astimezone()
+    held_until_ten = build_wake_sleep_zone(hold="on", hold_until="10:00")
+    held = build_wake_sleep_zone(hold="on")
+
+    def timeline(
+        zone: ConfigZone, start_hour: float, end_hour: float
+    ) -> list[tuple[float, float, ActivityTypes | None]]:
+        intervals = zone.schedule_intervals(
+            tuesday + timedelta(hours=start_hour), tuesday + timedelta(hours=end_hour)
+        )
+        return [
+            (
+                (interval.start - tuesday) / timedelta(hours=1),
+                (interval.end - tuesday) / timedelta(hours=1),
+                interval.activity,
+            )
+            for interval in intervals
+        ]
+
+    assert timeline(held_until_ten, 7, 12) == [
+        (7, 8.5, ActivityTypes.WAKE),
+        (8.5, 10, ActivityTypes.SLEEP),
+        (10, 12, ActivityTypes.WAKE),
+    ]
+    assert timeline(held_until_ten, 31, 36) == [(31, 36, ActivityTypes.WAKE)]
+    assert timeline(held, 0, 24) == [
+        (0, 6, ActivityTypes.SLEEP),
+        (6, 8.5, ActivityTypes.WAKE),
+        (8.5, 24, ActivityTypes.SLEEP),
+    ]
+    assert timeline(held, 24, 30) == [(24, 30, ActivityTypes.SLEEP)]
@@ -0,0 +1,188 @@
+"""Tests for the shared parsed GraphQL document registry."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from gql import GraphQLRequest, gql
+from graphql import OperationDefinitionNode, build_client_schema, validate
+import pytest
+
+from carrier_api import graphql_documents
+from carrier_api.benchmark import main as benchmark_main
+from carrier_api.const import QueryProfiles
+from carrier_api.graphql_documents import (
+    DOCUMENT_SOURCES,
+    energy_batch_operation_name,
+    graphql_document,
+    infinity_operation_name,
+    prune_selection,
+    zone_mutation_batch_operation_name,
+)
+
+
+@pytest.mark.parametrize("operation_name", sorted(DOCUMENT_SOURCES))
+def test_documents_parse_and_match_registry_key(operation_name: str) -> None:
+    """Every registered document parses and defines the operation it is keyed by.
+
+    Args:
+        operation_name: Registry key under test.
+    """
+    document = graphql_document(operation_name)
+
+    definitions = [
+        definition
+        for definition in document.document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    ]
+    assert [definition.name.value for definition in definitions if definition.name] == [
+        operation_name
+    ]
+
+
+def test_documents_are_parsed_once_and_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Parse each operation on first use only and return the shared request.
+
+    Args:
+        monkeypatch: Pytest helper for isolating the registry and counting parses.
+    """
+    parsed: list[str] = []
+
+    def counting_gql(source: str) -> GraphQLRequest:
+        """Record and delegate document parsing.
+
+        Args:
+            source: GraphQL document source.
+
+        Returns:
+            The parsed GraphQL request.
+        """
+        parsed.append(source)
+        return gql(source)
+
+    monkeypatch.setattr(graphql_documents, "_PARSED_DOCUMENTS", {})
+    monkeypatch.setattr(graphql_documents, "gql", counting_gql)
+
+    first = graphql_document("getInfinitySystems")
+    second = graphql_document("getInfinitySystems")
+
+    assert first is second
+    assert parsed == [DOCUMENT_SOURCES["getInfinitySystems"]]
+
+
+def test_unknown_document_raises_key_error() -> None:
+    """Reject operation names without a registered document."""
+    with pytest.raises(KeyError):
+        graphql_document("notAnOperation")
+
+
+def test_benchmark_reports_graphql_parse_timings(capsys: pytest.CaptureFixture[Any]) -> None:
+    """Run the GraphQL parse benchmark with a tiny iteration count.
+
+    Args:
+        capsys: Pytest helper for capturing printed output.
+    """
+    benchmark_main(["graphql-parse", "--iterations", "2"])
+
+    output = capsys.readouterr().out
+    assert "gql() per call: getInfinitySystems" in output
+    assert "graphql_document(): getInfinitySystems" in output
+
+
+def document_fields(operation_name: str) -> str:
+    """Return a registered document source with whitespace collapsed.
+
+    Args:
+        operation_name: Registered operation name.
+
+    Returns:
+        The document source as space-separated tokens.
+    """
+    return " ".join(DOCUMENT_SOURCES[operation_name].split())
+
+
+def test_query_profiles_prune_the_shared_field_tree() -> None:
+    """Render smaller systems documents from the full selection tree."""
+    dashboard = infinity_operation_name("getInfinitySystems", QueryProfiles.DASHBOARD)
+    status_only = infinity_operation_name("getInfinitySystems", QueryProfiles.STATUS_ONLY)
+
+    assert infinity_operation_name("getInfinitySystems", QueryProfiles.FULL) == (
+        "getInfinitySystems"
+    )
+    assert dashboard == "getInfinitySystemsDashboard"
+    assert status_only == "getInfinitySystemsStatusOnly"
+    assert "program {" in document_fields("getInfinitySystems")
+    assert "program {" not in document_fields(dashboard)
+    assert "humidityAway {" not in document_fields(dashboard)
+    assert "humidityHome {" in document_fields(dashboard)
+    assert "config {" not in document_fields(status_only)
+    assert "status {" in document_fields(status_only)
+
+
+def test_query_profiles_reuse_unchanged_slice_documents() -> None:
+    """Share one document when a profile does not change a slice."""
+    assert {infinity_operation_name("getInfinityStatus", profile) for profile in QueryProfiles} == {
+        "getInfinityStatus"
+    }
+    assert infinity_operation_name("getInfinityConfig", QueryProfiles.DASHBOARD) == (
+        "getInfinityConfigDashboard"
+    )
+    with pytest.raises(ValueError, match="status-only"):
+        infinity_operation_name("getInfinityConfig", QueryProfiles.STATUS_ONLY)
+
+
+def test_prune_selection_drops_emptied_branches() -> None:
+    """Remove branches whose fields were all omitted."""
+    selection = ("id", ("odu", ("type",)), ("zones", ("id", ("program", ("day",)))))
+
+    assert prune_selection(selection, frozenset({"odu.type", "zones.program"})) == (
+        "id",
+        ("zones", ("id",)),
+    )
+
+
+def test_energy_batch_documents_alias_one_field_per_serial() -> None:
+    """Build one aliased ``infinityEnergy`` selection per serial variable."""
+    operation_name = energy_batch_operation_name(3)
+    document = graphql_document(operation_name)
+
+    operation = document.document.definitions[0]
+    assert isinstance(operation, OperationDefinitionNode)
+    assert operation_name == "getInfinityEnergyBatch3"
+    assert [variable.variable.name.value for variable in operation.variable_definitions or ()] == [
+        "serial0",
+        "serial1",
+        "serial2",
+    ]
+    assert [
+        (field.alias.value if field.alias else None, field.name.value)  # type: ignore[attr-defined]
+        for field in operation.selection_set.selections
+    ] == [(f"energy{index}", "infinityEnergy") for index in range(3)]
+    with pytest.raises(ValueError, match="at least one serial"):
+        energy_batch_operation_name(0)
+
+
+def test_zone_mutation_batches_alias_each_mutation_in_order() -> None:
+    """Build one aliased zone mutation per input that validates against the schema."""
+    operation_name = zone_mutation_batch_operation_name(
+        ["updateInfinityZoneActivity", "updateInfinityZoneConfig"]
+    )
+    document = graphql_document(operation_name)
+    introspection = json.loads((Path(__file__).parents[1] / "schema.graphql").read_text())
+
+    operation = document.document.definitions[0]
+    assert isinstance(operation, OperationDefinitionNode)
+    assert operation_name == "updateInfinityZoneBatchActivityConfig"
+    assert [variable.variable.name.value for variable in operation.variable_definitions or ()] == [
+        "input0",
+        "input1",
+    ]
+    assert [
+        (field.alias.value if field.alias else None, field.name.value)  # type: ignore[attr-defined]
+        for field in operation.selection_set.selections
+    ] == [("update0", "updateInfinityZoneActivity"), ("update1", "updateInfinityZoneConfig")]
+    assert validate(build_client_schema(introspection), document.document) == []
+    with pytest.raises(ValueError, match="at least one mutation"):
+        zone_mutation_batch_operation_name([])
+    with pytest.raises(ValueError, match="cannot be batched"):
+        zone_mutation_batch_operation_name(["updateInfinityConfig"])
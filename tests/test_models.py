@@ -1,7 +1,9 @@
 """Tests for Carrier model serialization and branch behavior."""
 
 from copy import deepcopy
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from types import MemberDescriptorType
 from typing import Any
 
 import pytest
@@ -15,11 +17,15 @@ from carrier_api import (
     Profile,
     Status,
     System,
+    expand_schedules,
 )
+from carrier_api.benchmark import main as benchmark_main, split_key_json_value
 from carrier_api.config import ConfigZone, ConfigZoneActivity, active_schedule_periods
 from carrier_api.const import ActivityTypes, FanModes, SystemModes
-from carrier_api.status import StatusZone
-from carrier_api.util import safely_get_json_value
+from carrier_api.energy import EnergyMeasurement
+from carrier_api.entry_level import EntryLevelSystem, EntryLevelZone
+from carrier_api.status import StatusUnit, StatusZone
+from carrier_api.util import attribute_values, json_path, merge_delta, safely_get_json_value
 
 
 def test_profile_as_dict_and_string_representations(system_response: dict[str, Any]) -> None:
@@ -688,6 +694,181 @@ def test_safely_get_json_value_handles_nested_lists_none_and_cast_failures() ->
     assert safely_get_json_value([], "missing") is None
 
 
+@pytest.mark.parametrize(
+    ("json", "key", "callable_to_cast"),
+    [
+        ({"items": [{"value": "42"}, {"value": "none"}]}, "items.0.value", int),
+        ({"items": [{"value": "42"}, {"value": "NONE"}]}, "items.1.value", None),
+        ({"items": [{"value": "42"}]}, "items.-1.value", int),
+        ({"items": [{"value": "42"}]}, "items.-2.value", None),
+        ({"items": [{"value": "42"}]}, "items.value", None),
+        ({"items": ({"value": 1},)}, "items.0.value", None),
+        ({"name": "zone"}, "name.1", None),
+        ({"name": "zone"}, "name.missing", None),
+        ({"count": 3}, "count.0", None),
+        ({"flag": None}, "flag.value", None),
+        ({"idu": {"cfm": "bad"}}, "idu.cfm", int),
+        ([{"id": "1"}], "0.id", str),
+        ([], "missing", None),
+    ],
+)
+def test_json_path_matches_split_key_lookup(json: Any, key: str, callable_to_cast: Any) -> None:
+    """Resolve compiled paths exactly like the split-key lookup they replace.
+
+    Args:
+        json: Payload to traverse.
+        key: Dot-separated lookup path.
+        callable_to_cast: Optional cast for the resolved value.
+    """
+    expected = split_key_json_value(json, key, callable_to_cast)
+
+    assert json_path(key, callable_to_cast)(json) == expected
+    assert safely_get_json_value(json, key, callable_to_cast) == expected
+    assert json_path(key, callable_to_cast) is json_path(key, callable_to_cast)
+
+
+def test_json_path_benchmark_reports_timings(capsys: pytest.CaptureFixture[Any]) -> None:
+    """Run the JSON path benchmark with a tiny iteration count.
+
+    Args:
+        capsys: Pytest helper for capturing printed output.
+    """
+    benchmark_main(["json-path", "--iterations", "2"])
+
+    output = capsys.readouterr().out
+    assert "split key per call: " in output
+    assert "json_path() getters: " in output
+    assert "build Profile, Status, Config: systems.json" in output
+
+
+def test_models_keep_attributes_in_slots(
+    system_response: dict[str, Any], energy_response: dict[str, Any]
+) -> None:
+    """Store model attributes in slots while keeping class defaults readable.
+
+    Args:
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
+    """
+    raw_system = system_response["infinitySystems"][0]
+    raw_status = {key: value for key, value in raw_system["status"].items() if key != "humid"}
+    status = Status(raw=raw_status)
+    config = Config(raw=raw_system["config"])
+    activity = config.zones[0].activities[0]
+    measurement = Energy(energy_response["infinityEnergy"]).periods[0]
+
+    for model_type in (
+        Status,
+        StatusZone,
+        StatusUnit,
+        Config,
+        ConfigZone,
+        ConfigZoneActivity,
+        Profile,
+        EnergyMeasurement,
+        EntryLevelZone,
+        EntryLevelSystem,
+    ):
+        assert "__slots__" in vars(model_type)
+    for model in (status, status.zones[0], config, config.zones[0], activity, measurement):
+        assert not hasattr(model, "__dict__")
+    assert status.humidifier_on is None
+    assert attribute_values(status)["humidifier_on"] is None
+    assert attribute_values(activity) == {
+        "type": activity.type,
+        "api_id": activity.api_id,
+        "fan": activity.fan,
+        "heat_set_point": activity.heat_set_point,
+        "cool_set_point": activity.cool_set_point,
+    }
+    with pytest.raises(AttributeError):
+        status.undeclared = True  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = config.missing  # type: ignore[attr-defined]
+    assert Status.outdoor_unit is None  # type: ignore[misc]
+    for model_type, names in (
+        (Status, ("outdoor_unit", "indoor_unit", "time_stamp", "mode")),
+        (Config, ("temperature_unit", "humidifier_heat_target")),
+        (Profile, ("model", "outdoor_unit_type")),
+    ):
+        for name in names:
+            assert getattr(model_type, name) is None
+    assert isinstance(vars(Status)["outdoor_unit"], MemberDescriptorType)
+    assert isinstance(StatusZone.api_id, MemberDescriptorType)  # type: ignore[misc]
+
+
+def test_expand_schedules_covers_every_zone_of_every_system(systems: list[System]) -> None:
+    """Expand every zone program of every system into contiguous intervals.
+
+    Args:
+        systems: Systems built from the fixtures.
+    """
+    start = datetime(2026, 5, 24, 12, 15, tzinfo=UTC)
+    end = start + timedelta(days=7)
+
+    timelines = expand_schedules(systems, start, end)
+
+    assert list(timelines) == [system.profile.serial for system in systems]
+    for system in systems:
+        assert list(timelines[system.profile.serial]) == [
+            zone.api_id for zone in system.config.zones
+        ]
+    intervals = timelines[systems[0].profile.serial][systems[0].config.zones[0].api_id]
+    assert intervals[0].start == start
+    assert intervals[-1].end == end
+    assert all(
+        previous.end == interval.start and previous.activity != interval.activity
+        for previous, interval in pairwise(intervals)
+    )
+    assert all(interval.heat_set_point is not None for interval in intervals)
+
+
+def test_lazy_models_decode_fields_on_first_access(system_response: dict[str, Any]) -> None:
+    """Decode lazy status and config fields on access and match eager models.
+
+    Args:
+        system_response: Parsed systems fixture.
+    """
+    raw_system = system_response["infinitySystems"][0]
+    status = Status(raw=raw_system["status"], lazy=True)
+    config = Config(raw=raw_system["config"], lazy=True)
+
+    assert status.loaded_fields() == []
+    assert status.outdoor_temperature == Status(raw=raw_system["status"]).outdoor_temperature
+    assert status.loaded_fields() == ["outdoor_temperature"]
+    assert status.zones[0].temperature is not None
+    assert status.zones[0].loaded_fields() == ["temperature"]
+    assert config.loaded_fields() == []
+    assert status.as_dict() == Status(raw=raw_system["status"]).as_dict()
+    assert config.as_dict() == Config(raw=raw_system["config"]).as_dict()
+
+    raw_status = deepcopy(raw_system["status"])
+    status = Status(raw=raw_status, lazy=True)
+    names = status.load_fields({"oat": 1, "idu": {}})
+    assert status.outdoor_temperature is not None
+    raw_status["oat"] = status.outdoor_temperature + 1
+
+    assert "outdoor_temperature" in names
+    assert "indoor_unit" in names
+    assert "mode" not in names
+    assert status.reload_fields(names) == [
+        ("outdoor_temperature", raw_status["oat"] - 1, raw_status["oat"])
+    ]
+
+
+def test_memory_benchmark_reports_bytes_per_system(capsys: pytest.CaptureFixture[Any]) -> None:
+    """Run the memory benchmark with a tiny iteration count.
+
+    Args:
+        capsys: Pytest helper for capturing printed output.
+    """
+    benchmark_main(["memory", "--iterations", "2"])
+
+    output = capsys.readouterr().out
+    assert "System models: systems.json, energy.json" in output
+    assert " B/call" in output
+
+
 def test_activity_and_fan_string_representations() -> None:
     """Serialize standalone config activity values."""
     activity = ConfigZoneActivity(
@@ -710,3 +891,27 @@ def test_activity_and_fan_string_representations() -> None:
         "cool_set_point": 76.0,
     }
     assert repr(activity) == str(activity.as_dict())
+
+
+def test_merge_delta_merges_id_lists_and_replaces_other_lists() -> None:
+    """Merge id-keyed entries by id and let later plain lists win."""
+    stale = {
+        "zones": [{"id": "1", "rt": "70", "holds": [1]}, {"id": "2", "rt": "68"}],
+        "modes": ["heat"],
+    }
+    update = {
+        "zones": [{"id": "1", "rt": "71", "holds": [2]}, {"id": "3", "rt": "65"}],
+        "modes": ["cool"],
+    }
+
+    assert merge_delta(stale, update) is stale
+    assert stale == {
+        "zones": [
+            {"id": "1", "rt": "71", "holds": [2]},
+            {"id": "2", "rt": "68"},
+            {"id": "3", "rt": "65"},
+        ],
+        "modes": ["cool"],
+    }
+    assert merge_delta({"zones": [{"id": "1"}]}, {"zones": []}) == {"zones": [{"id": "1"}]}
+    assert merge_delta([1], None) is None
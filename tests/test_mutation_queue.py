@@ -0,0 +1,115 @@
+"""Tests for coalescing mutations that target the same object."""
+
+from asyncio import create_task, gather, sleep
+from typing import Any
+
+import pytest
+
+from carrier_api import CarrierApiGraphqlError, MutationQueue
+
+
+class RecordingSender:
+    """Mutation sender that records the variables it sends."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Initialize captured state.
+
+        Args:
+            error: Optional error to raise for every send.
+        """
+        self.sent: list[dict[str, Any]] = []
+        self.error = error
+
+    async def __call__(self, variables: dict[str, Any]) -> dict[str, Any]:
+        """Record a send and return a response naming it.
+
+        Args:
+            variables: Merged mutation variables.
+
+        Returns:
+            A response containing the send's position.
+
+        Raises:
+            Exception: The configured error.
+        """
+        self.sent.append(variables)
+        if self.error is not None:
+            raise self.error
+        return {"send": len(self.sent)}
+
+
+@pytest.mark.asyncio
+async def test_submissions_within_window_share_one_request() -> None:
+    """Merge inputs for one target, with later fields winning, and share the response."""
+    queue = MutationQueue(window_seconds=0.01)
+    sender = RecordingSender()
+
+    results = await gather(
+        queue.submit("zone-1", {"input": {"zoneId": "1", "fan": "low"}}, sender),
+        queue.submit("zone-1", {"input": {"zoneId": "1", "htsp": "68", "fan": "high"}}, sender),
+        queue.submit("zone-2", {"input": {"zoneId": "2", "fan": "med"}}, sender),
+    )
+
+    assert sorted(sender.sent, key=lambda variables: variables["input"]["zoneId"]) == [
+        {"input": {"zoneId": "1", "fan": "high", "htsp": "68"}},
+        {"input": {"zoneId": "2", "fan": "med"}},
+    ]
+    assert results[0] == results[1]
+    assert results[0] != results[2]
+    assert queue.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_merged_caller() -> None:
+    """Raise a failed request's error to each caller merged into it."""
+    queue = MutationQueue(window_seconds=0.01)
+    sender = RecordingSender(CarrierApiGraphqlError("rejected"))
+
+    results = await gather(
+        queue.submit("zone-1", {"input": {"fan": "low"}}, sender),
+        queue.submit("zone-1", {"input": {"htsp": "68"}}, sender),
+        return_exceptions=True,
+    )
+
+    assert len(sender.sent) == 1
+    assert all(isinstance(result, CarrierApiGraphqlError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_pending_mutations_before_window_closes() -> None:
+    """Send pending mutations when flushed instead of waiting for the window."""
+    queue = MutationQueue(window_seconds=60)
+    sender = RecordingSender()
+    pending = create_task(queue.submit("zone-1", {"input": {"fan": "low"}}, sender))
+    await sleep(0)
+
+    await queue.flush()
+
+    assert await pending == {"send": 1}
+    assert sender.sent == [{"input": {"fan": "low"}}]
+
+
+@pytest.mark.asyncio
+async def test_parts_of_one_target_share_a_batch_in_submission_order() -> None:
+    """Send different parts of a target together and give each caller its part's response."""
+    batches: list[list[tuple[object, dict[str, Any]]]] = []
+
+    async def send_batch(parts: list[tuple[Any, dict[str, Any]]]) -> list[dict[str, Any]]:
+        batches.append(parts)
+        return [{"part": part} for part, _ in parts]
+
+    queue = MutationQueue(window_seconds=0.01, send_batch=send_batch)
+    sender = RecordingSender()
+
+    results = await gather(
+        queue.submit("zone-1", {"input": {"fan": "low"}}, sender, part="manual"),
+        queue.submit("zone-1", {"input": {"hold": "on"}}, sender, part="hold"),
+        queue.submit("zone-1", {"input": {"htsp": "68"}}, sender, part="manual"),
+    )
+
+    assert batches == [
+        [("manual", {"input": {"fan": "low", "htsp": "68"}}), ("hold", {"input": {"hold": "on"}})]
+    ]
+    assert results == [{"part": "manual"}, {"part": "hold"}, {"part": "manual"}]
+    assert sender.sent == []
+    assert queue.coalesced == 2
@@ -1,5 +1,7 @@
 """Tests for merging Carrier websocket updates into loaded system models."""
 
+from asyncio import sleep
+from collections.abc import Awaitable, Callable
 import json
 from pathlib import Path
 from typing import Any
@@ -8,15 +10,21 @@ import pytest
 
 from carrier_api import (
     ActivityTypes,
+    ApiConnectionGraphql,
+    ApiWebsocket,
     Config,
+    ConnectionStates,
     Energy,
     FanModes,
+    FieldChange,
     Profile,
+    QueryProfiles,
     Status,
     System,
     WebsocketDataUpdater,
 )
 from carrier_api.api_websocket_data_updater import find_by_id
+from carrier_api.errors import CarrierApiConnectionError
 
 FIXTURE_ROOT = Path(__file__).parent
 
@@ -382,6 +390,39 @@ async def test_config_zone_program_message_handler(
     assert carrier_system.config.zones[0].program_json == reprocessed_config.zones[0].program_json
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("websocket_message_str", ["messages/config_zone_hold.json"], indirect=True)
+async def test_config_zone_schedule_rebuilds_only_for_program_messages(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+    websocket_message_str: str,
+) -> None:
+    """Keep a zone's schedule index until a message touches its program.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+        websocket_message_str: Raw zone hold config websocket message fixture.
+    """
+    zone = carrier_system.config.zones[0]
+    schedule = zone.schedule
+    assert schedule is not None
+
+    await data_updater.message_handler(websocket_message_str)
+
+    assert zone.schedule is schedule
+
+    program_message = {
+        "messageType": "InfinityConfig",
+        "deviceId": "SERIALXXX",
+        "zones": [{"id": "1", "program": {"id": "1"}}],
+    }
+    await data_updater.message_handler(json.dumps(program_message))
+
+    assert zone.schedule is not schedule
+    assert zone.schedule == Config(raw=carrier_system.config.raw).zones[0].schedule
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "websocket_message_str", ["messages/heartbeat_with_no_device_id.json"], indirect=True
@@ -397,3 +438,540 @@ async def test_heartbeat_with_no_device_id_message_handler(
         websocket_message_str: Raw heartbeat websocket message fixture.
     """
     await data_updater.message_handler(websocket_message_str)
+
+
+def status_rh_message(serial: str, humidity: int) -> str:
+    """Build a zone humidity status message for a serial.
+
+    Args:
+        serial: Carrier system serial number.
+        humidity: Relative humidity to report for zone 1.
+
+    Returns:
+        Raw websocket message text.
+    """
+    return json.dumps(
+        {
+            "messageType": "InfinityStatus",
+            "deviceId": serial,
+            "zones": [{"id": "1", "rh": humidity}],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_systems_index_follows_reassignment_and_in_place_changes(
+    systems: list[System],
+    system_response: dict[str, Any],
+) -> None:
+    """Keep the serial index in sync when the system list changes.
+
+    Args:
+        systems: Carrier systems built from fixture responses.
+        system_response: Parsed GraphQL system fixture.
+    """
+    data_updater = WebsocketDataUpdater([])
+    with pytest.raises(ValueError, match="SERIALXXX"):
+        data_updater.carrier_system("SERIALXXX")
+
+    data_updater.systems = systems
+    assert data_updater.carrier_system("SERIALXXX") is systems[0]
+
+    template = system_response["infinitySystems"][0]
+    added = System(
+        profile=Profile(raw={**template["profile"], "serial": "SERIALYYY"}),
+        status=Status(raw=template["status"]),
+        config=Config(raw=template["config"]),
+        energy=Energy(raw={}),
+    )
+    systems.append(added)
+
+    assert data_updater.carrier_system("SERIALYYY") is added
+
+
+@pytest.mark.asyncio
+async def test_zone_index_follows_replaced_models(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+    system_response: dict[str, Any],
+) -> None:
+    """Apply zone updates to the current raw payload after a model is replaced.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+        system_response: Parsed GraphQL system fixture.
+    """
+    await data_updater.message_handler(status_rh_message("SERIALXXX", 40))
+    stale_raw = carrier_system.status.raw
+    carrier_system.status = Status(raw=json.loads(json.dumps(stale_raw)))
+
+    await data_updater.message_handler(status_rh_message("SERIALXXX", 41))
+
+    assert carrier_system.status.zones[0].humidity == 41
+    assert stale_raw["zones"][0]["rh"] == 40
+    assert system_response["infinitySystems"][0]["status"]["zones"][0]["rh"] == 40
+
+
+@pytest.mark.asyncio
+async def test_config_activity_updates_use_indexed_activity(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+) -> None:
+    """Merge a config activity update into the indexed raw activity.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+    """
+    activity = carrier_system.config.raw["zones"][0]["activities"][0]
+    message: dict[str, Any] = {
+        "messageType": "InfinityConfig",
+        "deviceId": "SERIALXXX",
+        "zones": [{"id": 1, "activities": [{"id": int(activity["id"]), "fan": "high"}]}],
+    }
+
+    await data_updater.message_handler(json.dumps(message))
+
+    assert activity["fan"] == "high"
+    assert carrier_system.config.zones[0].activities[0].fan == FanModes.HIGH
+
+    message["zones"][0]["activities"][0]["id"] = 999
+    with pytest.raises(ValueError, match="id: 999 not found in collection"):
+        await data_updater.message_handler(json.dumps(message))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("websocket_message_str", ["messages/status_idu_cfm.json"], indirect=True)
+async def test_status_message_patches_models_in_place(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+    websocket_message_str: str,
+) -> None:
+    """Patch status models in place and report the changed attributes.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+        websocket_message_str: Raw IDU CFM websocket message fixture.
+    """
+    status = carrier_system.status
+    zone = status.zones[0]
+    indoor_unit = status.indoor_unit
+    previous_time_stamp = status.time_stamp
+    assert previous_time_stamp is not None
+
+    changes = data_updater.apply_message(websocket_message_str)
+
+    assert carrier_system.status is status
+    assert status.zones[0] is zone
+    assert status.indoor_unit is indoor_unit
+    assert status.time_stamp is not None
+    assert status.time_stamp > previous_time_stamp
+    assert FieldChange("SERIALXXX", "status", None, "airflow_cfm", 1239, 525) in changes
+    assert FieldChange("SERIALXXX", "status", None, "indoor_unit.airflow_cfm", 1239, 525) in changes
+    assert all(change.zone_id is None for change in changes)
+
+    humidity = zone.humidity
+    assert data_updater.apply_message(status_rh_message("SERIALXXX", humidity + 1)) == [
+        FieldChange("SERIALXXX", "status", "1", "humidity", humidity, humidity + 1)
+    ]
+    assert data_updater.apply_message(status_rh_message("SERIALXXX", humidity + 1)) == []
+    assert status.zones[0] is zone
+
+
+@pytest.mark.asyncio
+async def test_config_message_patches_models_in_place(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+) -> None:
+    """Patch config zones in place and spread vacation changes to every zone.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+    """
+    config = carrier_system.config
+    zone = config.zones[0]
+    home = zone.find_activity(ActivityTypes.HOME)
+    assert home is not None
+    activity_id = int(config.raw["zones"][0]["activities"][0]["id"])
+    message = {
+        "messageType": "InfinityConfig",
+        "deviceId": "SERIALXXX",
+        "zones": [{"id": 1, "activities": [{"id": activity_id, "fan": "high"}]}],
+    }
+
+    changes = data_updater.apply_message(json.dumps(message))
+
+    assert carrier_system.config is config
+    assert config.zones[0] is zone
+    assert zone.activities[0].fan == FanModes.HIGH
+    assert [(change.zone_id, change.field, change.new) for change in changes] == [
+        ("1", f"activities.{zone.activities[0].type.value}.fan", FanModes.HIGH)
+    ]
+
+    vacation_fan = "low" if config.raw["vacfan"] != "low" else "med"
+    changes = data_updater.apply_message(
+        json.dumps(
+            {"messageType": "InfinityConfig", "deviceId": "SERIALXXX", "vacfan": vacation_fan}
+        )
+    )
+
+    assert config.zones[0] is zone
+    assert {change.zone_id for change in changes} == {zone.api_id for zone in config.zones}
+    assert {change.field for change in changes} == {"activities.vacation.fan"}
+    assert home is zone.find_activity(ActivityTypes.HOME)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("websocket_message_str", ["messages/status_idu_cfm.json"], indirect=True)
+async def test_lazy_models_decode_only_the_fields_a_message_touches(
+    data_updater: WebsocketDataUpdater,
+    system_response: dict[str, Any],
+    energy_response: dict[str, Any],
+    websocket_message_str: str,
+) -> None:
+    """Report the same changes as eager models while leaving other fields undecoded.
+
+    Args:
+        data_updater: Websocket updater for eager fixture systems.
+        system_response: The parsed systems response fixture.
+        energy_response: The parsed energy response fixture.
+        websocket_message_str: Raw IDU CFM websocket message fixture.
+    """
+    raw_system = json.loads(json.dumps(system_response["infinitySystems"][0]))
+    status = Status(raw=raw_system["status"], lazy=True)
+    config = Config(raw=raw_system["config"], lazy=True)
+    lazy_updater = WebsocketDataUpdater(
+        [
+            System(
+                profile=Profile(raw=raw_system["profile"]),
+                status=status,
+                config=config,
+                energy=Energy(raw=energy_response["infinityEnergy"]),
+            )
+        ]
+    )
+    vacation_fan = "low" if config.raw["vacfan"] != "low" else "med"
+    messages = [
+        websocket_message_str,
+        status_rh_message("SERIALXXX", 99),
+        json.dumps(
+            {"messageType": "InfinityConfig", "deviceId": "SERIALXXX", "vacfan": vacation_fan}
+        ),
+    ]
+    assert status.loaded_fields() == []
+    assert config.loaded_fields() == []
+
+    for message in messages:
+        assert lazy_updater.apply_message(message) == data_updater.apply_message(message)
+
+    assert status.loaded_fields() == [
+        "indoor_unit",
+        "airflow_cfm",
+        "blower_rpm",
+        "static_pressure",
+        "indoor_unit_operational_status",
+        "time_stamp",
+        "zones",
+    ]
+    assert status.zones[0].loaded_fields() == ["api_id", "humidity"]
+    assert config.loaded_fields() == ["zones"]
+    eager_status = data_updater.systems[0].status
+    assert status.as_dict() | {"time_stamp": None} == eager_status.as_dict() | {"time_stamp": None}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("websocket_message_str", ["messages/status_idu_cfm.json"], indirect=True)
+async def test_subscriptions_receive_matching_changes(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+    websocket_message_str: str,
+) -> None:
+    """Deliver only the changes that match each subscription's filters.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+        websocket_message_str: Raw IDU CFM websocket message fixture.
+    """
+    received: dict[str, list[list[FieldChange]]] = {"unit": [], "zone": [], "other": []}
+
+    def collector(name: str) -> Callable[[list[FieldChange]], Awaitable[None]]:
+        async def collect(changes: list[FieldChange]) -> None:
+            received[name].append(changes)
+
+        return collect
+
+    data_updater.subscribe(collector("unit"), serial="SERIALXXX", field="indoor_unit")
+    zone_subscription = data_updater.subscribe(collector("zone"), zone_id="1", field="humidity")
+    data_updater.subscribe(collector("other"), serial="SERIALYYY")
+    humidity = carrier_system.status.zones[0].humidity
+
+    await data_updater.message_handler(websocket_message_str)
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 1))
+    data_updater.unsubscribe(zone_subscription)
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 2))
+
+    assert received["unit"] == [
+        [FieldChange("SERIALXXX", "status", None, "indoor_unit.airflow_cfm", 1239, 525)]
+    ]
+    assert received["zone"] == [
+        [FieldChange("SERIALXXX", "status", "1", "humidity", humidity, humidity + 1)]
+    ]
+    assert received["other"] == []
+    with pytest.raises(ValueError, match=r"not in list"):
+        data_updater.unsubscribe(zone_subscription)
+
+
+@pytest.mark.asyncio
+async def test_status_coalescing_applies_bursts_once(systems: list[System]) -> None:
+    """Merge a burst of status deltas for a serial and publish them once.
+
+    Args:
+        systems: Carrier systems built from fixture responses.
+    """
+    data_updater = WebsocketDataUpdater(systems, status_coalesce_seconds=0.01)
+    status = systems[0].status
+    humidity = status.zones[0].humidity
+    published: list[list[FieldChange]] = []
+
+    async def collect(changes: list[FieldChange]) -> None:
+        published.append(changes)
+
+    data_updater.subscribe(collect)
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 1))
+    await data_updater.message_handler(
+        json.dumps({"messageType": "InfinityStatus", "deviceId": "SERIALXXX", "idu": {"cfm": 525}})
+    )
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 2))
+
+    assert status.zones[0].humidity == humidity
+    assert published == []
+
+    await sleep(0.05)
+
+    assert status.zones[0].humidity == humidity + 2
+    assert status.airflow_cfm == 525
+    assert len(published) == 1
+    assert (
+        FieldChange("SERIALXXX", "status", "1", "humidity", humidity, humidity + 2)
+        in (published[0])
+    )
+
+
+@pytest.mark.asyncio
+async def test_status_coalescing_replaces_repeated_lists(systems: list[System]) -> None:
+    """Keep the latest copy of a list that several coalesced deltas repeat.
+
+    Args:
+        systems: Carrier systems built from fixture responses.
+    """
+    data_updater = WebsocketDataUpdater(systems, status_coalesce_seconds=10)
+    status = systems[0].status
+
+    for alerts in (["filter"], ["filter", "humidifier"]):
+        await data_updater.message_handler(
+            json.dumps(
+                {
+                    "messageType": "InfinityStatus",
+                    "deviceId": "SERIALXXX",
+                    "alerts": alerts,
+                    "zones": [{"id": "1", "alerts": alerts}],
+                }
+            )
+        )
+    await data_updater.flush()
+
+    assert status.raw["alerts"] == ["filter", "humidifier"]
+    assert status.raw["zones"][0]["alerts"] == ["filter", "humidifier"]
+
+
+@pytest.mark.asyncio
+async def test_status_coalescing_honours_max_delay_and_flush(systems: list[System]) -> None:
+    """Bound how long deltas wait and apply them on demand.
+
+    Args:
+        systems: Carrier systems built from fixture responses.
+    """
+    data_updater = WebsocketDataUpdater(
+        systems, status_coalesce_seconds=10, status_coalesce_max_delay_seconds=0.01
+    )
+    status = systems[0].status
+    humidity = status.zones[0].humidity
+
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 1))
+    await sleep(0.05)
+    assert status.zones[0].humidity == humidity + 1
+
+    data_updater.status_coalesce_max_delay_seconds = 10
+    await data_updater.message_handler(status_rh_message("SERIALXXX", humidity + 2))
+    await data_updater.message_handler(
+        json.dumps({"messageType": "InfinityConfig", "deviceId": "SERIALXXX", "mode": "cool"})
+    )
+    assert systems[0].config.mode == "cool"
+    assert status.zones[0].humidity == humidity + 1
+
+    await data_updater.flush()
+    assert status.zones[0].humidity == humidity + 2
+
+
+class ResyncConnection(ApiConnectionGraphql):
+    """Connection double that serves fresh status and config payloads."""
+
+    def __init__(
+        self,
+        status_raw: dict[str, Any],
+        config_raw: dict[str, Any],
+        failing_serials: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize the payloads and request log.
+
+        Args:
+            status_raw: Status payload returned for every serial.
+            config_raw: Config payload returned for every serial.
+            failing_serials: Serials whose status query fails.
+        """
+        self.api_websocket: ApiWebsocket | None = None
+        self.status_raw = status_raw
+        self.config_raw = config_raw
+        self.failing_serials = failing_serials
+        self.requests: list[tuple[str, str]] = []
+
+    async def refresh_status(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> Status:
+        """Return a status model built from a copy of the fresh payload.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            A fresh status model.
+
+        Raises:
+            CarrierApiConnectionError: For a failing serial.
+        """
+        self.requests.append(("status", system_serial))
+        if system_serial in self.failing_serials:
+            raise CarrierApiConnectionError(f"status query failed for {system_serial}")
+        return Status(raw=json.loads(json.dumps(self.status_raw)))
+
+    async def refresh_config(
+        self, system_serial: str, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> Config:
+        """Return a config model built from a copy of the fresh payload.
+
+        Args:
+            system_serial: Serial number of the Carrier system to query.
+            query_profile: Field-selection profile for the query.
+
+        Returns:
+            A fresh config model.
+        """
+        self.requests.append(("config", system_serial))
+        return Config(raw=json.loads(json.dumps(self.config_raw)))
+
+
+@pytest.mark.asyncio
+async def test_resync_patches_models_and_publishes_changes(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+) -> None:
+    """Patch models from fresh per-serial payloads and publish the differences.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+    """
+    status = carrier_system.status
+    zone = status.zones[0]
+    humidity = zone.humidity
+    status_raw = json.loads(json.dumps(status.raw))
+    status_raw["zones"][0]["rh"] = humidity + 5
+    config_raw = json.loads(json.dumps(carrier_system.config.raw))
+    config_raw["zones"][0]["name"] = "Den"
+    connection = ResyncConnection(status_raw, config_raw)
+    published: list[list[FieldChange]] = []
+
+    async def collect(changes: list[FieldChange]) -> None:
+        published.append(changes)
+
+    data_updater.subscribe(collect)
+
+    changes = await data_updater.resync(connection)
+
+    assert connection.requests == [("status", "SERIALXXX")]
+    assert carrier_system.status is status
+    assert status.zones[0] is zone
+    assert changes == [FieldChange("SERIALXXX", "status", "1", "humidity", humidity, humidity + 5)]
+    assert published == [changes]
+
+    config_zone = carrier_system.config.zones[0]
+    zone_name = config_zone.name
+    changes = await data_updater.resync(connection, ["SERIALXXX"], config=True)
+
+    assert changes == [FieldChange("SERIALXXX", "config", "1", "name", zone_name, "Den")]
+    assert carrier_system.config.zones[0] is config_zone
+    assert config_zone.name == "Den"
+
+
+@pytest.mark.asyncio
+async def test_resync_on_reconnect_skips_first_connection(
+    data_updater: WebsocketDataUpdater,
+    carrier_system: System,
+) -> None:
+    """Resync after reconnects but not after the initial connection.
+
+    Args:
+        data_updater: Websocket updater under test.
+        carrier_system: Prepared system model that receives the update.
+    """
+    connection = ResyncConnection(carrier_system.status.raw, carrier_system.config.raw)
+    api_websocket = ApiWebsocket(connection)
+    callback = data_updater.resync_on_reconnect(api_websocket)
+
+    await api_websocket.set_connection_state(ConnectionStates.CONNECTED)
+    assert connection.requests == []
+
+    await api_websocket.set_connection_state(ConnectionStates.RECONNECTING)
+    await api_websocket.set_connection_state(ConnectionStates.CONNECTED)
+    assert connection.requests == []
+    assert data_updater._resync_task is not None
+    await data_updater._resync_task
+    assert connection.requests == [("status", "SERIALXXX")]
+    assert api_websocket.state_callbacks == [callback]
+
+
+@pytest.mark.asyncio
+async def test_resync_isolates_failing_serials(
+    systems: list[System],
+    system_response: dict[str, Any],
+    energy_response: dict[str, Any],
+) -> None:
+    """Patch the serials that resynced even when another serial's query fails.
+
+    Args:
+        systems: Carrier systems built from fixture responses.
+        system_response: Parsed systems fixture.
+        energy_response: Parsed energy fixture.
+    """
+    system_json = json.loads(json.dumps(system_response["infinitySystems"][0]))
+    system_json["profile"]["serial"] = "FAILING"
+    failing_system = System(
+        profile=Profile(raw=system_json["profile"]),
+        status=Status(raw=system_json["status"]),
+        config=Config(raw=system_json["config"]),
+        energy=Energy(raw=energy_response["infinityEnergy"]),
+    )
+    data_updater = WebsocketDataUpdater([*systems, failing_system])
+    status_raw = json.loads(json.dumps(systems[0].status.raw))
+    status_raw["zones"][0]["rh"] = systems[0].status.zones[0].humidity + 5
+    connection = ResyncConnection(status_raw, systems[0].config.raw, frozenset({"FAILING"}))
+
+    changes = await data_updater.resync(connection)
+
+    assert [(change.serial, change.field) for change in changes] == [("SERIALXXX", "humidity")]
+    assert failing_system.status.raw is system_json["status"]
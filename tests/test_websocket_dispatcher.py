@@ -0,0 +1,238 @@
+"""Tests for queued websocket callback delivery."""
+
+from asyncio import Event, create_task, sleep
+import json
+
+import pytest
+
+from carrier_api import CallbackDispatcher, OverflowPolicies
+from carrier_api.websocket_dispatcher import AsyncCallback
+
+
+def message(serial: str, sequence: int, message_type: str = "InfinityStatus") -> str:
+    """Build a websocket message for a serial.
+
+    Args:
+        serial: Carrier system serial number.
+        sequence: Value that identifies the message in assertions.
+        message_type: Carrier websocket message type.
+
+    Returns:
+        Raw websocket message text.
+    """
+    return json.dumps({"messageType": message_type, "deviceId": serial, "seq": sequence})
+
+
+class BlockingCallback:
+    """Callback that records messages and waits until released."""
+
+    def __init__(self) -> None:
+        """Initialize captured state and the release gate."""
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.release = Event()
+
+    async def __call__(self, text: str) -> None:
+        """Record a message and wait for release.
+
+        Args:
+            text: Raw websocket message text.
+        """
+        self.started.append(text)
+        await self.release.wait()
+        self.finished.append(text)
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_does_not_block_dispatch_or_other_callbacks() -> None:
+    """Queue messages for a blocked callback while another callback keeps up."""
+    dispatcher = CallbackDispatcher(max_queue_size=10)
+    slow = BlockingCallback()
+    received: list[str] = []
+
+    async def fast(text: str) -> None:
+        """Capture a message.
+
+        Args:
+            text: Raw websocket message text.
+        """
+        received.append(text)
+
+    callbacks: list[AsyncCallback] = [slow, fast]
+    for sequence in range(3):
+        await dispatcher.dispatch(message("A", sequence), callbacks)
+    await sleep(0)
+
+    assert received == [message("A", sequence) for sequence in range(3)]
+    assert slow.started == [message("A", 0)]
+
+    slow.release.set()
+    await dispatcher.join()
+    assert slow.finished == [message("A", sequence) for sequence in range(3)]
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_messages_are_ordered_per_serial_and_concurrent_across_serials() -> None:
+    """Run different serials concurrently but one serial at a time."""
+    dispatcher = CallbackDispatcher(max_queue_size=10, concurrency=2)
+    callback = BlockingCallback()
+
+    for text in (message("A", 1), message("A", 2), message("B", 1)):
+        await dispatcher.dispatch(text, [callback])
+    await sleep(0)
+
+    assert callback.started == [message("A", 1), message("B", 1)]
+
+    callback.release.set()
+    await dispatcher.join()
+    assert callback.finished.index(message("A", 1)) < callback.finished.index(message("A", 2))
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy_discards_queued_messages() -> None:
+    """Discard the oldest waiting message instead of blocking the reader."""
+    dispatcher = CallbackDispatcher(max_queue_size=1, overflow_policy=OverflowPolicies.DROP_OLDEST)
+    callback = BlockingCallback()
+
+    await dispatcher.dispatch(message("A", 0), [callback])
+    await sleep(0)
+    for sequence in (1, 2, 3):
+        await dispatcher.dispatch(message("A", sequence), [callback])
+
+    callback.release.set()
+    await dispatcher.join()
+    assert callback.finished == [message("A", 0), message("A", 3)]
+    assert dispatcher.dropped == 2
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_same_serial_and_type() -> None:
+    """Merge overflowing messages into the queued message of the same serial."""
+    dispatcher = CallbackDispatcher(max_queue_size=1, overflow_policy=OverflowPolicies.COALESCE)
+    callback = BlockingCallback()
+
+    await dispatcher.dispatch(message("A", 0), [callback])
+    await sleep(0)
+    await dispatcher.dispatch(message("A", 1), [callback])
+    await dispatcher.dispatch(
+        json.dumps({"messageType": "InfinityStatus", "deviceId": "A", "rh": 40}), [callback]
+    )
+    blocked = create_task(dispatcher.dispatch(message("A", 2, "InfinityConfig"), [callback]))
+    await sleep(0)
+
+    assert not blocked.done()
+    callback.release.set()
+    await blocked
+    await dispatcher.join()
+    assert [json.loads(text) for text in callback.finished] == [
+        json.loads(message("A", 0)),
+        {"messageType": "InfinityStatus", "deviceId": "A", "seq": 1, "rh": 40},
+        json.loads(message("A", 2, "InfinityConfig")),
+    ]
+    assert dispatcher.coalesced == 1
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_zone_deltas_by_id() -> None:
+    """Merge zone and activity deltas by id and let later plain lists replace earlier ones."""
+    dispatcher = CallbackDispatcher(max_queue_size=1, overflow_policy=OverflowPolicies.COALESCE)
+    callback = BlockingCallback()
+
+    def config_delta(zones: list[dict[str, object]], **fields: object) -> str:
+        return json.dumps(
+            {"messageType": "InfinityConfig", "deviceId": "A", "zones": zones, **fields}
+        )
+
+    await dispatcher.dispatch(message("A", 0), [callback])
+    await sleep(0)
+    await dispatcher.dispatch(
+        config_delta(
+            [{"id": "1", "rt": 70, "activities": [{"id": "1", "htsp": "68", "clsp": "74"}]}],
+            tags=["a", "b"],
+        ),
+        [callback],
+    )
+    await dispatcher.dispatch(
+        config_delta(
+            [
+                {"id": "1", "rt": 71, "activities": [{"id": "1", "htsp": "69"}]},
+                {"id": "2", "rt": 65},
+            ],
+            tags=["c"],
+        ),
+        [callback],
+    )
+    callback.release.set()
+    await dispatcher.join()
+
+    assert json.loads(callback.finished[1]) == {
+        "messageType": "InfinityConfig",
+        "deviceId": "A",
+        "zones": [
+            {"id": "1", "rt": 71, "activities": [{"id": "1", "htsp": "69", "clsp": "74"}]},
+            {"id": "2", "rt": 65},
+        ],
+        "tags": ["c"],
+    }
+    assert dispatcher.coalesced == 1
+    await dispatcher.close()
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_room_and_callback_errors_are_logged(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Make dispatch wait when full and keep delivering after a callback error.
+
+    Args:
+        caplog: Pytest log capture fixture.
+    """
+    dispatcher = CallbackDispatcher(max_queue_size=1)
+    callback = BlockingCallback()
+    failures = 0
+
+    async def failing(_text: str) -> None:
+        """Fail for every message.
+
+        Args:
+            _text: Raw websocket message text.
+
+        Raises:
+            RuntimeError: Always.
+        """
+        nonlocal failures
+        failures += 1
+        raise RuntimeError("callback failed")
+
+    await dispatcher.dispatch(message("A", 0), [callback, failing])
+    await dispatcher.dispatch(message("A", 1), [callback, failing])
+    blocked = create_task(dispatcher.dispatch(message("A", 2), [callback, failing]))
+    await sleep(0)
+
+    assert not blocked.done()
+    callback.release.set()
+    await blocked
+    await dispatcher.join()
+    assert len(callback.finished) == 3
+    assert failures == 3
+    assert "ws: callback failed" in caplog.text
+    await dispatcher.close()
+
+
+@pytest.mark.parametrize(
+    ("max_queue_size", "concurrency"),
+    [(0, 1), (1, 0)],
+)
+def test_dispatcher_rejects_empty_queues_and_workers(max_queue_size: int, concurrency: int) -> None:
+    """Reject dispatcher settings that could never deliver a message.
+
+    Args:
+        max_queue_size: Queue size to configure.
+        concurrency: Worker count to configure.
+    """
+    with pytest.raises(ValueError, match="must be at least 1"):
+        CallbackDispatcher(max_queue_size=max_queue_size, concurrency=concurrency)
@@ -12,7 +12,7 @@ import pytest
 
 from carrier_api import ApiConnectionGraphql, ApiWebsocket, WebsocketDataUpdater
 from carrier_api.api_websocket import AsyncCallback
-from carrier_api.const import ActivityTypes, FanModes
+from carrier_api.const import ActivityTypes, FanModes, QueryProfiles
 from carrier_api.system import System
 
 FIXTURE_ROOT = Path(__file__).parent
@@ -36,9 +36,14 @@ class FixtureLoadConnection(ApiConnectionGraphql):
         self.energy_response = energy_response
         self.energy_serials: list[str] = []
 
-    async def get_systems(self) -> dict[str, Any]:
+    async def get_systems(
+        self, query_profile: QueryProfiles = QueryProfiles.FULL
+    ) -> dict[str, Any]:
         """Return fixture-backed systems data.
 
+        Args:
+            query_profile: Field-selection profile requested by ``load_data``.
+
         Returns:
             Stored systems response fixture.
         """
@@ -159,11 +164,14 @@ class FakeWorkflowSession:
         self.websocket = websocket
         self.connected_url: str | None = None
 
-    def ws_connect(self, url: str) -> FakeWorkflowWebsocketContext:
+    def ws_connect(
+        self, url: str, receive_timeout: float | None = None
+    ) -> FakeWorkflowWebsocketContext:
         """Capture the websocket URL and return a fake context.
 
         Args:
             url: Websocket URL.
+            receive_timeout: Receive idle timeout requested by the listener.
 
         Returns:
             Fake websocket context.
@@ -206,6 +214,7 @@ class WorkflowApiWebsocket(ApiWebsocket):
         self.websocket: ClientWebSocketResponse | None = None
         self.running: bool | None = None
         self.async_callbacks: list[AsyncCallback] = []
+        self.state_callbacks = []
         self.task_heartbeat = None
         self.task_listener = None
         self.api_connection_graphql = workflow_connection